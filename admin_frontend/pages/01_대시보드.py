@@ -3,7 +3,7 @@
 import html
 
 import streamlit as st
-from utils.api import get_all_members, MemberStatus
+from utils.api import get_member_stats, get_members_page, MemberStatus
 from utils.css import load_css
 
 st.set_page_config(
@@ -56,10 +56,12 @@ st.markdown("""
 
 # Load data
 try:
-    all_members = get_all_members()
-    pending_members = [m for m in all_members if m.get("status") == MemberStatus.PENDING]
-    approved_members = [m for m in all_members if m.get("status") == MemberStatus.APPROVED]
-    unverified_members = [m for m in all_members if m.get("status") == MemberStatus.UNVERIFIED]
+    stats = get_member_stats()
+    total_count = stats["total"]
+    pending_count = stats["by_status"].get(MemberStatus.PENDING, 0)
+    approved_count = stats["by_status"].get(MemberStatus.APPROVED, 0)
+    unverified_count = stats["by_status"].get(MemberStatus.UNVERIFIED, 0)
+    recent_members = get_members_page(limit=5, order="desc")["items"]
 except Exception as e:
     st.error(f">> ERROR: Failed to load data - {str(e)}")
     st.stop()
@@ -71,17 +73,17 @@ with col1:
     st.markdown(f"""
     <div class="metric-card">
         <div class="metric-label">Total Members</div>
-        <div class="metric-value">{len(all_members)}</div>
+        <div class="metric-value">{total_count}</div>
     </div>
     """, unsafe_allow_html=True)
 
 with col2:
-    alert_class = "alert" if pending_members else ""
+    alert_class = "alert" if pending_count else ""
     st.markdown(f"""
     <div class="metric-card">
         <div class="metric-label">Pending Approval</div>
-        <div class="metric-value">{len(pending_members)}</div>
-        <div class="metric-delta {alert_class}">{'>> ACTION REQUIRED' if pending_members else ''}</div>
+        <div class="metric-value">{pending_count}</div>
+        <div class="metric-delta {alert_class}">{'>> ACTION REQUIRED' if pending_count else ''}</div>
     </div>
     """, unsafe_allow_html=True)
 
@@ -89,7 +91,7 @@ with col3:
     st.markdown(f"""
     <div class="metric-card">
         <div class="metric-label">Approved</div>
-        <div class="metric-value">{len(approved_members)}</div>
+        <div class="metric-value">{approved_count}</div>
     </div>
     """, unsafe_allow_html=True)
 
@@ -97,7 +99,7 @@ with col4:
     st.markdown(f"""
     <div class="metric-card">
         <div class="metric-label">Unverified</div>
-        <div class="metric-value">{len(unverified_members)}</div>
+        <div class="metric-value">{unverified_count}</div>
     </div>
     """, unsafe_allow_html=True)
 
@@ -116,15 +118,15 @@ with col1:
     st.markdown(f"""
     <div style="padding: 0.75rem 0; border-bottom: 1px solid var(--border-primary);">
         <div style="font-family: var(--font-mono); color: var(--accent-yellow);">PENDING</div>
-        <div style="font-family: var(--font-mono); font-size: 1.5rem; font-weight: 700; margin-top: 0.25rem;">{len(pending_members)}</div>
+        <div style="font-family: var(--font-mono); font-size: 1.5rem; font-weight: 700; margin-top: 0.25rem;">{pending_count}</div>
     </div>
     <div style="padding: 0.75rem 0; border-bottom: 1px solid var(--border-primary);">
         <div style="font-family: var(--font-mono); color: var(--accent-green);">APPROVED</div>
-        <div style="font-family: var(--font-mono); font-size: 1.5rem; font-weight: 700; margin-top: 0.25rem;">{len(approved_members)}</div>
+        <div style="font-family: var(--font-mono); font-size: 1.5rem; font-weight: 700; margin-top: 0.25rem;">{approved_count}</div>
     </div>
     <div style="padding: 0.75rem 0;">
         <div style="font-family: var(--font-mono); color: var(--accent-blue);">UNVERIFIED</div>
-        <div style="font-family: var(--font-mono); font-size: 1.5rem; font-weight: 700; margin-top: 0.25rem;">{len(unverified_members)}</div>
+        <div style="font-family: var(--font-mono); font-size: 1.5rem; font-weight: 700; margin-top: 0.25rem;">{unverified_count}</div>
     </div>
     </div>
     """, unsafe_allow_html=True)
@@ -136,9 +138,7 @@ with col2:
         <div class="section-header">▸ RECENT SIGNUPS</div>
     """, unsafe_allow_html=True)
 
-    if all_members:
-        recent_members = sorted(all_members, key=lambda x: x.get("created_at", ""), reverse=True)[:5]
-
+    if recent_members:
         status_class_map = {
             MemberStatus.UNVERIFIED: "unverified",
             MemberStatus.PENDING: "pending",
@@ -171,11 +171,11 @@ with col2:
 st.markdown("<br>", unsafe_allow_html=True)
 
 # Pending Members Alert
-if pending_members:
+if pending_count:
     st.markdown(f"""
     <div class="alert-section">
         <div class="alert-title">⚠ PENDING APPROVALS</div>
-        <div class="alert-message">{len(pending_members)} member(s) awaiting approval. Process them now.</div>
+        <div class="alert-message">{pending_count} member(s) awaiting approval. Process them now.</div>
     """, unsafe_allow_html=True)
 
     if st.button("GO TO PENDING PAGE", use_container_width=True, type="primary"):
@@ -3,7 +3,7 @@
 import html
 
 import streamlit as st
-from utils.api import get_all_members, approve_member, reject_member
+from utils.api import get_all_members, approve_member, approve_members, reject_member, reject_members
 from utils.css import load_css
 
 st.set_page_config(
@@ -74,6 +74,34 @@ st.markdown(f"""
 <div class="page-count">>> {len(all_members)} MEMBER(S) AWAITING APPROVAL</div>
 """, unsafe_allow_html=True)
 
+# Bulk actions: one request (one transaction) for every checked member
+selected_ids = [
+    member["id"] for member in all_members if st.session_state.get(f"select_{member['id']}", False)
+]
+bulk_col1, bulk_col2, bulk_col3 = st.columns([2, 1, 1])
+with bulk_col1:
+    if st.checkbox("SELECT ALL", key="select_all"):
+        for member in all_members:
+            st.session_state[f"select_{member['id']}"] = True
+        selected_ids = [member["id"] for member in all_members]
+    st.caption(f"{len(selected_ids)} selected")
+with bulk_col2:
+    if st.button("✓ APPROVE SELECTED", use_container_width=True, disabled=not selected_ids):
+        try:
+            result = approve_members(selected_ids)
+            st.success(f">> SUCCESS: {result['succeeded']}/{len(selected_ids)} approved")
+            st.rerun()
+        except Exception as e:
+            st.error(f">> ERROR: Bulk approval failed - {e}")
+with bulk_col3:
+    if st.button("✗ REJECT SELECTED", use_container_width=True, disabled=not selected_ids):
+        try:
+            result = reject_members(selected_ids)
+            st.success(f">> SUCCESS: {result['succeeded']}/{len(selected_ids)} rejected")
+            st.rerun()
+        except Exception as e:
+            st.error(f">> ERROR: Bulk rejection failed - {e}")
+
 st.markdown("<br>", unsafe_allow_html=True)
 
 # Display each pending member
@@ -98,6 +126,8 @@ for i, member in enumerate(all_members):
     </div>
     """, unsafe_allow_html=True)
 
+    st.checkbox(f"Select {name}", key=f"select_{member_id}", label_visibility="collapsed")
+
     with st.expander("", expanded=(i == 0)):
         st.markdown(f"""
         <div class="pending-body">
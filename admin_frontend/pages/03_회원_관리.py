@@ -3,7 +3,7 @@
 import html
 
 import streamlit as st
-from utils.api import get_all_members, delete_member
+from utils.api import get_all_members, delete_member, search_members
 from utils.css import load_css
 
 st.set_page_config(
@@ -78,7 +78,7 @@ with col1:
 with col2:
     search_query = st.text_input(
         "SEARCH",
-        placeholder="Search by name or email...",
+        placeholder="Search by name, email or skill...",
         label_visibility="collapsed",
     )
 
@@ -91,23 +91,17 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Load data
+# Load data (search runs server-side)
 try:
-    params = None if status_filter == "ALL" else {"status": status_filter}
-    all_members = get_all_members(status=params.get("status") if params else None)
+    status_param = None if status_filter == "ALL" else status_filter
+    if search_query.strip():
+        all_members = search_members(search_query.strip(), status=status_param)
+    else:
+        all_members = get_all_members(status=status_param)
 except Exception as e:
     st.error(f">> ERROR: Failed to load data - {str(e)}")
     st.stop()
 
-# Apply search filter
-if search_query:
-    query = search_query.lower()
-    all_members = [
-        m
-        for m in all_members
-        if query in m.get("name", "").lower() or query in m.get("email", "").lower()
-    ]
-
 if not all_members:
     st.markdown("""
     <div class="empty-state">
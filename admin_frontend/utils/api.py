@@ -1,11 +1,14 @@
 """API client for Admin Frontend.
 
 Matches FastAPI endpoints:
-- GET /members?status=xxx -> list[MemberResponse] (X-Admin-Key header required)
+- GET /members?status=xxx&limit=n&cursor=xxx -> MemberPage (X-Admin-Key header required)
+- GET /members/stats -> MemberStats (X-Admin-Key header required)
+- GET /members/search?q=xxx&status=xxx -> MemberSearchPage (X-Admin-Key header required)
 - GET /members/{member_id} -> MemberResponse (X-Admin-Key header required)
 - POST /members/{member_id}/approve -> MemberResponse (X-Admin-Key header required)
 - POST /members/{member_id}/reject -> 204 No Content (X-Admin-Key header required)
 - DELETE /members/{member_id} -> 204 No Content (X-Admin-Key header required)
+- POST /members/batch/approve|reject|delete {"ids": [...]} -> MemberBatchResult (X-Admin-Key header required)
 """
 
 import os
@@ -36,22 +39,34 @@ def _headers() -> dict[str, str]:
     return {"X-Admin-Key": ADMIN_KEY}
 
 
-def get_all_members(status: str | None = None) -> list[dict]:
+def get_members_page(
+    status: str | None = None,
+    limit: int = 200,
+    cursor: str | None = None,
+    order: str = "asc",
+) -> dict:
     """
-    Get all members, optionally filtered by status.
+    Get one page of members, optionally filtered by status.
 
-    GET /members?status=xxx
+    GET /members?status=xxx&limit=n&cursor=xxx&order=asc|desc
 
     Query params:
         status: MemberStatus (UNVERIFIED, PENDING, APPROVED) | None
+        limit: page size (1-200)
+        cursor: next_cursor from the previous page | None
+        order: "asc" | "desc" (by created_at)
 
-    Response: list[MemberResponse]
+    Response: MemberPage
+        items: list[MemberResponse]
+        next_cursor: str | None
 
     Headers: X-Admin-Key
     """
-    params = {}
+    params = {"limit": limit, "order": order}
     if status:
         params["status"] = status
+    if cursor:
+        params["cursor"] = cursor
 
     response = requests.get(
         f"{API_BASE}/members",
@@ -63,6 +78,84 @@ def get_all_members(status: str | None = None) -> list[dict]:
     return response.json()
 
 
+def get_all_members(status: str | None = None) -> list[dict]:
+    """
+    Get all members, optionally filtered by status, following next_cursor.
+
+    Response: list[MemberResponse]
+
+    Headers: X-Admin-Key
+    """
+    members: list[dict] = []
+    cursor = None
+    while True:
+        page = get_members_page(status=status, cursor=cursor)
+        members.extend(page["items"])
+        cursor = page.get("next_cursor")
+        if not cursor:
+            return members
+
+
+def get_member_stats() -> dict:
+    """
+    Get member counts (maintained server-side, no full list transfer).
+
+    GET /members/stats
+
+    Response: MemberStats
+        total: int
+        by_status: {UNVERIFIED: int, PENDING: int, APPROVED: int}
+        by_rank: {rank: int}
+        by_generation: {generation: int}
+
+    Headers: X-Admin-Key
+    """
+    response = requests.get(
+        f"{API_BASE}/members/stats",
+        headers=_headers(),
+        timeout=10,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def search_members(query: str, status: str | None = None, limit: int = 100) -> list[dict]:
+    """
+    Full-text search members by name, email, description or skill.
+
+    GET /members/search?q=xxx&status=xxx&limit=n&offset=n
+
+    Query params:
+        q: search text (prefix match per word)
+        status: MemberStatus (UNVERIFIED, PENDING, APPROVED) | None
+
+    Response: MemberSearchPage
+        items: list[MemberResponse] (best match first)
+        next_offset: int | None
+
+    Headers: X-Admin-Key
+    """
+    members: list[dict] = []
+    offset = 0
+    while True:
+        params = {"q": query, "limit": limit, "offset": offset}
+        if status:
+            params["status"] = status
+
+        response = requests.get(
+            f"{API_BASE}/members/search",
+            headers=_headers(),
+            params=params,
+            timeout=10,
+        )
+        response.raise_for_status()
+        page = response.json()
+        members.extend(page["items"])
+        if page.get("next_offset") is None:
+            return members
+        offset = page["next_offset"]
+
+
 def get_member(member_id: int) -> dict:
     """
     Get member by ID.
@@ -135,3 +228,57 @@ def delete_member(member_id: int) -> None:
         timeout=10,
     )
     response.raise_for_status()
+
+
+def _batch(action: str, member_ids: list[int]) -> dict:
+    response = requests.post(
+        f"{API_BASE}/members/batch/{action}",
+        headers=_headers(),
+        json={"ids": member_ids},
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def approve_members(member_ids: list[int]) -> dict:
+    """
+    Approve many PENDING members in one request (one transaction).
+
+    POST /members/batch/approve
+
+    Request: {"ids": [int, ...]} (1-500)
+
+    Response: MemberBatchResult
+        results: [{id: int, result: "ok" | "not_found" | "wrong_status"}]
+        succeeded: int
+
+    Headers: X-Admin-Key
+    """
+    return _batch("approve", member_ids)
+
+
+def reject_members(member_ids: list[int]) -> dict:
+    """
+    Reject (delete) many PENDING members in one request.
+
+    POST /members/batch/reject
+
+    Response: MemberBatchResult
+
+    Headers: X-Admin-Key
+    """
+    return _batch("reject", member_ids)
+
+
+def delete_members(member_ids: list[int]) -> dict:
+    """
+    Delete many members in one request.
+
+    POST /members/batch/delete
+
+    Response: MemberBatchResult
+
+    Headers: X-Admin-Key
+    """
+    return _batch("delete", member_ids)
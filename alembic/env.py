@@ -13,17 +13,20 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-if config.config_file_name is not None:
+# (skipped when the caller, e.g. the test suite, already configured logging)
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
 # for 'autogenerate' support
-from models import link, member, skill
+from models import email_outbox, idempotency_key, link, member, member_stat, skill, skill_dictionary
 
 target_metadata = Base.metadata
 
-# Set database URL from config
-config.set_main_option("sqlalchemy.url", settings.database_url)
+# Set database URL from config (callers such as tests may pass another one in
+# config.attributes["database_url"]). "%" is configparser interpolation syntax.
+database_url = config.attributes.get("database_url", settings.database_url)
+config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -73,7 +76,7 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         # Enable batch mode for SQLite to support table recreation
         # without PRAGMA foreign_keys issues inside transactions
-        is_sqlite = settings.database_url.startswith("sqlite")
+        is_sqlite = connection.dialect.name == "sqlite"
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
@@ -21,62 +21,27 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Create initial member table.
 
-    Creates the member table with status enum defaulting to 'pending'.
+    Creates the member table with status defaulting to 'pending'.
     This represents the baseline schema for existing databases.
+    Enums are plain VARCHAR columns on every database (see models.member).
     """
-    bind = op.get_bind()
-    dialect = bind.dialect.name
-
-    if dialect == "sqlite":
-        # SQLite approach: ENUMs are stored as VARCHAR
-        op.execute("""
-            CREATE TABLE member (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email VARCHAR(255) NOT NULL UNIQUE,
-                name VARCHAR(100) NOT NULL,
-                generation INTEGER NOT NULL,
-                rank VARCHAR(50) NOT NULL,
-                description TEXT,
-                image_url VARCHAR(500),
-                status VARCHAR(50) NOT NULL DEFAULT 'pending',
-                created_at DATETIME NOT NULL,
-                updated_at DATETIME NOT NULL
-            );
-        """)
-        op.execute("CREATE INDEX ix_member_email ON member (email);")
-    else:
-        # PostgreSQL approach: create ENUM types first
-        op.execute("CREATE TYPE memberstatus AS ENUM ('unverified', 'pending', 'approved')")
-        op.execute("CREATE TYPE memberrank AS ENUM ('정회원', 'OB', '준OB')")
-
-        op.execute("""
-            CREATE TABLE member (
-                id SERIAL PRIMARY KEY,
-                email VARCHAR(255) NOT NULL UNIQUE,
-                name VARCHAR(100) NOT NULL,
-                generation INTEGER NOT NULL,
-                rank memberrank NOT NULL,
-                description TEXT,
-                image_url VARCHAR(500),
-                status memberstatus NOT NULL DEFAULT 'pending',
-                created_at TIMESTAMP NOT NULL,
-                updated_at TIMESTAMP NOT NULL
-            );
-        """)
-        op.execute("CREATE INDEX ix_member_email ON member (email);")
+    op.create_table(
+        "member",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("generation", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.String(50), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("image_url", sa.String(500), nullable=True),
+        sa.Column("status", sa.String(50), nullable=False, server_default="pending"),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_member_email", "member", ["email"], unique=True)
 
 
 def downgrade() -> None:
-    """Drop initial member table.
-
-    Removes the member table and its associated enum types.
-    """
-    op.execute("DROP TABLE member;")
-
-    bind = op.get_bind()
-    dialect = bind.dialect.name
-
-    if dialect != "sqlite":
-        # Only PostgreSQL needs to drop ENUM types
-        op.execute("DROP TYPE memberrank;")
-        op.execute("DROP TYPE memberstatus;")
\ No newline at end of file
+    """Drop initial member table."""
+    op.drop_index("ix_member_email", table_name="member")
+    op.drop_table("member")
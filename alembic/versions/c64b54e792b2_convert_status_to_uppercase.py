@@ -26,43 +26,17 @@ def upgrade() -> None:
     - 'pending' -> 'PENDING'
     - 'approved' -> 'APPROVED'
     """
-    bind = op.get_bind()
-    dialect = bind.dialect.name
-
-    if dialect == "sqlite":
-        # SQLite: use batch_alter_table which properly handles foreign keys
-        # by recreating the table outside of the transaction
-        with op.batch_alter_table('member', recreate='always') as batch_op:
-            # Update data before table recreation
-            batch_op.execute("""
-                UPDATE member
-                SET status = CASE
-                    WHEN LOWER(status) = 'unverified' THEN 'UNVERIFIED'
-                    WHEN LOWER(status) = 'pending' THEN 'PENDING'
-                    WHEN LOWER(status) = 'approved' THEN 'APPROVED'
-                    ELSE UPPER(status)
-                END
-            """)
-
-            # Update the default value
-            batch_op.alter_column(
-                'status',
-                server_default='UNVERIFIED'
-            )
-    else:
-        # PostgreSQL/MySQL: update in place
-        op.execute("""
-            UPDATE member
-            SET status = CASE
-                WHEN LOWER(status) = 'unverified' THEN 'UNVERIFIED'
-                WHEN LOWER(status) = 'pending' THEN 'PENDING'
-                WHEN LOWER(status) = 'approved' THEN 'APPROVED'
-                ELSE UPPER(status)
-            END
-        """)
-
-        # Update default constraint using Alembic's cross-dialect method
-        op.alter_column('member', 'status', server_default='UNVERIFIED')
+    op.execute("""
+        UPDATE member
+        SET status = CASE
+            WHEN LOWER(status) = 'unverified' THEN 'UNVERIFIED'
+            WHEN LOWER(status) = 'pending' THEN 'PENDING'
+            WHEN LOWER(status) = 'approved' THEN 'APPROVED'
+            ELSE UPPER(status)
+        END
+    """)
+    with op.batch_alter_table("member") as batch_op:
+        batch_op.alter_column("status", existing_type=sa.String(50), server_default="UNVERIFIED")
 
 
 def downgrade() -> None:
@@ -73,39 +47,14 @@ def downgrade() -> None:
     - 'PENDING' -> 'pending'
     - 'APPROVED' -> 'approved'
     """
-    bind = op.get_bind()
-    dialect = bind.dialect.name
-
-    if dialect == "sqlite":
-        # SQLite: use batch_alter_table which properly handles foreign keys
-        with op.batch_alter_table('member', recreate='always') as batch_op:
-            # Update data before table recreation
-            batch_op.execute("""
-                UPDATE member
-                SET status = CASE
-                    WHEN UPPER(status) = 'UNVERIFIED' THEN 'unverified'
-                    WHEN UPPER(status) = 'PENDING' THEN 'pending'
-                    WHEN UPPER(status) = 'APPROVED' THEN 'approved'
-                    ELSE LOWER(status)
-                END
-            """)
-
-            # Revert the default value
-            batch_op.alter_column(
-                'status',
-                server_default='unverified'
-            )
-    else:
-        # PostgreSQL/MySQL: update in place
-        op.execute("""
-            UPDATE member
-            SET status = CASE
-                WHEN UPPER(status) = 'UNVERIFIED' THEN 'unverified'
-                WHEN UPPER(status) = 'PENDING' THEN 'pending'
-                WHEN UPPER(status) = 'APPROVED' THEN 'approved'
-                ELSE LOWER(status)
-            END
-        """)
-
-        # Revert the default constraint using Alembic's cross-dialect method
-        op.alter_column('member', 'status', server_default='unverified')
\ No newline at end of file
+    op.execute("""
+        UPDATE member
+        SET status = CASE
+            WHEN UPPER(status) = 'UNVERIFIED' THEN 'unverified'
+            WHEN UPPER(status) = 'PENDING' THEN 'pending'
+            WHEN UPPER(status) = 'APPROVED' THEN 'approved'
+            ELSE LOWER(status)
+        END
+    """)
+    with op.batch_alter_table("member") as batch_op:
+        batch_op.alter_column("status", existing_type=sa.String(50), server_default="unverified")
@@ -0,0 +1,26 @@
+"""Add (created_at, id) index for keyset pagination.
+
+Revision ID: c64b54e792b3
+Revises: c64b54e792b2
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c64b54e792b3'
+down_revision: Union[str, Sequence[str], None] = 'c64b54e792b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the composite index used by GET /members keyset pagination."""
+    op.create_index("ix_member_created_at_id", "member", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination index."""
+    op.drop_index("ix_member_created_at_id", table_name="member")
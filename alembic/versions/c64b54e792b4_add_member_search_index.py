@@ -0,0 +1,70 @@
+"""Add FTS5 member search index.
+
+Revision ID: c64b54e792b4
+Revises: c64b54e792b3
+Create Date: 2026-10-17 00:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c64b54e792b4'
+down_revision: Union[str, Sequence[str], None] = 'c64b54e792b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Inlined (not imported from repositories.member_search_index) so later changes
+# to the app cannot alter what this revision does
+SEARCH_TABLE = "member_search"
+
+CREATE_SEARCH_TABLE = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        name, email, description, skills,
+        tokenize = 'trigram'
+    )
+"""
+
+BACKFILL_SEARCH_TABLE = f"""
+    INSERT INTO {SEARCH_TABLE} (rowid, name, email, description, skills)
+    SELECT m.id, m.name, m.email, COALESCE(m.description, ''),
+           COALESCE((SELECT group_concat(s.skill_name, ' ')
+                     FROM member_skill s WHERE s.member_id = m.id), '')
+    FROM member m
+"""
+
+BACKFILL_SEARCH_TABLE_WITHOUT_SKILLS = f"""
+    INSERT INTO {SEARCH_TABLE} (rowid, name, email, description, skills)
+    SELECT m.id, m.name, m.email, COALESCE(m.description, ''), ''
+    FROM member m
+"""
+
+
+def upgrade() -> None:
+    """Create the FTS5 search table and backfill it from existing members.
+
+    FTS5 is SQLite-only; other databases use the ILIKE fallback in
+    MemberRepository.search_members and need no schema change.
+    """
+    if op.get_context().dialect.name != "sqlite":
+        return
+
+    op.execute(CREATE_SEARCH_TABLE)
+    op.execute(f"DELETE FROM {SEARCH_TABLE};")
+    # member_skill is created by create_all at startup or by c64b54e792b7, so it
+    # may not exist yet on a database built from migrations (no skills to index)
+    if not context.is_offline_mode() and sa.inspect(op.get_bind()).has_table("member_skill"):
+        op.execute(BACKFILL_SEARCH_TABLE)
+    else:
+        op.execute(BACKFILL_SEARCH_TABLE_WITHOUT_SKILLS)
+
+
+def downgrade() -> None:
+    """Drop the FTS5 search table."""
+    if op.get_context().dialect.name != "sqlite":
+        return
+
+    op.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE};")
@@ -0,0 +1,68 @@
+"""Add maintained member counters.
+
+Revision ID: c64b54e792b5
+Revises: c64b54e792b4
+Create Date: 2026-10-17 00:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c64b54e792b5'
+down_revision: Union[str, Sequence[str], None] = 'c64b54e792b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Inlined (not imported from repositories.member_stats / models) so later
+# changes to the app cannot alter what this revision does
+member = sa.table(
+    "member",
+    sa.column("status", sa.String),
+    sa.column("rank", sa.String),
+    sa.column("generation", sa.Integer),
+)
+member_stat = sa.table(
+    "member_stat",
+    sa.column("dimension", sa.String),
+    sa.column("bucket", sa.String),
+    sa.column("count", sa.Integer),
+)
+# member.rank stores the MemberRank name; counters are keyed by its value
+RANK_VALUES = {"REGULAR": "정회원", "OB": "OB", "PROSPECTIVE_OB": "준OB"}
+
+
+def upgrade() -> None:
+    """Create member_stat and fill it from the existing members."""
+    op.create_table(
+        "member_stat",
+        sa.Column("dimension", sa.String(20), primary_key=True),
+        sa.Column("bucket", sa.String(50), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    # Offline (--sql) scripts cannot read the member table: run
+    # ``python manage.py reconcile-stats`` after applying them
+    if context.is_offline_mode():
+        return
+
+    bind = op.get_bind()
+    rows = []
+    for dimension, column in (
+        ("status", member.c.status),
+        ("rank", member.c.rank),
+        ("generation", member.c.generation),
+    ):
+        for value, count in bind.execute(sa.select(column, sa.func.count()).group_by(column)):
+            bucket = RANK_VALUES.get(value, value) if dimension == "rank" else str(value)
+            rows.append({"dimension": dimension, "bucket": bucket, "count": count})
+    # Change version behind the GET /members ETag
+    rows.append({"dimension": "version", "bucket": "member", "count": 1})
+    bind.execute(member_stat.insert(), rows)
+
+
+def downgrade() -> None:
+    """Drop member_stat."""
+    op.drop_table("member_stat")
@@ -0,0 +1,54 @@
+"""Add email outbox.
+
+Revision ID: c64b54e792b6
+Revises: c64b54e792b5
+Create Date: 2026-10-17 01:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c64b54e792b6'
+down_revision: Union[str, Sequence[str], None] = 'c64b54e792b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create email_outbox."""
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "kind",
+            sa.Enum("MAGIC_LINK", "APPROVAL", "REJECTION", name="emailkind", native_enum=False),
+            nullable=False,
+        ),
+        sa.Column("recipient", sa.String(255), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "SENT", "DEAD", name="emailstatus", native_enum=False),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_email_outbox_status_next_attempt_at",
+        "email_outbox",
+        ["status", "next_attempt_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop email_outbox."""
+    op.drop_index("ix_email_outbox_status_next_attempt_at", table_name="email_outbox")
+    op.drop_table("email_outbox")
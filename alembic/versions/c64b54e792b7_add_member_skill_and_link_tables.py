@@ -0,0 +1,68 @@
+"""Add member_skill and member_link tables.
+
+Revision ID: c64b54e792b7
+Revises: c64b54e792b6
+Create Date: 2026-10-17 02:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c64b54e792b7'
+down_revision: Union[str, Sequence[str], None] = 'c64b54e792b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LINK_TYPES = ("GITHUB", "LINKEDIN", "BLOG", "INSTAGRAM", "NOTION", "SOLVED_AC")
+
+
+def _has_table(name: str) -> bool:
+    if context.is_offline_mode():
+        return False
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Create member_skill and member_link.
+
+    Until now these tables only came from create_all at startup, so a database
+    built from migrations alone (e.g. a fresh PostgreSQL) lacked them. Tables
+    that create_all already made are left as they are.
+    """
+    if not _has_table("member_skill"):
+        op.create_table(
+            "member_skill",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column(
+                "member_id",
+                sa.Integer(),
+                sa.ForeignKey("member.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column("skill_name", sa.String(100), nullable=False),
+        )
+    if not _has_table("member_link"):
+        op.create_table(
+            "member_link",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column(
+                "member_id",
+                sa.Integer(),
+                sa.ForeignKey("member.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column(
+                "link_type", sa.Enum(*LINK_TYPES, name="linktype", native_enum=False), nullable=False
+            ),
+            sa.Column("url", sa.String(500), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    """Drop member_link and member_skill."""
+    op.drop_table("member_link")
+    op.drop_table("member_skill")
@@ -0,0 +1,35 @@
+"""Add indexes for the status filter and skill/link lookups.
+
+Revision ID: c64b54e792b8
+Revises: c64b54e792b7
+Create Date: 2026-10-17 03:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c64b54e792b8'
+down_revision: Union[str, Sequence[str], None] = 'c64b54e792b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_member_status_created_at", "member", ["status", "created_at"]),
+    ("ix_member_skill_member_id", "member_skill", ["member_id"]),
+    ("ix_member_skill_skill_name", "member_skill", ["skill_name"]),
+    ("ix_member_link_member_id", "member_link", ["member_id"]),
+)
+
+
+def upgrade() -> None:
+    """Create the indexes (skipped where startup already created them)."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Drop the indexes."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,107 @@
+"""Add canonical skill names and the skill dictionary.
+
+Revision ID: c64b54e792b9
+Revises: c64b54e792b8
+Create Date: 2026-10-17 04:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c64b54e792b9'
+down_revision: Union[str, Sequence[str], None] = 'c64b54e792b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Inlined (not imported from models.skill / repositories.skill_dictionary) so
+# later changes to the app cannot alter what this revision does
+member_skill = sa.table(
+    "member_skill",
+    sa.column("id", sa.Integer),
+    sa.column("member_id", sa.Integer),
+    sa.column("skill_name", sa.String),
+    sa.column("canonical_name", sa.String),
+)
+skill_dictionary = sa.table(
+    "skill_dictionary",
+    sa.column("name", sa.String),
+    sa.column("label", sa.String),
+    sa.column("member_count", sa.Integer),
+)
+
+
+def canonical_skill_name(name: str) -> str:
+    """Whitespace collapsed and case-folded, as models.skill.canonical_skill_name was here"""
+    return " ".join(name.split()).casefold()
+
+
+def upgrade() -> None:
+    """Add member_skill.canonical_name, its index and skill_dictionary, then backfill."""
+    op.add_column("member_skill", sa.Column("canonical_name", sa.String(100), nullable=True))
+
+    if context.is_offline_mode():
+        # Same as canonical_skill_name for ASCII names without repeated inner spaces;
+        # skill_dictionary is filled by ``python manage.py reconcile-stats`` afterwards
+        op.execute(
+            member_skill.update().values(
+                canonical_name=sa.func.lower(sa.func.trim(member_skill.c.skill_name))
+            )
+        )
+    else:
+        bind = op.get_bind()
+        rows = bind.execute(sa.select(member_skill.c.id, member_skill.c.skill_name)).all()
+        if rows:
+            bind.execute(
+                member_skill.update()
+                .where(member_skill.c.id == sa.bindparam("skill_id"))
+                .values(canonical_name=sa.bindparam("canonical")),
+                [{"skill_id": row.id, "canonical": canonical_skill_name(row.skill_name)} for row in rows],
+            )
+
+    with op.batch_alter_table("member_skill") as batch_op:
+        batch_op.alter_column("canonical_name", existing_type=sa.String(100), nullable=False)
+    op.create_index(
+        "ix_member_skill_canonical_name_member_id",
+        "member_skill",
+        ["canonical_name", "member_id"],
+    )
+
+    op.create_table(
+        "skill_dictionary",
+        sa.Column("name", sa.String(100), primary_key=True),
+        sa.Column("label", sa.String(100), nullable=False),
+        sa.Column("member_count", sa.Integer(), nullable=False),
+    )
+    if context.is_offline_mode():
+        return
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(
+            member_skill.c.canonical_name,
+            sa.func.min(member_skill.c.skill_name),
+            sa.func.count(sa.func.distinct(member_skill.c.member_id)),
+        )
+        .where(member_skill.c.canonical_name != "")
+        .group_by(member_skill.c.canonical_name)
+    ).all()
+    if rows:
+        bind.execute(
+            skill_dictionary.insert(),
+            [
+                {"name": name, "label": " ".join(label.split()), "member_count": count}
+                for name, label, count in rows
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Drop skill_dictionary and member_skill.canonical_name."""
+    op.drop_table("skill_dictionary")
+    op.drop_index("ix_member_skill_canonical_name_member_id", table_name="member_skill")
+    with op.batch_alter_table("member_skill") as batch_op:
+        batch_op.drop_column("canonical_name")
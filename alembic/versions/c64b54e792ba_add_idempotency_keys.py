@@ -0,0 +1,39 @@
+"""Add the idempotency_key table.
+
+Revision ID: c64b54e792ba
+Revises: c64b54e792b9
+Create Date: 2026-10-17 06:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c64b54e792ba'
+down_revision: Union[str, Sequence[str], None] = 'c64b54e792b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create idempotency_key (responses replayed for repeated Idempotency-Key headers)."""
+    op.create_table(
+        "idempotency_key",
+        sa.Column("key", sa.String(255), primary_key=True),
+        sa.Column("fingerprint", sa.String(64), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=True),
+        sa.Column("headers", sa.JSON(), nullable=True),
+        sa.Column("body", sa.LargeBinary(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_idempotency_key_expires_at", "idempotency_key", ["expires_at"])
+
+
+def downgrade() -> None:
+    """Drop idempotency_key."""
+    op.drop_index("ix_idempotency_key_expires_at", table_name="idempotency_key")
+    op.drop_table("idempotency_key")
@@ -0,0 +1,85 @@
+"""Add the short-term search table (one- and two-character substrings).
+
+Revision ID: c64b54e792bb
+Revises: c64b54e792ba
+Create Date: 2026-10-17 07:00:00.000000
+
+"""
+from collections import defaultdict
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c64b54e792bb'
+down_revision: Union[str, Sequence[str], None] = 'c64b54e792ba'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Inlined (not imported from repositories.member_search_index) so later changes
+# to the app cannot alter what this revision does
+SHORT_TERM_TABLE = "member_search_gram"
+
+CREATE_SHORT_TERM_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {SHORT_TERM_TABLE} (
+        gram TEXT NOT NULL,
+        member_id INTEGER NOT NULL,
+        PRIMARY KEY (gram, member_id)
+    ) WITHOUT ROWID
+"""
+
+CREATE_SHORT_TERM_INDEX = f"""
+    CREATE INDEX IF NOT EXISTS ix_{SHORT_TERM_TABLE}_member_id
+    ON {SHORT_TERM_TABLE} (member_id)
+"""
+
+
+def _short_grams(name: str, skill_names: list[str]) -> set[str]:
+    grams = set()
+    for value in (name, *skill_names):
+        value = value.lower()
+        for size in (1, 2):
+            grams.update(value[i : i + size] for i in range(len(value) - size + 1))
+    return {gram for gram in grams if not any(char.isspace() for char in gram)}
+
+
+def upgrade() -> None:
+    """Create member_search_gram and backfill it from member names and skills.
+
+    Like the FTS5 table it backs (c64b54e792b4) it is SQLite-only; other
+    databases use the ILIKE fallback in MemberRepository.search_members.
+    """
+    if op.get_context().dialect.name != "sqlite":
+        return
+
+    op.execute(CREATE_SHORT_TERM_TABLE)
+    op.execute(CREATE_SHORT_TERM_INDEX)
+    if context.is_offline_mode():
+        return  # the grams are computed in Python: run online to backfill
+
+    bind = op.get_bind()
+    skills: dict[int, list[str]] = defaultdict(list)
+    for member_id, skill_name in bind.execute(
+        sa.text("SELECT member_id, skill_name FROM member_skill")
+    ):
+        skills[member_id].append(skill_name)
+    rows = [
+        {"gram": gram, "member_id": member_id}
+        for member_id, name in bind.execute(sa.text("SELECT id, name FROM member"))
+        for gram in _short_grams(name, skills[member_id])
+    ]
+    if rows:
+        bind.execute(
+            sa.text(f"INSERT INTO {SHORT_TERM_TABLE} (gram, member_id) VALUES (:gram, :member_id)"),
+            rows,
+        )
+
+
+def downgrade() -> None:
+    """Drop member_search_gram."""
+    if op.get_context().dialect.name != "sqlite":
+        return
+
+    op.execute(f"DROP TABLE IF EXISTS {SHORT_TERM_TABLE};")
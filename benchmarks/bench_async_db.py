@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+"""
+Sync vs async database stack throughput.
+
+Serves GET /members/{id} twice against the same seeded SQLite file:
+    - sync:  ``def`` endpoint + Session (runs in the anyio threadpool)
+    - async: the real ``async def`` router + AsyncSession (aiosqlite)
+and drives both in-process with httpx at 50, 200 and 1000 concurrent clients.
+
+Both stacks get a connection pool as large as the anyio threadpool (40). With
+the default 5+10 pool the sync stack stalls for pool_timeout (30 s) whenever all
+worker threads wait for a connection while the sessions holding connections
+wait for a thread to run get_db's cleanup.
+
+Usage:
+    python -m benchmarks.bench_async_db [--members 500] [--requests 2000]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+_bench_dir = tempfile.mkdtemp(prefix="member-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_bench_dir) / 'bench.db'}"
+# Measure the database stack, not the member read cache
+os.environ["MEMBER_CACHE_ENABLED"] = "false"
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI, HTTPException  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from config import settings  # noqa: E402
+from database import Base, get_async_db, to_async_url  # noqa: E402
+from main import app as async_app  # noqa: E402
+from repositories.member_repository import MemberRepository  # noqa: E402
+from schemas.member import MemberCreate, MemberResponse  # noqa: E402
+from services.member_service import MemberService  # noqa: E402
+
+CONCURRENCY_LEVELS = (50, 200, 1000)
+POOL_SIZE = 40  # anyio's default threadpool size
+
+sync_engine = create_engine(
+    settings.database_url,
+    connect_args={"check_same_thread": False},
+    pool_size=POOL_SIZE,
+    max_overflow=0,
+)
+SyncSession = sessionmaker(bind=sync_engine, autoflush=False)
+async_engine = create_async_engine(
+    to_async_url(settings.database_url), pool_size=POOL_SIZE, max_overflow=0
+)
+AsyncSession = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+def get_sync_db():
+    db = SyncSession()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_bench_async_db():
+    async with AsyncSession() as db:
+        yield db
+
+
+def build_sync_app() -> FastAPI:
+    """The pre-async request path: sync def endpoint on a threadpool Session"""
+    app = FastAPI()
+
+    @app.get("/members/{member_id}", response_model=MemberResponse)
+    def get_member(member_id: int, db: Session = Depends(get_sync_db)):
+        member = MemberService(db).get_member_by_id(member_id)
+        if not member:
+            raise HTTPException(status_code=404, detail="Member not found")
+        return member
+
+    return app
+
+
+def seed(count: int) -> list[int]:
+    Base.metadata.create_all(bind=sync_engine)
+    db = SyncSession()
+    try:
+        repo = MemberRepository.create(db)
+        return [
+            repo.add_member(
+                MemberCreate(
+                    email=f"bench{i}@example.com",
+                    name=f"벤치{i}",
+                    generation=30 + i % 15,
+                    rank="정회원",
+                    skills=[{"skill_name": "Python"}, {"skill_name": "SQL"}],
+                    links=[{"link_type": "github", "url": f"https://github.com/bench{i}"}],
+                )
+            ).id
+            for i in range(count)
+        ]
+    finally:
+        db.close()
+
+
+async def drive(app: FastAPI, ids: list[int], concurrency: int, total: int) -> dict:
+    """Fire ``total`` requests from ``concurrency`` concurrent clients"""
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(total))
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker() -> None:
+            nonlocal errors
+            rng = random.Random()
+            for _ in remaining:
+                start = time.perf_counter()
+                try:
+                    response = await client.get(f"/members/{rng.choice(ids)}")
+                    response.raise_for_status()
+                except Exception:
+                    # e.g. QueuePool timeouts once the sync threadpool saturates
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--members", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    # Per-request INFO logs would dominate the measurement
+    logging.disable(logging.INFO)
+    ids = seed(args.members)
+    async_app.dependency_overrides[get_async_db] = get_bench_async_db
+    apps = {"sync": build_sync_app(), "async": async_app}
+
+    print(f"{'stack':<6} {'clients':>7} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for concurrency in CONCURRENCY_LEVELS:
+        total = max(args.requests, concurrency * 2)
+        for name, app in apps.items():
+            result = await drive(app, ids, concurrency, total)
+            print(
+                f"{name:<6} {concurrency:>7} {result['rps']:>9.0f} "
+                f"{result['p50_ms']:>9.1f} {result['p99_ms']:>9.1f} {result['errors']:>7}"
+            )
+
+    await async_engine.dispose()
+    sync_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Serial vs batched email delivery through ResendEmailService.
+
+Starts a local HTTP stand-in for the Resend API (``POST /emails`` and
+``POST /emails/batch``) that answers after a fixed delay, points the resend SDK
+at it and sends the same approval notifications twice:
+    - serial: one ``send_approval_notification`` call (one HTTP request) per email
+    - batch:  ``send_batch`` (one HTTP request per 100 emails)
+
+Usage:
+    python -m benchmarks.bench_email_batch [--emails 500] [--latency-ms 30]
+"""
+import argparse
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import resend
+
+from services.email_service_impl import ResendEmailService
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    latency_seconds = 0.03
+    requests = 0
+    emails = 0
+
+    def do_POST(self) -> None:  # noqa: N802 (http.server API)
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(self.latency_seconds)
+        count = len(body) if isinstance(body, list) else 1
+        type(self).requests += 1
+        type(self).emails += count
+
+        if self.path == "/emails/batch":
+            payload = {"data": [{"id": f"stand-in-{i}"} for i in range(count)]}
+        else:
+            payload = {"id": "stand-in"}
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def _run(label: str, fn, emails: int) -> dict:
+    _StandIn.requests = _StandIn.emails = 0
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    assert _StandIn.emails == emails, f"{label}: stand-in saw {_StandIn.emails} emails"
+    return {
+        "mode": label,
+        "http_requests": _StandIn.requests,
+        "seconds": elapsed,
+        "emails_per_s": emails / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--emails", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="stand-in response delay")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    _StandIn.latency_seconds = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    resend.api_url = f"http://127.0.0.1:{server.server_port}"
+
+    service = ResendEmailService(api_key="re_benchmark")
+    recipients = [(f"member{i}@example.com", f"회원{i}") for i in range(args.emails)]
+
+    def serial() -> None:
+        for email, name in recipients:
+            service.send_approval_notification(email, name)
+
+    def batch() -> None:
+        messages = [service.approval_message(email, name) for email, name in recipients]
+        errors = [e for e in service.send_batch(messages) if e is not None]
+        assert not errors, errors[0]
+
+    try:
+        results = [_run("serial", serial, args.emails), _run("batch", batch, args.emails)]
+    finally:
+        server.shutdown()
+
+    print(f"{args.emails} emails, stand-in latency {args.latency_ms:.0f} ms")
+    print(f"{'mode':<8}{'requests':>10}{'seconds':>10}{'emails/s':>12}")
+    for r in results:
+        print(f"{r['mode']:<8}{r['http_requests']:>10}{r['seconds']:>10.2f}{r['emails_per_s']:>12.0f}")
+    print(f"speedup: {results[0]['seconds'] / results[1]['seconds']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""
+Payload size and latency of member lists: JSON encoder and compression.
+
+Seeds 1k and then 10k approved members (each with a description, two skills
+and a link) into a fresh SQLite file and drives the real app through
+httpx.ASGITransport (no network):
+
+    encoder      the same prebuilt list of N MemberResponse returned through
+                 FastAPI's default path (response_model validation,
+                 jsonable serialization, json.dumps) vs PydanticJSONResponse
+    compression  GET /members?limit=200 (walking every page; bytes are the
+                 whole walk, latency is per page) and GET /members/directory
+                 with Accept-Encoding identity / gzip / br (br only if the
+                 brotli package is installed)
+
+Usage:
+    python -m benchmarks.bench_list_responses [--sizes 1000 10000] [--repeat 30]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+# Settings and engines are built at import time: configure before importing the app
+_bench_dir = Path(tempfile.mkdtemp(prefix="list-bench-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_bench_dir / 'bench.db'}"
+os.environ["EMAIL_DISPATCHER_ENABLED"] = "false"
+
+import httpx  # noqa: E402
+
+from database import Base, SessionLocal, async_engine, engine  # noqa: E402
+from main import app  # noqa: E402
+from models.member import MemberStatus  # noqa: E402
+from repositories.member_repository import MemberRepository  # noqa: E402
+from schemas.member import MemberDirectory, MemberImportRow, MemberResponse  # noqa: E402
+from services.public_directory import public_directory  # noqa: E402
+from utils.compression import brotli  # noqa: E402
+from utils.responses import PydanticJSONResponse  # noqa: E402
+
+ENCODINGS = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+
+
+def _seed(start: int, stop: int) -> None:
+    rows = [
+        MemberImportRow(
+            email=f"bench{n}@example.com",
+            name=f"벤치{n}",
+            generation=30 + n % 15,
+            rank="정회원",
+            description=f"안녕하세요, {n}번 회원입니다. 백엔드와 DB에 관심이 많아요.",
+            skills=[{"skill_name": "Python"}, {"skill_name": ("SQL", "Rust", "Go")[n % 3]}],
+            links=[{"link_type": "github", "url": f"https://github.com/bench{n}"}],
+        )
+        for n in range(start, stop)
+    ]
+    db = SessionLocal()
+    try:
+        repo = MemberRepository.create(db)
+        for i in range(0, len(rows), 1000):
+            repo.bulk_add_members(rows[i : i + 1000])
+        public_directory.refresh(db)  # prebuilt, as the first directory read would
+    finally:
+        db.close()
+
+
+def _load(size: int) -> MemberDirectory:
+    db = SessionLocal()
+    try:
+        members = MemberRepository.create(db).get_members_by_status(MemberStatus.APPROVED)
+        return MemberDirectory(items=[MemberResponse.model_validate(m) for m in members[:size]])
+    finally:
+        db.close()
+
+
+def _ms(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * q), len(values) - 1)] * 1000
+
+
+async def _timed(repeat: int, fetch) -> tuple[int, list[float]]:
+    """(bytes per call, latency of every request) of ``fetch`` repeated ``repeat`` times"""
+    latencies: list[float] = []
+    size = 0
+    for _ in range(repeat):
+        size = await fetch(latencies)
+    return size, latencies
+
+
+async def _get(
+    client: httpx.AsyncClient, latencies: list[float], *args, **kwargs
+) -> httpx.Response:
+    start = time.perf_counter()
+    response = await client.get(*args, **kwargs)
+    latencies.append(time.perf_counter() - start)
+    response.raise_for_status()
+    return response
+
+
+async def _run(sizes: list[int], repeat: int) -> None:
+    state: dict[str, MemberDirectory] = {}
+
+    # Benchmark-only routes over the same in-memory list: encoder cost only
+    @app.get("/bench/default", response_model=MemberDirectory)
+    async def default_encoder():
+        return state["directory"]
+
+    @app.get("/bench/fast", response_model=MemberDirectory)
+    async def fast_encoder():
+        return PydanticJSONResponse(state["directory"])
+
+    Base.metadata.create_all(bind=engine)
+    print(f"{'members':>8}  {'case':<30}{'bytes':>12}{'p50 ms':>9}{'p99 ms':>9}")
+    seeded = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for size in sizes:
+            _seed(seeded, size)
+            seeded = size
+            state["directory"] = _load(size)
+            results = []
+
+            for name in ("default", "fast"):
+                async def fetch(latencies, name=name):
+                    response = await _get(
+                        client, latencies, f"/bench/{name}", headers={"Accept-Encoding": "identity"}
+                    )
+                    return len(response.content)
+
+                results.append((f"encoder {name}", *await _timed(repeat, fetch)))
+
+            for encoding in ENCODINGS:
+                headers = {"Accept-Encoding": encoding}
+
+                async def walk(latencies, headers=headers):
+                    total = 0
+                    params = {"status": "APPROVED", "limit": 200}
+                    while True:
+                        response = await _get(
+                            client, latencies, "/members", params=params, headers=headers
+                        )
+                        total += response.num_bytes_downloaded
+                        params["cursor"] = response.json()["next_cursor"]
+                        if params["cursor"] is None:
+                            return total
+
+                async def directory(latencies, headers=headers):
+                    response = await _get(client, latencies, "/members/directory", headers=headers)
+                    return response.num_bytes_downloaded
+
+                results.append((f"/members {encoding}", *await _timed(repeat, walk)))
+                results.append((f"/members/directory {encoding}", *await _timed(repeat, directory)))
+
+            for case, size_bytes, latencies in results:
+                print(
+                    f"{size:>8}  {case:<30}{size_bytes:>12,}"
+                    f"{statistics.median(latencies) * 1000:>9.1f}{_ms(latencies, 0.99):>9.1f}"
+                )
+    await async_engine.dispose()
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    asyncio.run(_run(sorted(args.sizes), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
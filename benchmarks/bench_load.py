@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+"""
+In-process load test of the member lifecycle at fixed concurrency.
+
+Seeds ``--members`` generated members (benchmarks.dataset), then
+``--concurrency`` virtual users each repeat the flow
+
+    register -> verify -> approve -> profile update -> list
+
+through httpx.ASGITransport (the real app and middleware, no network) until
+``--flows`` flows have run. Magic-link tokens are minted directly, as the
+email would carry them; the outbox dispatcher is off so emails stay queued.
+
+Reports requests/s overall and p50/p95/p99 per step, and writes the run to
+benchmarks/results/ (compare runs with ``python -m benchmarks.results``).
+
+Usage:
+    python -m benchmarks.bench_load [--members 10000] [--flows 500] [--concurrency 20]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+# Settings and engines are built at import time: configure before importing the app
+_bench_dir = Path(tempfile.mkdtemp(prefix="load-bench-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_bench_dir / 'bench.db'}"
+os.environ["EMAIL_DISPATCHER_ENABLED"] = "false"
+# Every virtual user shares one client IP
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+import httpx  # noqa: E402
+
+from benchmarks.dataset import generate_member, seed_members  # noqa: E402
+from benchmarks.results import summarize, write_results  # noqa: E402
+from config import settings  # noqa: E402
+from database import Base, SessionLocal, async_engine, create_missing_indexes, engine  # noqa: E402
+from main import app  # noqa: E402
+from utils.token import create_magic_link_token  # noqa: E402
+
+STEPS = ("register", "verify", "approve", "update", "list")
+
+
+class LoadDriver:
+    """Virtual users sharing one AsyncClient; latencies are kept per step"""
+
+    def __init__(self, client: httpx.AsyncClient, seed: int, first_index: int) -> None:
+        self.client = client
+        self.seed = seed
+        self.next_index = first_index
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.failures: Counter[str] = Counter()  # "register 429", ...
+        self.admin_headers = {"X-Admin-Key": settings.admin_internal_key}
+
+    async def _request(self, step: str, method: str, url: str, **kwargs) -> httpx.Response | None:
+        start = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        self.latencies[step].append(time.perf_counter() - start)
+        if response.is_error:
+            self.errors[step] += 1
+            self.failures[f"{step} {response.status_code}"] += 1
+            return None
+        return response
+
+    async def flow(self) -> None:
+        index = self.next_index
+        self.next_index += 1
+        row = generate_member(index, self.seed)  # continues the seeded dataset
+        body = row.model_dump(mode="json", exclude={"status"})
+
+        response = await self._request("register", "POST", "/members/register", json=body)
+        if response is None:
+            return
+        member_id = response.json()["id"]
+        token = create_magic_link_token(row.email, purpose="registration")
+        if await self._request("verify", "GET", "/auth/verify", params={"token": token}) is None:
+            return
+        if (
+            await self._request(
+                "approve", "POST", f"/members/{member_id}/approve", headers=self.admin_headers
+            )
+            is None
+        ):
+            return
+        token = create_magic_link_token(row.email, purpose="profile_update")
+        await self._request(
+            "update",
+            "PUT",
+            f"/members/{member_id}",
+            params={"token": token},
+            json={"description": f"{row.name}의 수정된 소개", "skills": [{"skill_name": "Go"}]},
+        )
+        await self._request("list", "GET", "/members", params={"status": "APPROVED", "limit": 50})
+
+    async def run(self, flows: int, concurrency: int) -> float:
+        """Run ``flows`` flows on ``concurrency`` virtual users; returns elapsed seconds"""
+        remaining = iter(range(flows))
+
+        async def user() -> None:
+            for _ in remaining:
+                await self.flow()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        return time.perf_counter() - started
+
+
+async def _run(args: argparse.Namespace) -> None:
+    Base.metadata.create_all(bind=engine)
+    create_missing_indexes(engine)
+    with SessionLocal() as db:
+        seed_members(db, args.members, args.seed)
+
+    # Unhandled errors (e.g. SQLite "database is locked") count as failed requests
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        driver = LoadDriver(client, args.seed, first_index=args.members)
+        elapsed = await driver.run(args.flows, args.concurrency)
+    await async_engine.dispose()
+    engine.dispose()
+
+    requests = sum(len(latencies) for latencies in driver.latencies.values())
+    results = {
+        "requests": requests,
+        "seconds": elapsed,
+        "requests_per_second": requests / elapsed,
+        "flows_per_second": args.flows / elapsed,
+        "steps": {
+            step: {**summarize(driver.latencies[step]), "errors": driver.errors[step]}
+            for step in STEPS
+        },
+    }
+
+    print(
+        f"{args.members} seeded members, {args.flows} flows, {args.concurrency} users: "
+        f"{results['requests_per_second']:.0f} req/s, {results['flows_per_second']:.1f} flows/s"
+    )
+    print(f"{'step':<10}{'count':>7}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for step, summary in results["steps"].items():
+        print(
+            f"{step:<10}{summary['count']:>7}{summary['errors']:>8}{summary['p50_ms']:>9.1f}"
+            f"{summary['p95_ms']:>9.1f}{summary['p99_ms']:>9.1f}"
+        )
+    print(f"results: {write_results('load', vars(args), results)}")
+    if driver.failures:
+        # Failed requests end their flow early: the numbers above are not a valid run
+        raise SystemExit(f"requests failed: {dict(driver.failures)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--members", type=int, default=10000, help="seeded before the run")
+    parser.add_argument("--flows", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    # Per-request logs (N+1 warnings, lock errors) would drown the report; errors are counted
+    logging.disable(logging.ERROR)
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+ORM vs Core read path for member lists: time and memory per N members.
+
+    orm      session.query(Member) (identity map + selectin skills/links), then
+             MemberResponse.model_validate(from_attributes) per member and
+             MemberPage(...).model_dump_json() - the list path before records
+    records  MemberRepository.get_members_page: Core select of the columns,
+             skills/links grouped into __slots__ records in one pass, then
+             pydantic_core.to_json
+
+Both produce the same JSON bytes. Time is the median of ``--repeat`` runs,
+each in a fresh session; memory is the tracemalloc peak of one run.
+
+Usage:
+    python -m benchmarks.bench_read_path [--members 10000] [--repeat 5]
+"""
+import argparse
+import gc
+import logging
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Settings and engines are built at import time: configure before importing the app
+_bench_dir = Path(tempfile.mkdtemp(prefix="read-path-bench-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_bench_dir / 'bench.db'}"
+
+from pydantic_core import to_json  # noqa: E402
+
+import main as _app  # noqa: E402, F401  (registers every model)
+from database import Base, SessionLocal, engine  # noqa: E402
+from models.member import Member  # noqa: E402
+from repositories.member_records import MemberRecordPage  # noqa: E402
+from repositories.member_repository import MemberRepository  # noqa: E402
+from schemas.member import MemberImportRow, MemberPage, MemberResponse  # noqa: E402
+
+
+def _seed(count: int) -> None:
+    db = SessionLocal()
+    try:
+        repo = MemberRepository.create(db)
+        for start in range(0, count, 1000):
+            repo.bulk_add_members(
+                [
+                    MemberImportRow(
+                        email=f"bench{n}@example.com",
+                        name=f"벤치{n}",
+                        generation=30 + n % 15,
+                        rank="정회원",
+                        description=f"{n}번 회원 소개",
+                        skills=[{"skill_name": "Python"}, {"skill_name": "SQL"}],
+                        links=[{"link_type": "github", "url": f"https://github.com/bench{n}"}],
+                    )
+                    for n in range(start, min(start + 1000, count))
+                ]
+            )
+    finally:
+        db.close()
+
+
+def orm_path(count: int) -> bytes:
+    db = SessionLocal()
+    try:
+        members = db.query(Member).order_by(Member.created_at, Member.id).limit(count).all()
+        page = MemberPage(items=[MemberResponse.model_validate(member) for member in members])
+        return page.model_dump_json().encode()
+    finally:
+        db.close()
+
+
+def records_path(count: int) -> bytes:
+    db = SessionLocal()
+    try:
+        members, _ = MemberRepository.create(db).get_members_page(limit=count)
+        return to_json(MemberRecordPage(items=members))
+    finally:
+        db.close()
+
+
+def _measure(fn, count: int, repeat: int) -> tuple[float, float, int]:
+    """(median seconds, peak MiB, body bytes)"""
+    fn(count)  # warm up statement caches
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        body = fn(count)
+        times.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    fn(count)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times), peak / 2**20, len(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--members", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    Base.metadata.create_all(bind=engine)
+    _seed(args.members)
+    assert orm_path(args.members) == records_path(args.members), "paths disagree"
+
+    print(f"{args.members} members")
+    print(f"{'path':<10}{'time ms':>10}{'peak MiB':>10}{'bytes':>12}")
+    for name, fn in (("orm", orm_path), ("records", records_path)):
+        seconds, peak, size = _measure(fn, args.members, args.repeat)
+        print(f"{name:<10}{seconds * 1000:>10.1f}{peak:>10.1f}{size:>12,}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
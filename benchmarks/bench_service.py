@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""
+Micro-benchmarks of repository and service methods on a seeded dataset.
+
+Seeds ``--members`` generated members (benchmarks.dataset, deterministic for
+``--seed``) into a fresh SQLite file, then calls each method ``--iterations``
+times with arguments drawn from the dataset, each call in its own session as
+a request would:
+
+    repository  get_member_by_id / get_member_by_email / get_members_page
+                (first page, by skill) / search_members / get_stats
+    service     MemberService.get_member_by_id with a cold member cache and
+                with 100 cached hot members, get_members_page, list_skills, get_member_stats
+
+Prints ops/s and p50/p99 per method and writes the run to benchmarks/results/.
+
+Usage:
+    python -m benchmarks.bench_service [--members 10000] [--iterations 2000] [--seed 0]
+"""
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+# Settings and engines are built at import time: configure before importing the app
+_bench_dir = Path(tempfile.mkdtemp(prefix="service-bench-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_bench_dir / 'bench.db'}"
+
+import main as _app  # noqa: E402, F401  (registers every model)
+from benchmarks.dataset import generate_members, seed_members  # noqa: E402
+from benchmarks.results import summarize, write_results  # noqa: E402
+from database import Base, SessionLocal, engine  # noqa: E402
+from models.member import MemberStatus  # noqa: E402
+from repositories.member_repository import MemberRepository  # noqa: E402
+from services.member_cache import MemberCache  # noqa: E402
+from services.member_service import MemberService  # noqa: E402
+
+
+def _cases(ids: list[int], emails: list[str], rng: random.Random) -> dict:
+    """name -> fn(session); the argument for each call is drawn from the dataset"""
+    cold = MemberCache(enabled=False)
+    warm = MemberCache(ttl_seconds=3600)
+    hot = rng.sample(ids, min(100, len(ids)))  # popular profiles, all cached
+    with SessionLocal() as db:
+        for member_id in hot:
+            MemberService(db, cache=warm).get_member_by_id(member_id)
+    return {
+        "repo.get_member_by_id": lambda db: MemberRepository.create(db).get_member_by_id(
+            rng.choice(ids)
+        ),
+        "repo.get_member_by_email": lambda db: MemberRepository.create(db).get_member_by_email(
+            rng.choice(emails)
+        ),
+        "repo.get_members_page": lambda db: MemberRepository.create(db).get_members_page(
+            MemberStatus.APPROVED, limit=50
+        ),
+        "repo.get_members_page(skill)": lambda db: MemberRepository.create(db).get_members_page(
+            MemberStatus.APPROVED, limit=50, skill="rust"
+        ),
+        "repo.search_members": lambda db: MemberRepository.create(db).search_members(
+            rng.choice(("Python", "백엔드", "스터디", "Kubernetes")), MemberStatus.APPROVED, 20, 0
+        ),
+        "repo.get_stats": lambda db: MemberRepository.create(db).get_stats(),
+        "service.get_member_by_id (cold cache)": lambda db: MemberService(
+            db, cache=cold
+        ).get_member_by_id(rng.choice(ids)),
+        "service.get_member_by_id (warm cache)": lambda db: MemberService(
+            db, cache=warm
+        ).get_member_by_id(rng.choice(hot)),
+        "service.get_members_page": lambda db: MemberService(db).get_members_page(
+            MemberStatus.APPROVED, limit=50
+        ),
+        "service.list_skills": lambda db: MemberService(db).list_skills(),
+        "service.get_member_stats": lambda db: MemberService(db).get_member_stats(),
+    }
+
+
+def _measure(fn, iterations: int) -> dict[str, float]:
+    latencies = []
+    for _ in range(iterations // 10):  # warm up statement caches
+        with SessionLocal() as db:
+            fn(db)
+    for _ in range(iterations):
+        start = time.perf_counter()
+        with SessionLocal() as db:
+            fn(db)
+        latencies.append(time.perf_counter() - start)
+    summary = summarize(latencies)
+    summary["ops_per_second"] = iterations / sum(latencies)
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--members", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        seed_members(db, args.members, args.seed)
+        ids = list(range(1, args.members + 1))
+    emails = [row.email for row in generate_members(min(args.members, 1000), args.seed)]
+    rng = random.Random(args.seed)
+
+    results = {}
+    print(f"{args.members} members, {args.iterations} calls each")
+    print(f"{'method':<40}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, fn in _cases(ids, emails, rng).items():
+        results[name] = summary = _measure(fn, args.iterations)
+        print(
+            f"{name:<40}{summary['ops_per_second']:>10.0f}"
+            f"{summary['p50_ms']:>10.3f}{summary['p99_ms']:>10.3f}"
+        )
+    print(f"results: {write_results('service', vars(args), results)}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
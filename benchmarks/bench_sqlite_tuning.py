@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+"""
+Default vs tuned SQLite connection settings under concurrent register + read load.
+
+Runs the real app (async router, AsyncSession on aiosqlite) twice, each time in
+a fresh process on a fresh database file:
+    - default: SQLITE_TUNING_ENABLED=false (rollback journal, synchronous=FULL,
+      2 MiB cache, no mmap, driver's 5 s lock timeout)
+    - tuned:   the Settings defaults applied by database.install_sqlite_pragmas
+               (WAL, synchronous=NORMAL, 16 MiB cache, 256 MiB mmap, busy_timeout)
+
+Each client loops over requests, ``--write-ratio`` of them
+``POST /members/register`` (member + skills + links + search row + counters +
+outbox email in one transaction) and the rest ``GET /members/{id}``.
+The member read cache is disabled so every read hits the database.
+
+Usage:
+    python -m benchmarks.bench_sqlite_tuning [--members 500] [--requests 3000] \\
+        [--clients 50] [--write-ratio 0.3]
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+MODES = {"default": "false", "tuned": "true"}
+
+
+def _configure_child(mode: str) -> None:
+    bench_dir = tempfile.mkdtemp(prefix=f"sqlite-bench-{mode}-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{Path(bench_dir) / 'bench.db'}"
+    os.environ["SQLITE_TUNING_ENABLED"] = MODES[mode]
+    os.environ["MEMBER_CACHE_ENABLED"] = "false"
+    os.environ["EMAIL_DISPATCHER_ENABLED"] = "false"
+    # Every client shares one IP: the register limit would answer most writes 429
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+
+def _member_payload(n: int) -> dict:
+    return {
+        "email": f"bench{n}@example.com",
+        "name": f"벤치{n}",
+        "generation": 30 + n % 15,
+        "rank": "정회원",
+        "skills": [{"skill_name": "Python"}, {"skill_name": "SQL"}],
+        "links": [{"link_type": "github", "url": f"https://github.com/bench{n}"}],
+    }
+
+
+async def _child(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from database import Base, SessionLocal, async_engine, engine
+    from main import app
+    from repositories.member_repository import MemberRepository
+    from schemas.member import MemberCreate
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        repo = MemberRepository.create(db)
+        ids = [repo.add_member(MemberCreate(**_member_payload(i))).id for i in range(args.members)]
+    finally:
+        db.close()
+
+    emails = itertools.count(args.members)
+    remaining = iter(range(args.requests))
+    latencies: dict[str, list[float]] = {"read": [], "write": []}
+    errors: dict[str, int] = {"read": 0, "write": 0}
+    failures: Counter[str] = Counter()  # "write 500", "read OperationalError", ...
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker(seed: int) -> None:
+            rng = random.Random(seed)
+            for _ in remaining:
+                kind = "write" if rng.random() < args.write_ratio else "read"
+                start = time.perf_counter()
+                try:
+                    if kind == "write":
+                        response = await client.post(
+                            "/members/register", json=_member_payload(next(emails))
+                        )
+                    else:
+                        response = await client.get(f"/members/{rng.choice(ids)}")
+                    if response.is_error:
+                        errors[kind] += 1
+                        failures[f"{kind} {response.status_code}"] += 1
+                except Exception as e:
+                    # "database is locked" surfaces as an OperationalError
+                    errors[kind] += 1
+                    failures[f"{kind} {type(e).__name__}"] += 1
+                latencies[kind].append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(seed) for seed in range(args.clients)))
+        elapsed = time.perf_counter() - started
+
+    await async_engine.dispose()
+    engine.dispose()
+
+    def percentile(values: list[float], q: float) -> float:
+        values = sorted(values)
+        return values[max(int(len(values) * q) - 1, 0)] * 1000 if values else 0.0
+
+    return {
+        "rps": args.requests / elapsed,
+        **{
+            f"{kind}_{name}": value
+            for kind, values in latencies.items()
+            for name, value in (
+                ("p50_ms", statistics.median(values) * 1000 if values else 0.0),
+                ("p99_ms", percentile(values, 0.99)),
+            )
+        },
+        "read_errors": errors["read"],
+        "write_errors": errors["write"],
+        "failures": dict(failures),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--members", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--write-ratio", type=float, default=0.3)
+    parser.add_argument("--child", choices=sorted(MODES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        # Settings and engines are built at import time: configure before importing the app
+        _configure_child(args.child)
+        logging.disable(logging.INFO)
+        print(json.dumps(asyncio.run(_child(args))))
+        return
+
+    forwarded = [
+        f"--members={args.members}",
+        f"--requests={args.requests}",
+        f"--clients={args.clients}",
+        f"--write-ratio={args.write_ratio}",
+    ]
+    print(
+        f"{args.clients} clients, {args.requests} requests, "
+        f"{args.write_ratio:.0%} register / {1 - args.write_ratio:.0%} read"
+    )
+    print(
+        f"{'mode':<8}{'req/s':>8}{'read p50':>10}{'read p99':>10}"
+        f"{'write p50':>11}{'write p99':>11}{'errors':>8}"
+    )
+    failed = {}
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_sqlite_tuning", f"--child={mode}", *forwarded],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        r = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{mode:<8}{r['rps']:>8.0f}{r['read_p50_ms']:>10.1f}{r['read_p99_ms']:>10.1f}"
+            f"{r['write_p50_ms']:>11.1f}{r['write_p99_ms']:>11.1f}"
+            f"{r['read_errors'] + r['write_errors']:>8}"
+        )
+        if r["failures"]:
+            failed[mode] = r["failures"]
+    if failed:
+        # Latencies of rejected requests say nothing about SQLite
+        raise SystemExit(f"requests failed, the comparison is not valid: {failed}")
+
+
+if __name__ == "__main__":
+    main()
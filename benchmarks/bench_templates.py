@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""
+Email template renders per second: default renderer vs precompiled mode.
+
+    - default:     utils.jinja2._template_env (FileSystemLoader lookup and
+                   mtime check on every render)
+    - precompiled: PrecompiledTemplates (compiled once, auto_reload off,
+                   base.html layout pre-rendered)
+
+Usage:
+    python -m benchmarks.bench_templates [--seconds 2]
+"""
+import argparse
+import time
+
+from utils.jinja2 import PrecompiledTemplates, _template_env
+
+CASES = {
+    "magic_link.html": {"magic_link_url": "https://api.jaram.net/auth/verify?token=abc.def.ghi"},
+    "approval.html": {"member_name": "홍길동"},
+    "rejection.html": {"member_name": "홍길동"},
+}
+
+
+def _renders_per_second(render, name: str, context: dict, seconds: float) -> float:
+    count = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            render(name, **context)
+        count += 100
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="time per template and mode")
+    args = parser.parse_args()
+
+    precompiled = PrecompiledTemplates()
+    precompiled.compile_all()
+
+    def default_render(name: str, **context) -> str:
+        return _template_env.get_template(name).render(**context)
+
+    print(f"{'template':<18}{'default/s':>12}{'precompiled/s':>16}{'speedup':>10}")
+    for name, context in CASES.items():
+        assert default_render(name, **context) == precompiled.render(name, **context)
+        base = _renders_per_second(default_render, name, context, args.seconds)
+        fast = _renders_per_second(precompiled.render, name, context, args.seconds)
+        print(f"{name:<18}{base:>12.0f}{fast:>16.0f}{fast / base:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Deterministic member dataset for benchmarks.
+
+``generate_members(count, seed)`` yields the same rows for the same arguments
+on every machine, so runs on different days (or branches) load identical data:
+
+    names        Korean surname + two-syllable given name
+    generation   1-45, skewed towards recent generations; rank follows it
+    status       ~90% APPROVED, ~7% PENDING, ~3% UNVERIFIED
+    skills       0-6 from a weighted pool (Python and JavaScript common, Rust rare)
+    links        github / blog / linkedin / solved_ac / notion / instagram,
+                 each present with its own probability
+    description  about 70% of members, from a few sentence templates
+
+``seed_members(db, count, seed)`` inserts them through
+MemberRepository.bulk_add_members in chunks (the import path), so 1M members
+fit in memory and the statistics, skill dictionary and search index are
+maintained as in production.
+"""
+
+import random
+from collections.abc import Iterator
+
+from sqlalchemy.orm import Session
+
+from models.link import LinkType
+from models.member import MemberRank, MemberStatus
+from repositories.member_repository import MemberRepository
+from schemas.member import MemberImportRow
+from services.public_directory import public_directory
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN = "민서지현준우예은도윤하진수영재성혜원태경"
+EMAIL_DOMAINS = ("gmail.com", "naver.com", "hanyang.ac.kr", "kakao.com")
+
+SKILLS = {
+    "Python": 30,
+    "JavaScript": 25,
+    "TypeScript": 20,
+    "React": 18,
+    "Java": 15,
+    "SQL": 15,
+    "C++": 12,
+    "Docker": 12,
+    "Spring": 10,
+    "Go": 8,
+    "AWS": 8,
+    "PyTorch": 7,
+    "Kotlin": 6,
+    "Django": 6,
+    "Machine Learning": 6,
+    "FastAPI": 5,
+    "Kubernetes": 5,
+    "Rust": 5,
+    "Swift": 4,
+    "Unity": 3,
+}
+SKILL_COUNTS = (0, 1, 2, 3, 4, 5, 6)
+SKILL_COUNT_WEIGHTS = (5, 15, 25, 25, 15, 10, 5)
+
+LINKS = (
+    (LinkType.GITHUB, 0.7, "https://github.com/{handle}"),
+    (LinkType.BLOG, 0.3, "https://{handle}.tistory.com"),
+    (LinkType.LINKEDIN, 0.2, "https://www.linkedin.com/in/{handle}"),
+    (LinkType.SOLVED_AC, 0.15, "https://solved.ac/profile/{handle}"),
+    (LinkType.NOTION, 0.05, "https://{handle}.notion.site"),
+    (LinkType.INSTAGRAM, 0.05, "https://www.instagram.com/{handle}"),
+)
+
+DESCRIPTIONS = (
+    "{generation}기 {name}입니다. {skill}로 백엔드를 주로 개발합니다.",
+    "{skill}에 관심이 많은 {generation}기입니다. 스터디 언제든 환영해요!",
+    "안녕하세요, {name}입니다. 요즘은 {skill} 공부 중입니다.",
+    "{generation}기 {name}. 알고리즘과 {skill}을 좋아합니다.",
+)
+
+
+def _pick_skills(rng: random.Random) -> list[str]:
+    """Weighted sample without replacement"""
+    count = rng.choices(SKILL_COUNTS, SKILL_COUNT_WEIGHTS)[0]
+    pool = dict(SKILLS)
+    picked = []
+    for _ in range(count):
+        skill = rng.choices(list(pool), list(pool.values()))[0]
+        picked.append(skill)
+        del pool[skill]
+    return picked
+
+
+def generate_member(n: int, seed: int = 0) -> MemberImportRow:
+    """Row ``n`` of the dataset for ``seed`` (one RNG per row: any slice is reproducible)"""
+    rng = random.Random(f"{seed}:{n}")
+    name = rng.choice(SURNAMES) + rng.choice(GIVEN) + rng.choice(GIVEN)
+    handle = f"jaram{n}"
+    generation = round(rng.triangular(1, 45, 42))
+    if generation >= 40:
+        rank = MemberRank.REGULAR
+    else:
+        rank = MemberRank.PROSPECTIVE_OB if generation >= 36 else MemberRank.OB
+    status = rng.choices(
+        (MemberStatus.APPROVED, MemberStatus.PENDING, MemberStatus.UNVERIFIED), (90, 7, 3)
+    )[0]
+    skills = _pick_skills(rng)
+    description = None
+    if rng.random() < 0.7:
+        description = rng.choice(DESCRIPTIONS).format(
+            generation=generation, name=name, skill=skills[0] if skills else "웹 개발"
+        )
+    return MemberImportRow(
+        email=f"{handle}@{rng.choice(EMAIL_DOMAINS)}",
+        name=name,
+        generation=generation,
+        rank=rank,
+        description=description,
+        status=status,
+        skills=[{"skill_name": skill} for skill in skills],
+        links=[
+            {"link_type": link_type, "url": url.format(handle=handle)}
+            for link_type, probability, url in LINKS
+            if rng.random() < probability
+        ],
+    )
+
+
+def generate_members(count: int, seed: int = 0, start: int = 0) -> Iterator[MemberImportRow]:
+    """Rows ``start`` .. ``start + count - 1`` of the dataset for ``seed``"""
+    for n in range(start, start + count):
+        yield generate_member(n, seed)
+
+
+def seed_members(
+    db: Session, count: int, seed: int = 0, start: int = 0, chunk_size: int = 1000
+) -> int:
+    """Insert ``count`` generated members through the import path and refresh the directory"""
+    repo = MemberRepository.create(db)
+    chunk: list[MemberImportRow] = []
+    for row in generate_members(count, seed, start):
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            repo.bulk_add_members(chunk)
+            chunk = []
+    repo.bulk_add_members(chunk)
+    public_directory.refresh(db)  # prebuilt, as the first directory read would
+    return count
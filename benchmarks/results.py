@@ -0,0 +1,112 @@
+"""
+Benchmark results as JSON, so runs can be compared over time.
+
+``write_results`` stores one run in ``benchmarks/results/<name>-<UTC time>.json``
+with the parameters, the git commit and the Python/platform it ran on.
+Compare two runs of the same benchmark with:
+
+    python -m benchmarks.results OLD.json NEW.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: list[float]) -> dict[str, float]:
+    """count, mean and p50/p95/p99 (milliseconds) of latencies in seconds"""
+    values = sorted(latencies)
+    return {
+        "count": len(values),
+        "mean_ms": sum(values) / len(values) * 1000 if values else 0.0,
+        "p50_ms": percentile(values, 0.50) * 1000,
+        "p95_ms": percentile(values, 0.95) * 1000,
+        "p99_ms": percentile(values, 0.99) * 1000,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(
+    name: str, params: dict, results: dict, output_dir: Path = RESULTS_DIR
+) -> Path:
+    """Write one run to ``output_dir`` and return the file path"""
+    started = datetime.now(timezone.utc)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"{name}-{started:%Y%m%dT%H%M%SZ}.json"
+    document = {
+        "benchmark": name,
+        "created_at": started.isoformat(),
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "params": params,
+        "results": results,
+    }
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return path
+
+
+def _flatten(results: dict, prefix: str = "") -> dict[str, float]:
+    flat: dict[str, float] = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)):
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def compare(old: dict, new: dict) -> list[tuple[str, float, float, float | None]]:
+    """(metric, old, new, change in %) for every numeric result present in both runs"""
+    before, after = _flatten(old["results"]), _flatten(new["results"])
+    rows = []
+    for metric in sorted(before.keys() & after.keys()):
+        change = (after[metric] - before[metric]) / before[metric] * 100 if before[metric] else None
+        rows.append((metric, before[metric], after[metric], change))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("old", type=Path)
+    parser.add_argument("new", type=Path)
+    args = parser.parse_args()
+    old, new = (json.loads(path.read_text(encoding="utf-8")) for path in (args.old, args.new))
+    if old["benchmark"] != new["benchmark"]:
+        parser.error(f"different benchmarks: {old['benchmark']} vs {new['benchmark']}")
+
+    print(f"{old['git_commit']} ({old['created_at']}) -> {new['git_commit']} ({new['created_at']})")
+    print(f"{'metric':<45}{'old':>12}{'new':>12}{'change':>10}")
+    for metric, before, after, change in compare(old, new):
+        change_text = f"{change:+.1f}%" if change is not None else "-"
+        print(f"{metric:<45}{before:>12.2f}{after:>12.2f}{change_text:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import logging
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import model_validator
 
@@ -17,6 +19,23 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:////app/data/jaram.db"
+    # Connection pool (per engine: the app has a sync and an async engine)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 1800  # below typical server/proxy idle timeouts; -1 disables
+    db_pool_pre_ping: bool = True  # test connections on checkout (survives DB restarts/failover)
+    # SQLite tuning, applied to every new connection (ignored on other databases)
+    sqlite_tuning_enabled: bool = True
+    sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = "WAL"
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    sqlite_cache_size_kib: int = 16384  # page cache per connection
+    sqlite_mmap_size_bytes: int = 268435456  # 256 MiB, shared by all connections
+    sqlite_busy_timeout_ms: int = 5000  # wait for the write lock instead of "database is locked"
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    sqlite_foreign_keys: bool = True
+    # wal_checkpoint(TRUNCATE) + optimize every N seconds (0 disables)
+    sqlite_maintenance_interval_seconds: float = 300.0
 
     # JWT
     jwt_secret_key: str = "change-this-secret-key-in-production"
@@ -40,6 +59,58 @@ class Settings(BaseSettings):
     email_provider: str = "mock"  # "mock" or "resend"
     resend_api_key: str | None = None
     email_from: str = "Jaram <team@jaram.net>"
+    # Keep-alive HTTP pool for the email provider (one per process)
+    email_http_pool_size: int = 10
+    email_http_connect_timeout_seconds: float = 5.0
+    email_http_read_timeout_seconds: float = 30.0
+    # Precompiled email templates (None: on when APP_ENV=production)
+    email_templates_precompiled: bool | None = None
+
+    # Email outbox dispatcher (background worker started with the app)
+    email_dispatcher_enabled: bool = True
+    email_outbox_batch_size: int = 100
+    email_outbox_poll_seconds: float = 1.0
+    email_outbox_max_attempts: int = 10
+    email_outbox_base_backoff_seconds: float = 5.0
+    email_outbox_max_backoff_seconds: float = 1800.0
+    email_outbox_lease_seconds: float = 60.0
+    email_outbox_coalesce_seconds: float = 2.0  # hold partial batches up to this long
+
+    # Member read cache (process-local LRU + TTL)
+    member_cache_enabled: bool = True
+    member_cache_max_size: int = 1024
+    member_cache_ttl_seconds: float = 60.0
+
+    # Public directory snapshot (GET /members/directory, rebuilt on writes)
+    public_directory_max_age_seconds: float = 300.0
+
+    # Response compression (br when the brotli package is installed, else gzip)
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024  # bytes; smaller bodies are sent as-is
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+
+    # Prometheus metrics at GET /metrics
+    metrics_enabled: bool = True
+
+    # Per-request SQL statistics (count/time per request, slow and repeated statements logged)
+    query_stats_enabled: bool = True
+    slow_query_ms: float = 200.0
+    query_repeat_threshold: int = 3  # same SQL this many times in one request: possible N+1
+    # X-Query-Stats response header (None: on unless APP_ENV=production)
+    query_stats_header: bool | None = None
+
+    # Rate limits for endpoints that send email ("<requests>/<seconds>", token bucket per key).
+    # The client IP is the connection peer: run uvicorn with --forwarded-allow-ips behind a proxy.
+    rate_limit_enabled: bool = True
+    rate_limit_register_ip: str = "20/600"
+    rate_limit_register_email: str = "3/3600"
+    rate_limit_profile_update_link_ip: str = "20/600"
+    rate_limit_profile_update_link_email: str = "3/900"
+
+    # Idempotency-Key on register/approve/reject/profile update: responses kept for replay
+    idempotency_ttl_seconds: float = 86400.0
+    idempotency_lock_seconds: float = 60.0  # a reservation older than this was abandoned
 
     # Admin
     admin_internal_key: str = "dev-admin-key-change-in-production"
@@ -1,22 +1,157 @@
-from sqlalchemy import create_engine
+import logging
+
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-from config import settings
+from config import Settings, settings
+
+logger = logging.getLogger(__name__)
+
+# Async drivers for each sync URL scheme (sqlite:// -> sqlite+aiosqlite://, ...)
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def to_async_url(database_url: str) -> str:
+    """Return the async-driver equivalent of a sync database URL"""
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None or url.get_driver_name() == driver:
+        return database_url
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
+def engine_options(database_url: str, config: Settings = settings) -> dict:
+    """
+    create_engine/create_async_engine keyword arguments for a URL.
+
+    QueuePool settings come from Settings; in-memory SQLite uses a
+    single-connection pool that takes none of them.
+    """
+    url = make_url(database_url)
+    options: dict = {}
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        if url.database in (None, "", ":memory:"):
+            return options
+    options.update(
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_timeout=config.db_pool_timeout_seconds,
+        pool_recycle=config.db_pool_recycle_seconds,
+        pool_pre_ping=config.db_pool_pre_ping,
+    )
+    return options
+
 
 # Create database engine
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if settings.database_url.startswith("sqlite") else {},
-)
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
+
+def sqlite_pragmas(config: Settings = settings) -> list[str]:
+    """PRAGMA statements run on every new SQLite connection"""
+    if not config.sqlite_tuning_enabled:
+        return []
+    return [
+        f"PRAGMA journal_mode = {config.sqlite_journal_mode}",
+        f"PRAGMA synchronous = {config.sqlite_synchronous}",
+        # Negative cache_size is in KiB rather than pages
+        f"PRAGMA cache_size = -{int(config.sqlite_cache_size_kib)}",
+        f"PRAGMA mmap_size = {int(config.sqlite_mmap_size_bytes)}",
+        f"PRAGMA busy_timeout = {int(config.sqlite_busy_timeout_ms)}",
+        f"PRAGMA temp_store = {config.sqlite_temp_store}",
+        f"PRAGMA foreign_keys = {'ON' if config.sqlite_foreign_keys else 'OFF'}",
+    ]
+
+
+def install_sqlite_pragmas(target: Engine, pragmas: list[str]) -> None:
+    """Run ``pragmas`` on every new DBAPI connection of a SQLite engine"""
+    if target.dialect.name != "sqlite" or not pragmas:
+        return
+
+    @event.listens_for(target, "connect")
+    def _set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def run_sqlite_maintenance(target: Engine) -> None:
+    """
+    Fold the WAL back into the database file and refresh query planner stats.
+
+    ``wal_checkpoint(TRUNCATE)`` keeps the -wal file from growing without bound
+    when readers are always active; ``optimize`` re-runs ANALYZE where SQLite
+    thinks it would help. Safe to call while the app is serving requests.
+    """
+    if target.dialect.name != "sqlite":
+        return
+    with target.connect() as connection:
+        busy, wal_pages, checkpointed = connection.exec_driver_sql(
+            "PRAGMA wal_checkpoint(TRUNCATE)"
+        ).one()
+        connection.exec_driver_sql("PRAGMA optimize")
+    if wal_pages >= 0:  # -1: not in WAL mode
+        logger.info(
+            f"[SQLITE] Checkpointed {checkpointed}/{wal_pages} WAL pages"
+            + (" (busy: readers still on an old snapshot)" if busy else "")
+        )
+
+
+install_sqlite_pragmas(engine, sqlite_pragmas())
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine on the same database (aiosqlite locally, asyncpg on PostgreSQL)
+async_engine = create_async_engine(
+    to_async_url(settings.database_url), **engine_options(settings.database_url)
+)
+install_sqlite_pragmas(async_engine.sync_engine, sqlite_pragmas())
+
+# Objects returned from an AsyncSession must stay readable after commit without
+# lazy-loading outside the event loop, hence expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
+)
+
 # Create Base class for models
 Base = declarative_base()
 
 
+def create_missing_indexes(target: Engine) -> list[str]:
+    """
+    Create model indexes that are missing from existing tables.
+
+    ``create_all`` only creates indexes together with a new table, so a
+    database created before an index was added to the models would never get
+    it. Returns the names of the indexes created.
+    """
+    created = []
+    with target.begin() as connection:
+        inspector = inspect(connection)
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(connection)
+                    created.append(index.name)
+    if created:
+        logger.info(f"Created missing indexes: {', '.join(created)}")
+    return created
+
+
 # Dependency to get DB session
 def get_db():
     db = SessionLocal()
@@ -24,3 +159,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Dependency to get async DB session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
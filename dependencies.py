@@ -1,10 +1,14 @@
-"""FastAPI dependencies for authentication and authorization."""
+"""FastAPI dependencies for authentication, authorization and rate limiting."""
 
+import math
 import secrets
+from collections.abc import Awaitable, Callable
 
-from fastapi import Header, HTTPException, status
+from fastapi import Header, HTTPException, Request, status
 
 from config import settings
+from services.metrics import rate_limited_requests_total
+from services.rate_limiter import RateLimit, rate_limiter
 
 
 async def require_internal_admin(x_admin_key: str = Header(...)) -> bool:
@@ -31,4 +35,55 @@ async def require_internal_admin(x_admin_key: str = Header(...)) -> bool:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid admin API key"
         )
-    return True
\ No newline at end of file
+    return True
+
+
+async def _request_email(request: Request) -> str | None:
+    """The "email" field of a JSON body (FastAPI has already read and cached the body)"""
+    try:
+        body = await request.json()
+    except ValueError:
+        return None  # not JSON: body validation answers 422 later
+    email = body.get("email") if isinstance(body, dict) else None
+    return email.strip().casefold() if isinstance(email, str) else None
+
+
+def rate_limited(route: str, per_ip: str, per_email: str) -> Callable[[Request], Awaitable[None]]:
+    """
+    Dependency limiting ``route`` per client IP and per email in the JSON body.
+
+    Use it in the route decorator (``dependencies=[Depends(...)]``): those run
+    before the endpoint's own dependencies, so a rejected request never opens
+    a database session.
+
+    Raises:
+        HTTPException: 429 with Retry-After (seconds) when a limit is exceeded
+    """
+    ip_limit, email_limit = RateLimit.parse(per_ip), RateLimit.parse(per_email)
+
+    async def check(request: Request) -> None:
+        checks = [("ip", request.client.host if request.client else "unknown", ip_limit)]
+        email = await _request_email(request)
+        if email:
+            checks.append(("email", email, email_limit))
+        for kind, key, limit in checks:
+            retry_after = rate_limiter.hit(f"{route}:{kind}", key, limit)
+            if retry_after:
+                rate_limited_requests_total.inc(route, kind)
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many requests. Please try again later.",
+                    headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+                )
+
+    return check
+
+
+limit_registration = rate_limited(
+    "register", settings.rate_limit_register_ip, settings.rate_limit_register_email
+)
+limit_profile_update_link = rate_limited(
+    "profile_update_link",
+    settings.rate_limit_profile_update_link_ip,
+    settings.rate_limit_profile_update_link_email,
+)
@@ -19,3 +19,13 @@ class MemberNotApprovedError(MemberServiceError):
 class InvalidTokenError(MemberServiceError):
     """Raised when a token is invalid or expired."""
     pass
+
+
+class InvalidCursorError(MemberServiceError):
+    """Raised when a pagination cursor cannot be decoded."""
+    pass
+
+
+class SkillNotFoundError(MemberServiceError):
+    """Raised when no member lists the requested skill."""
+    pass
@@ -3,10 +3,20 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from config import settings
-from database import Base, engine
-from routers import auth, members
+from database import Base, async_engine, create_missing_indexes, engine
+from routers import auth, members, skills
+from services import metrics
+from services.email_dispatcher import EmailDispatcher
+from services.email_service_impl import create_email_service
+from services.idempotency import IdempotencyMiddleware
+from services.member_cache import member_cache
+from services.query_stats import QueryStatsMiddleware, install_query_stats
+from services.sqlite_maintenance import SQLiteMaintenance
+from utils.compression import CompressionMiddleware
+from utils.jinja2 import precompile_templates
 
 
 # Lifespan context manager for startup/shutdown events
@@ -14,8 +24,36 @@ from routers import auth, members
 async def lifespan(app: FastAPI):
     # Startup: Creates DB Tables
     Base.metadata.create_all(bind=engine)
+    create_missing_indexes(engine)
+
+    # Startup: Compile email templates once (production rendering mode)
+    precompile_templates()
+
+    # Startup: One email provider (and HTTP connection pool) for the whole process
+    email_service = create_email_service()
+    app.state.email_service = email_service
+
+    # Startup: Drain the email outbox in the background
+    dispatcher = None
+    if settings.email_dispatcher_enabled:
+        dispatcher = EmailDispatcher(email_service)
+        dispatcher.start()
+    app.state.email_dispatcher = dispatcher
+
+    # Startup: Periodic WAL checkpoint + PRAGMA optimize (SQLite only)
+    sqlite_maintenance = SQLiteMaintenance()
+    sqlite_maintenance.start()
+
     yield
-    # Shutdown:
+
+    await sqlite_maintenance.stop()
+
+    # Shutdown: Stop the dispatcher (unsent emails stay in the outbox), then close the pool
+    if dispatcher is not None:
+        await dispatcher.stop()
+    email_service.close()
+    # Shutdown: Close pooled async connections
+    await async_engine.dispose()
 
 
 # Configure logging
@@ -30,6 +68,14 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Replay responses for repeated Idempotency-Key headers (innermost: stores the
+# uncompressed body, and replays still get CORS headers and compression)
+app.add_middleware(
+    IdempotencyMiddleware,
+    ttl_seconds=settings.idempotency_ttl_seconds,
+    lock_seconds=settings.idempotency_lock_seconds,
+)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -39,9 +85,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request SQL count/time, slow query and N+1 logging
+if settings.query_stats_enabled:
+    query_stats_header = settings.query_stats_header
+    if query_stats_header is None:
+        query_stats_header = settings.app_env.lower() != "production"
+    app.add_middleware(
+        QueryStatsMiddleware,
+        repeat_threshold=settings.query_repeat_threshold,
+        header=query_stats_header,
+    )
+    install_query_stats(engine, settings.slow_query_ms)
+    install_query_stats(async_engine.sync_engine, settings.slow_query_ms)
+
+# Compress responses (negotiated br/gzip, small bodies skipped)
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+    )
+
+# Request metrics (outermost: the timing includes compression)
+if settings.metrics_enabled:
+    app.add_middleware(metrics.MetricsMiddleware)
+    metrics.install_db_metrics(engine, "sync")
+    metrics.install_db_metrics(async_engine.sync_engine, "async")
+
 # Include routers
 app.include_router(members.router)
 app.include_router(auth.router)
+app.include_router(skills.router)
 
 
 @app.get("/")
@@ -60,6 +135,20 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/cache")
+def cache_stats():
+    """Member read cache counters (hits, misses, evictions)"""
+    return member_cache.stats()
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def prometheus_metrics():
+    """Metrics in Prometheus text exposition format"""
+    return PlainTextResponse(
+        metrics.registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Maintenance commands for the member service.
+
+Usage:
+    python manage.py migrate
+    python manage.py reconcile-stats
+    python manage.py email-outbox-status
+    python manage.py requeue-dead-emails
+    python manage.py sqlite-maintenance
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from alembic import command
+from database import SessionLocal, engine, run_sqlite_maintenance
+from repositories.email_outbox_repository import EmailOutboxRepository
+from repositories.member_repository import MemberRepository
+
+logger = logging.getLogger("manage")
+
+ALEMBIC_INI = Path(__file__).parent / "alembic.ini"
+# Schema that create_all built before migrations ran on container start
+BASELINE_REVISION = "c64b54e792b2"
+
+
+def migrate() -> None:
+    """Apply Alembic migrations (container start command, before uvicorn)"""
+    config = Config(str(ALEMBIC_INI))
+    inspector = inspect(engine)
+    if inspector.has_table("member") and not inspector.has_table("alembic_version"):
+        # Created by create_all at startup and never migrated: mark it as the baseline
+        logger.info(f"Stamping unversioned database at {BASELINE_REVISION}")
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
+
+
+def reconcile_stats() -> None:
+    """Rebuild member_stat counters and skill_dictionary counts from the base tables"""
+    db = SessionLocal()
+    try:
+        repo = MemberRepository.create(db)
+        before = repo.get_stats()
+        repo.reconcile_stats()
+        after = repo.get_stats()
+        if before != after:
+            logger.warning(f"Member counters drifted and were corrected: {before} -> {after}")
+        logger.info(f"Member counters reconciled: {after}")
+    finally:
+        db.close()
+
+
+def email_outbox_status() -> None:
+    """Show how many outbox emails are pending, sent or dead"""
+    db = SessionLocal()
+    try:
+        counts = EmailOutboxRepository.create(db).count_by_status()
+        logger.info(f"Email outbox: {counts}")
+    finally:
+        db.close()
+
+
+def requeue_dead_emails() -> None:
+    """Give DEAD outbox emails a fresh retry budget"""
+    db = SessionLocal()
+    try:
+        requeued = EmailOutboxRepository.create(db).requeue_dead()
+        logger.info(f"Requeued {requeued} dead email(s)")
+    finally:
+        db.close()
+
+
+def sqlite_maintenance() -> None:
+    """Checkpoint the WAL and run PRAGMA optimize (the app also does this periodically)"""
+    run_sqlite_maintenance(engine)
+
+
+COMMANDS = {
+    "migrate": migrate,
+    "reconcile-stats": reconcile_stats,
+    "email-outbox-status": email_outbox_status,
+    "requeue-dead-emails": requeue_dead_emails,
+    "sqlite-maintenance": sqlite_maintenance,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JARAM member service maintenance commands")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    COMMANDS[args.command]()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from enum import Enum
+
+from sqlalchemy import JSON, DateTime, Index, String, Text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class EmailKind(str, Enum):
+    MAGIC_LINK = "magic_link"  # payload: {"magic_link_url": ...}
+    APPROVAL = "approval"  # payload: {"member_name": ...}
+    REJECTION = "rejection"  # payload: {"member_name": ...}
+
+
+class EmailStatus(str, Enum):
+    PENDING = "PENDING"  # 발송 대기 (재시도 포함)
+    SENT = "SENT"  # 발송 완료
+    DEAD = "DEAD"  # 재시도 한도 초과 (dead letter)
+
+
+class EmailOutbox(Base):
+    """Email waiting to be sent, written in the same transaction as the member change"""
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Dispatcher poll: WHERE status = 'PENDING' AND next_attempt_at <= now ORDER BY next_attempt_at
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    kind: Mapped[EmailKind] = mapped_column(SQLEnum(EmailKind, native_enum=False), nullable=False)
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+
+    status: Mapped[EmailStatus] = mapped_column(
+        SQLEnum(EmailStatus, native_enum=False), default=EmailStatus.PENDING, nullable=False
+    )
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class IdempotencyKey(Base):
+    """Response stored for a client's Idempotency-Key, replayed on retries
+
+    status_code is NULL while the first request is still running.
+    """
+
+    __tablename__ = "idempotency_key"
+
+    # storage_key(): sha256 of the route, the caller's credential and the client's key
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)  # sha256 of the request
+    status_code: Mapped[int | None] = mapped_column(nullable=True)
+    headers: Mapped[list | None] = mapped_column(JSON, nullable=True)  # [[name, value], ...]
+    body: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # In progress: when the reservation is abandoned. Completed: when the response is evicted.
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from enum import Enum
 
+from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,8 +22,10 @@ class Link(Base):
     __tablename__ = "member_link"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    member_id: Mapped[int] = mapped_column(ForeignKey("member.id", ondelete="CASCADE"), nullable=False)
-    link_type: Mapped[LinkType] = mapped_column(nullable=False)
+    member_id: Mapped[int] = mapped_column(
+        ForeignKey("member.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    link_type: Mapped[LinkType] = mapped_column(SQLEnum(LinkType, native_enum=False), nullable=False)
     url: Mapped[str] = mapped_column(String(500), nullable=False)
 
     # Relationship
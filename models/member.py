@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from enum import Enum
 
-from sqlalchemy import DateTime, Enum as SQLEnum, String, Text
+from sqlalchemy import DateTime, Enum as SQLEnum, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import Base
@@ -21,19 +21,32 @@ class MemberRank(str, Enum):
     PROSPECTIVE_OB = "준OB"
 
 
+# Enums are stored as VARCHAR holding the member *name* on every database
+# (native_enum=False), so migrations can add values without ALTER TYPE.
+
+
 class Member(Base):
     __tablename__ = "member"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at, id
+        Index("ix_member_created_at_id", "created_at", "id"),
+        # GET /members?status=...: seek one status, already in (created_at, id)
+        # order (SQLite appends the rowid id to every index)
+        Index("ix_member_status_created_at", "status", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     generation: Mapped[int] = mapped_column(nullable=False)  # 기수
-    rank: Mapped[MemberRank] = mapped_column(SQLEnum(MemberRank), nullable=False)
+    rank: Mapped[MemberRank] = mapped_column(
+        SQLEnum(MemberRank, native_enum=False, length=50), nullable=False
+    )
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     image_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
 
     status: Mapped[MemberStatus] = mapped_column(
-        SQLEnum(MemberStatus),
+        SQLEnum(MemberStatus, native_enum=False, length=50),
         default=MemberStatus.UNVERIFIED,
         nullable=False,
     )
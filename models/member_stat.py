@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class MemberStat(Base):
+    """Maintained member counters, one row per (dimension, bucket).
+
+    e.g. ("status", "PENDING") -> 3, ("rank", "OB") -> 12, ("generation", "41") -> 20
+    """
+
+    __tablename__ = "member_stat"
+
+    dimension: Mapped[str] = mapped_column(String(20), primary_key=True)
+    bucket: Mapped[str] = mapped_column(String(50), primary_key=True)
+    count: Mapped[int] = mapped_column(nullable=False, default=0)
@@ -1,17 +1,39 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import Base
 
 
+def canonical_skill_name(name: str) -> str:
+    """Skill dictionary key: whitespace collapsed and case-folded ("  Machine  Learning" -> "machine learning")"""
+    return " ".join(name.split()).casefold()
+
+
+def _canonical_name_default(context: DefaultExecutionContext) -> str:
+    return canonical_skill_name(context.get_current_parameters()["skill_name"])
+
+
 class Skill(Base):
     __tablename__ = "member_skill"
+    __table_args__ = (
+        # GET /skills/{name}/members: member ids for one skill straight from the index
+        Index("ix_member_skill_canonical_name_member_id", "canonical_name", "member_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    member_id: Mapped[int] = mapped_column(ForeignKey("member.id", ondelete="CASCADE"), nullable=False)
-    skill_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    # Indexed: selectin loads, diff updates and FK checks on member delete look
+    # up skills by member_id (SQLite does not index foreign keys by itself)
+    member_id: Mapped[int] = mapped_column(
+        ForeignKey("member.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    skill_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    # Filled from skill_name on every INSERT (ORM and Core executemany alike)
+    canonical_name: Mapped[str] = mapped_column(
+        String(100), nullable=False, default=_canonical_name_default
+    )
 
     # Relationship
     member: Mapped["Member"] = relationship(back_populates="skills")
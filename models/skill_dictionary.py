@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class SkillEntry(Base):
+    """One canonical skill and how many members list it.
+
+    e.g. ("machine learning", "Machine Learning") -> 7
+    """
+
+    __tablename__ = "skill_dictionary"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)  # canonical_skill_name()
+    label: Mapped[str] = mapped_column(String(100), nullable=False)  # spelling first seen
+    member_count: Mapped[int] = mapped_column(nullable=False, default=0)
@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta, timezone
+from typing import Self
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from models.email_outbox import EmailKind, EmailOutbox, EmailStatus
+
+
+class EmailOutboxRepository:
+    """
+    Transactional outbox for emails.
+
+    ``enqueue`` only adds the row to the session: the caller's commit (e.g. the
+    MemberRepository write it belongs to) makes the member change and the email
+    durable together. The dispatcher methods commit on their own.
+    """
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    @classmethod
+    def create(cls, db: Session) -> Self:
+        return cls(db)
+
+    def enqueue(self, kind: EmailKind, recipient: str, **payload: str) -> EmailOutbox:
+        """Add an email to the outbox (does not commit)"""
+        email = EmailOutbox(kind=kind, recipient=recipient, payload=payload)
+        self.db.add(email)
+        return email
+
+    def claim_due(
+        self, limit: int, lease_seconds: float, window_seconds: float = 0.0
+    ) -> list[EmailOutbox]:
+        """
+        Claim up to ``limit`` due PENDING emails and commit.
+
+        Claiming pushes next_attempt_at forward by the lease, so another
+        dispatcher skips these rows and, if this process dies mid-send, they
+        become due again once the lease expires (at-least-once delivery).
+
+        Coalescing: fewer than ``limit`` due emails are only claimed once the
+        oldest of them has been due for ``window_seconds``, so bursts go out
+        as one batch instead of many small ones.
+        """
+        now = datetime.now(timezone.utc)
+        candidates = self.db.execute(
+            select(EmailOutbox.id, EmailOutbox.next_attempt_at)
+            .where(EmailOutbox.status == EmailStatus.PENDING, EmailOutbox.next_attempt_at <= now)
+            .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+            .limit(limit)
+        ).all()
+        if not candidates:
+            return []
+        if len(candidates) < limit and window_seconds > 0:
+            oldest_due = candidates[0].next_attempt_at
+            if oldest_due.tzinfo is None:  # SQLite drops the offset
+                oldest_due = oldest_due.replace(tzinfo=timezone.utc)
+            if now - oldest_due < timedelta(seconds=window_seconds):
+                self.db.rollback()
+                return []
+        candidate_ids = [candidate.id for candidate in candidates]
+
+        # One conditional UPDATE for the whole batch: a row another dispatcher
+        # claimed in the meantime no longer matches and is skipped
+        lease_until = now + timedelta(seconds=lease_seconds)
+        claim = (
+            update(EmailOutbox)
+            .where(
+                EmailOutbox.id.in_(candidate_ids),
+                EmailOutbox.status == EmailStatus.PENDING,
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .values(next_attempt_at=lease_until, attempts=EmailOutbox.attempts + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if self.db.get_bind().dialect.update_returning:
+            # SQLite >= 3.35 and PostgreSQL
+            claimed_ids = list(self.db.execute(claim.returning(EmailOutbox.id)).scalars())
+        else:
+            self.db.execute(claim)
+            # Rows this call claimed carry its lease (another claim sets a later one)
+            claimed_ids = list(
+                self.db.execute(
+                    select(EmailOutbox.id).where(
+                        EmailOutbox.id.in_(candidate_ids),
+                        EmailOutbox.next_attempt_at == lease_until,
+                    )
+                ).scalars()
+            )
+        self.db.commit()
+
+        if not claimed_ids:
+            return []
+        return list(
+            self.db.execute(
+                select(EmailOutbox).where(EmailOutbox.id.in_(claimed_ids)).order_by(EmailOutbox.id)
+            ).scalars()
+        )
+
+    def mark_sent(self, emails: list[EmailOutbox]) -> None:
+        """Mark emails as delivered (one commit)"""
+        if not emails:
+            return
+        self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_([email.id for email in emails]))
+            .values(status=EmailStatus.SENT, sent_at=datetime.now(timezone.utc), last_error=None)
+        )
+        self.db.commit()
+
+    def mark_failed(self, email: EmailOutbox, error: str, retry_at: datetime | None) -> None:
+        """Schedule a retry at ``retry_at``, or move to DEAD when it is None"""
+        email.last_error = error[:2000]
+        if retry_at is None:
+            email.status = EmailStatus.DEAD
+        else:
+            email.next_attempt_at = retry_at
+        self.db.commit()
+
+    def count_by_status(self) -> dict[str, int]:
+        """Number of outbox rows per status"""
+        rows = self.db.execute(
+            select(EmailOutbox.status, func.count()).group_by(EmailOutbox.status)
+        )
+        counts = {status.value: 0 for status in EmailStatus}
+        counts.update({status.value: count for status, count in rows})
+        return counts
+
+    def requeue_dead(self) -> int:
+        """Move every DEAD email back to PENDING with a fresh attempt budget"""
+        result = self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.status == EmailStatus.DEAD)
+            .values(
+                status=EmailStatus.PENDING,
+                attempts=0,
+                next_attempt_at=datetime.now(timezone.utc),
+            )
+        )
+        self.db.commit()
+        return result.rowcount
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta, timezone
+from typing import Self
+
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models.idempotency_key import IdempotencyKey
+
+
+class IdempotencyRepository:
+    """
+    Idempotency-Key reservations and stored responses.
+
+    ``reserve`` claims a key before the request runs, so a concurrent retry
+    with the same key sees it in progress instead of running the request a
+    second time. Expired rows (stored responses past their TTL, and
+    reservations abandoned by a crashed process) are deleted on the way.
+    Every method commits.
+    """
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    @classmethod
+    def create(cls, db: Session) -> Self:
+        return cls(db)
+
+    def reserve(self, key: str, fingerprint: str, lock_seconds: float) -> IdempotencyKey | None:
+        """Claim ``key``; returns the existing row instead if it is already taken"""
+        now = datetime.now(timezone.utc)
+        self.db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= now))
+        existing = self.db.get(IdempotencyKey, key)
+        if existing is None:
+            self.db.add(
+                IdempotencyKey(
+                    key=key,
+                    fingerprint=fingerprint,
+                    created_at=now,
+                    expires_at=now + timedelta(seconds=lock_seconds),
+                )
+            )
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # Another request reserved the key between our read and insert
+            self.db.rollback()
+            existing = self.db.get(IdempotencyKey, key)
+        return existing
+
+    def complete(
+        self,
+        key: str,
+        status_code: int,
+        headers: list[list[str]],
+        body: bytes,
+        ttl_seconds: float,
+    ) -> None:
+        """Store the response for replay until the TTL passes"""
+        self.db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key == key)
+            .values(
+                status_code=status_code,
+                headers=headers,
+                body=body,
+                expires_at=datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds),
+            )
+        )
+        self.db.commit()
+
+    def release(self, key: str) -> None:
+        """Drop an unfinished reservation so the client can retry with the same key"""
+        self.db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.key == key, IdempotencyKey.status_code.is_(None)
+            )
+        )
+        self.db.commit()
@@ -0,0 +1,102 @@
+"""Read-only member records for list endpoints.
+
+List pages do not need ORM instances: they are never modified, so identity-map
+bookkeeping, change tracking and the ``from_attributes`` round trip through
+MemberResponse are pure overhead. ``load`` runs a Core select of the member
+columns plus one query each for skills and links, groups them into
+``__slots__`` dataclasses in one pass, and the records go straight to
+``pydantic_core.to_json`` (see utils.responses.PydanticJSONResponse).
+
+Field names and order match MemberResponse, so the JSON is identical.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import Row, Select, select
+from sqlalchemy.orm import Session
+
+from models.link import Link, LinkType
+from models.member import Member, MemberRank, MemberStatus
+from models.skill import Skill
+
+
+@dataclass(slots=True)
+class SkillRecord:
+    id: int
+    skill_name: str
+
+
+@dataclass(slots=True)
+class LinkRecord:
+    id: int
+    link_type: LinkType
+    url: str
+
+
+@dataclass(slots=True)
+class MemberRecord:
+    email: str
+    name: str
+    generation: int
+    rank: MemberRank
+    description: str | None
+    id: int
+    status: MemberStatus
+    image_url: str | None
+    created_at: datetime
+    updated_at: datetime
+    skills: list[SkillRecord] = field(default_factory=list)
+    links: list[LinkRecord] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class MemberRecordPage:
+    """Same JSON shape as MemberPage"""
+
+    items: list[MemberRecord]
+    next_cursor: str | None = None
+
+
+# Selected in MemberRecord field order: rows unpack straight into the constructor
+MEMBER_COLUMNS = (
+    Member.email,
+    Member.name,
+    Member.generation,
+    Member.rank,
+    Member.description,
+    Member.id,
+    Member.status,
+    Member.image_url,
+    Member.created_at,
+    Member.updated_at,
+)
+
+
+def select_members() -> Select:
+    """Core select of the member columns, to be filtered and ordered by the caller"""
+    return select(*MEMBER_COLUMNS)
+
+
+def load(db: Session, rows: Sequence[Row]) -> list[MemberRecord]:
+    """Records for rows of ``select_members()``, with skills and links (two more queries)"""
+    records = [MemberRecord(*row) for row in rows]
+    if not records:
+        return records
+    by_id = {record.id: record for record in records}
+    ids = list(by_id)
+
+    for member_id, skill_id, skill_name in db.execute(
+        select(Skill.member_id, Skill.id, Skill.skill_name)
+        .where(Skill.member_id.in_(ids))
+        .order_by(Skill.id)
+    ):
+        by_id[member_id].skills.append(SkillRecord(skill_id, skill_name))
+    for member_id, link_id, link_type, url in db.execute(
+        select(Link.member_id, Link.id, Link.link_type, Link.url)
+        .where(Link.member_id.in_(ids))
+        .order_by(Link.id)
+    ):
+        by_id[member_id].links.append(LinkRecord(link_id, link_type, url))
+    return records
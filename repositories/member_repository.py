@@ -1,13 +1,17 @@
+from collections import Counter
+from collections.abc import Sequence
+from datetime import datetime, timezone
 from typing import Self
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, delete, func, insert, inspect, or_, select, tuple_, update
 from sqlalchemy.orm import Session
 
-from models.link import Link
+from models.link import Link, LinkType
 from models.member import Member, MemberStatus
-from models.skill import Skill
-from schemas.member import MemberCreate, MemberUpdate
+from models.skill import Skill, canonical_skill_name
+from repositories import member_records, member_search_index, member_stats, skill_dictionary
+from repositories.member_records import MemberRecord
+from schemas.member import MemberCreate, MemberImportRow, MemberUpdate, SortOrder
 
 
 class MemberRepository:
@@ -43,6 +47,24 @@ class MemberRepository:
             link = Link(member_id=db_member.id, link_type=link_data.link_type, url=link_data.url)
             self.db.add(link)
 
+        member_search_index.index_member(
+            self.db,
+            db_member.id,
+            db_member.name,
+            db_member.email,
+            db_member.description,
+            [skill_data.skill_name for skill_data in member_data.skills],
+        )
+        member_stats.apply(
+            self.db, member_stats.member_deltas([db_member]), member_stats.version_delta()
+        )
+        skill_names = [skill_data.skill_name for skill_data in member_data.skills]
+        skill_dictionary.apply(
+            self.db,
+            skill_dictionary.member_deltas(after=skill_names),
+            labels=skill_dictionary.labels(skill_names),
+        )
+
         self.db.commit()
         self.db.refresh(db_member)
         return db_member
@@ -55,15 +77,144 @@ class MemberRepository:
         """Get member by email"""
         return self.db.query(Member).filter(Member.email == email).first()
 
-    def get_all_members(self, status: MemberStatus | None = None) -> list[Member]:
-        """Get all members, optionally filtered by status"""
-        query = self.db.query(Member)
+    def get_member_updated_at(self, member_id: int) -> datetime | None:
+        """Get only a member's updated_at (for ETag checks without loading the member)"""
+        return self.db.execute(select(Member.updated_at).where(Member.id == member_id)).scalar()
+
+    def get_change_version(self) -> int:
+        """Get the version number bumped by every member write"""
+        return member_stats.read_version(self.db)
+
+    def get_members_page(
+        self,
+        status: MemberStatus | None = None,
+        limit: int = 50,
+        after: tuple[datetime, int] | None = None,
+        order: SortOrder = SortOrder.ASC,
+        skill: str | None = None,
+    ) -> tuple[list[MemberRecord], tuple[datetime, int] | None]:
+        """
+        Get one page of members ordered by (created_at, id) using keyset pagination.
+
+        Seeks past the ``after`` position instead of using OFFSET, so every page
+        costs the same regardless of how deep into the table it is. ``skill``
+        (any spelling) keeps only members listing that skill, found through the
+        (canonical_name, member_id) index. Returns read-only records, not ORM
+        members (see repositories.member_records).
+
+        Returns:
+            (members, next_key) - next_key is None when there are no more rows
+        """
+        query = member_records.select_members()
+        if status:
+            query = query.where(Member.status == status)
+        if skill is not None:
+            query = query.where(
+                Member.id.in_(
+                    select(Skill.member_id).where(
+                        Skill.canonical_name == canonical_skill_name(skill)
+                    )
+                )
+            )
+
+        key = tuple_(Member.created_at, Member.id)
+        if order == SortOrder.DESC:
+            if after is not None:
+                query = query.where(key < tuple_(*after))
+            query = query.order_by(Member.created_at.desc(), Member.id.desc())
+        else:
+            if after is not None:
+                query = query.where(key > tuple_(*after))
+            query = query.order_by(Member.created_at.asc(), Member.id.asc())
+
+        # Fetch one extra row to know whether another page exists
+        rows = self.db.execute(query.limit(limit + 1)).all()
+        members = member_records.load(self.db, rows[:limit])
+        if len(rows) <= limit:
+            return members, None
+
+        last = members[-1]
+        return members, (last.created_at, last.id)
+
+    def get_members_by_status(self, status: MemberStatus) -> list[MemberRecord]:
+        """All members with ``status`` as read-only records, ordered by (created_at, id)"""
+        rows = self.db.execute(
+            member_records.select_members()
+            .where(Member.status == status)
+            .order_by(Member.created_at, Member.id)
+        ).all()
+        return member_records.load(self.db, rows)
+
+    def search_members(
+        self,
+        query: str,
+        status: MemberStatus | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[Member], bool]:
+        """
+        Full-text search over name, email, description and skill names.
+
+        Uses the FTS5 trigram index on SQLite (substring match, ranked by
+        bm25), and for terms of one or two characters the short-term table
+        over names and skills, so the cost depends on the number of matches
+        rather than the table size. Other databases fall back to a
+        case-insensitive substring match ordered by name.
+
+        Returns:
+            (members, has_more)
+        """
+        if member_search_index.is_supported(self.db):
+            ids = member_search_index.search_ids(
+                self.db, query, status.name if status else None, limit + 1, offset
+            )
+            has_more = len(ids) > limit
+            ids = ids[:limit]
+            members_by_id = {
+                member.id: member
+                for member in self.db.query(Member).filter(Member.id.in_(ids)).all()
+            }
+            return [members_by_id[i] for i in ids if i in members_by_id], has_more
+
+        pattern = f"%{query.strip()}%"
+        db_query = self.db.query(Member).filter(
+            or_(
+                Member.name.ilike(pattern),
+                Member.email.ilike(pattern),
+                Member.description.ilike(pattern),
+                Member.skills.any(Skill.skill_name.ilike(pattern)),
+            )
+        )
         if status:
-            query = query.filter(Member.status == status)
-        return query.all()
+            db_query = db_query.filter(Member.status == status)
+        members = db_query.order_by(Member.name, Member.id).offset(offset).limit(limit + 1).all()
+        return members[:limit], len(members) > limit
+
+    @staticmethod
+    def _diff_rows(existing: dict[int, tuple], incoming: list[tuple]) -> tuple[list[int], list[tuple]]:
+        """
+        Multiset difference between existing rows {id: key} and incoming keys.
+
+        Returns:
+            (ids to delete, keys to insert) - both empty when nothing changed
+        """
+        to_insert = Counter(incoming)
+        to_delete = []
+        for row_id, key in existing.items():
+            if to_insert[key] > 0:
+                to_insert[key] -= 1  # unchanged row: keep it (and its id)
+            else:
+                to_delete.append(row_id)
+        return to_delete, list(to_insert.elements())
 
     def update_member(self, member: Member, update_data: MemberUpdate) -> Member:
-        """Update member data"""
+        """
+        Update member data.
+
+        Skills and links are diffed against the current rows: only removed rows
+        are deleted and only new ones inserted (one executemany). When nothing
+        changes, no SQL is written at all.
+        """
         if update_data.name is not None:
             member.name = update_data.name
         # rank, email, generation cannot be updated
@@ -71,31 +222,228 @@ class MemberRepository:
             member.description = update_data.description
         if update_data.image_url is not None:
             member.image_url = update_data.image_url
+        attrs = inspect(member).attrs
+        profile_changed = any(
+            attrs[attr].history.has_changes() for attr in ("name", "description", "image_url")
+        )
+        search_changed = attrs.name.history.has_changes() or attrs.description.history.has_changes()
 
-        # Update skills if provided
+        skills_changed = False
         if update_data.skills is not None:
-            # Delete existing skills
-            self.db.query(Skill).filter(Skill.member_id == member.id).delete()
-            # Add new skills
-            for skill_data in update_data.skills:
-                skill = Skill(member_id=member.id, skill_name=skill_data.skill_name)
-                self.db.add(skill)
-
-        # Update links if provided
+            old_skill_names = [skill.skill_name for skill in member.skills]
+            delete_ids, new_skills = self._diff_rows(
+                {skill.id: (skill.skill_name,) for skill in member.skills},
+                [(skill_data.skill_name,) for skill_data in update_data.skills],
+            )
+            if delete_ids:
+                self.db.execute(delete(Skill).where(Skill.id.in_(delete_ids)))
+            if new_skills:
+                self.db.execute(
+                    insert(Skill),
+                    [{"member_id": member.id, "skill_name": name} for (name,) in new_skills],
+                )
+            skills_changed = bool(delete_ids or new_skills)
+            if skills_changed:
+                new_skill_names = [skill_data.skill_name for skill_data in update_data.skills]
+                skill_dictionary.apply(
+                    self.db,
+                    skill_dictionary.member_deltas(old_skill_names, new_skill_names),
+                    labels=skill_dictionary.labels(new_skill_names),
+                )
+
+        links_changed = False
         if update_data.links is not None:
-            # Delete existing links
-            self.db.query(Link).filter(Link.member_id == member.id).delete()
-            # Add new links
-            for link_data in update_data.links:
-                link = Link(member_id=member.id, link_type=link_data.link_type, url=link_data.url)
-                self.db.add(link)
+            delete_ids, new_links = self._diff_rows(
+                {link.id: (link.link_type, link.url) for link in member.links},
+                [(link_data.link_type, link_data.url) for link_data in update_data.links],
+            )
+            if delete_ids:
+                self.db.execute(delete(Link).where(Link.id.in_(delete_ids)))
+            if new_links:
+                self.db.execute(
+                    insert(Link),
+                    [
+                        {"member_id": member.id, "link_type": link_type, "url": url}
+                        for link_type, url in new_links
+                    ],
+                )
+            links_changed = bool(delete_ids or new_links)
+
+        if not (profile_changed or skills_changed or links_changed):
+            return member
+
+        if search_changed or skills_changed:
+            if update_data.skills is not None:
+                skill_names = [skill_data.skill_name for skill_data in update_data.skills]
+            else:
+                skill_names = [skill.skill_name for skill in member.skills]
+            member_search_index.index_member(
+                self.db, member.id, member.name, member.email, member.description, skill_names
+            )
+        # Skill/link changes do not touch member columns, so bump updated_at explicitly
+        member.updated_at = datetime.now(timezone.utc)
+        member_stats.apply(self.db, member_stats.version_delta())
 
         self.db.commit()
         self.db.refresh(member)
         return member
 
+    def get_member_summaries(self, member_ids: Sequence[int]) -> dict[int, Row]:
+        """
+        Get (id, email, name, status, rank, generation) for many members in one
+        query, without loading ORM objects or their skills/links.
+        """
+        rows = self.db.execute(
+            select(
+                Member.id, Member.email, Member.name, Member.status, Member.rank, Member.generation
+            ).where(Member.id.in_(member_ids))
+        )
+        return {row.id: row for row in rows}
+
+    def bulk_update_status(self, members: Sequence[Row], status: MemberStatus) -> None:
+        """Move many members to ``status`` with one UPDATE and one commit"""
+        if not members:
+            return
+        deltas = [member_stats.status_deltas(member.status, status) for member in members]
+        self.db.execute(
+            update(Member)
+            .where(Member.id.in_([member.id for member in members]))
+            .values(status=status, updated_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        member_stats.apply(self.db, *deltas, member_stats.version_delta())
+        self.db.commit()
+
+    def bulk_delete(self, members: Sequence[Row]) -> None:
+        """Delete many members (and their skills, links, search rows) in one commit"""
+        if not members:
+            return
+        ids = [member.id for member in members]
+        removed_skills = Counter(
+            {
+                name: -count
+                for name, count in self.db.execute(
+                    select(Skill.canonical_name, func.count(Skill.member_id.distinct()))
+                    .where(Skill.member_id.in_(ids))
+                    .group_by(Skill.canonical_name)
+                )
+            }
+        )
+        self.db.execute(delete(Skill).where(Skill.member_id.in_(ids)))
+        self.db.execute(delete(Link).where(Link.member_id.in_(ids)))
+        member_search_index.remove_members(self.db, ids)
+        self.db.execute(
+            delete(Member).where(Member.id.in_(ids)).execution_options(synchronize_session=False)
+        )
+        member_stats.apply(
+            self.db, member_stats.member_deltas(members, sign=-1), member_stats.version_delta()
+        )
+        skill_dictionary.apply(self.db, removed_skills)
+        self.db.commit()
+
+    def get_existing_emails(self, emails: Sequence[str]) -> set[str]:
+        """Return the subset of ``emails`` that already belong to a member"""
+        if not emails:
+            return set()
+        return set(self.db.execute(select(Member.email).where(Member.email.in_(emails))).scalars())
+
+    def get_skills_and_links(
+        self, member_ids: Sequence[int]
+    ) -> tuple[dict[int, list[str]], dict[int, list[tuple[LinkType, str]]]]:
+        """Skill names and (link_type, url) pairs for many members, two queries in total"""
+        skills: dict[int, list[str]] = {member_id: [] for member_id in member_ids}
+        links: dict[int, list[tuple[LinkType, str]]] = {member_id: [] for member_id in member_ids}
+        if not member_ids:
+            return skills, links
+        for member_id, skill_name in self.db.execute(
+            select(Skill.member_id, Skill.skill_name)
+            .where(Skill.member_id.in_(member_ids))
+            .order_by(Skill.id)
+        ):
+            skills[member_id].append(skill_name)
+        for member_id, link_type, url in self.db.execute(
+            select(Link.member_id, Link.link_type, Link.url)
+            .where(Link.member_id.in_(member_ids))
+            .order_by(Link.id)
+        ):
+            links[member_id].append((link_type, url))
+        return skills, links
+
+    def bulk_add_members(self, members: Sequence[MemberImportRow]) -> None:
+        """
+        Insert many members with their skills, links and search rows in one commit.
+
+        Members, skills and links are each one executemany INSERT. The caller
+        checks emails for duplicates first (see get_existing_emails).
+        """
+        if not members:
+            return
+        now = datetime.now(timezone.utc)
+        inserted = self.db.execute(
+            insert(Member).returning(Member.id, Member.email),
+            [
+                {
+                    "email": member.email,
+                    "name": member.name,
+                    "generation": member.generation,
+                    "rank": member.rank,
+                    "description": member.description,
+                    "image_url": member.image_url,
+                    "status": member.status,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for member in members
+            ],
+        )
+        # RETURNING order is not guaranteed across batched rows: match on email
+        ids_by_email = {row.email: row.id for row in inserted}
+        ids = [ids_by_email[member.email] for member in members]
+
+        skill_rows = [
+            {"member_id": member_id, "skill_name": skill.skill_name}
+            for member_id, member in zip(ids, members)
+            for skill in member.skills
+        ]
+        if skill_rows:
+            self.db.execute(insert(Skill), skill_rows)
+        link_rows = [
+            {"member_id": member_id, "link_type": link.link_type, "url": link.url}
+            for member_id, member in zip(ids, members)
+            for link in member.links
+        ]
+        if link_rows:
+            self.db.execute(insert(Link), link_rows)
+
+        member_search_index.index_new_members(
+            self.db,
+            [
+                (
+                    member_id,
+                    member.name,
+                    member.email,
+                    member.description,
+                    [skill.skill_name for skill in member.skills],
+                )
+                for member_id, member in zip(ids, members)
+            ],
+        )
+        member_stats.apply(
+            self.db, member_stats.member_deltas(members), member_stats.version_delta()
+        )
+        skill_names = [[skill.skill_name for skill in member.skills] for member in members]
+        skill_dictionary.apply(
+            self.db,
+            *(skill_dictionary.member_deltas(after=names) for names in skill_names),
+            labels=skill_dictionary.labels(name for names in skill_names for name in names),
+        )
+        self.db.commit()
+
     def update_member_status(self, member: Member, status: MemberStatus) -> Member:
         """Update member status (for admin approval/rejection)"""
+        member_stats.apply(
+            self.db, member_stats.status_deltas(member.status, status), member_stats.version_delta()
+        )
         member.status = status
         self.db.commit()
         self.db.refresh(member)
@@ -103,5 +451,23 @@ class MemberRepository:
 
     def delete_member(self, member: Member) -> None:
         """Delete a member"""
+        member_search_index.remove_member(self.db, member.id)
+        member_stats.apply(
+            self.db, member_stats.member_deltas([member], sign=-1), member_stats.version_delta()
+        )
+        skill_dictionary.apply(
+            self.db,
+            skill_dictionary.member_deltas(before=[skill.skill_name for skill in member.skills]),
+        )
         self.db.delete(member)
         self.db.commit()
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """Get maintained member counters by status, rank and generation"""
+        return member_stats.read(self.db)
+
+    def reconcile_stats(self) -> None:
+        """Rebuild member counters and skill counts from the base tables"""
+        member_stats.rebuild(self.db)
+        skill_dictionary.rebuild(self.db)
+        self.db.commit()
@@ -0,0 +1,298 @@
+"""SQLite FTS5 index over member name, email, description and skill names.
+
+The index is an FTS5 virtual table keyed by ``rowid = member.id``. It uses the
+trigram tokenizer, so a term matches anywhere inside a word: "러스트" finds
+"김러스트" (Korean names are not split into given and family name).
+
+Terms of one or two characters (a two-syllable given name such as "민수") have
+no trigram. They are looked up in ``member_search_gram`` instead, an ordinary
+table holding every one- and two-character substring of each member's name and
+skill names. A short term therefore matches names and skills only, not email or
+description, where a substring that short would match nearly every member.
+
+Both tables are kept in sync by MemberRepository's write paths (in the same
+transaction) rather than by triggers, because they aggregate rows from
+``member_skill``.
+
+On non-SQLite databases the index is disabled and MemberRepository falls back
+to a plain ILIKE search.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from sqlalchemy import bindparam, event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from database import Base
+
+SEARCH_TABLE = "member_search"
+
+SHORT_TERM_TABLE = "member_search_gram"
+
+# Shortest term the trigram tokenizer can match; shorter ones use SHORT_TERM_TABLE
+MIN_TRIGRAM_TERM = 3
+
+CREATE_SEARCH_TABLE = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        name, email, description, skills,
+        tokenize = 'trigram'
+    )
+"""
+
+CREATE_SHORT_TERM_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {SHORT_TERM_TABLE} (
+        gram TEXT NOT NULL,
+        member_id INTEGER NOT NULL,
+        PRIMARY KEY (gram, member_id)
+    ) WITHOUT ROWID
+"""
+
+CREATE_SHORT_TERM_INDEX = f"""
+    CREATE INDEX IF NOT EXISTS ix_{SHORT_TERM_TABLE}_member_id
+    ON {SHORT_TERM_TABLE} (member_id)
+"""
+
+# Populate every row from the base tables (backfill for existing databases)
+BACKFILL_SEARCH_TABLE = f"""
+    INSERT INTO {SEARCH_TABLE} (rowid, name, email, description, skills)
+    SELECT m.id, m.name, m.email, COALESCE(m.description, ''),
+           COALESCE((SELECT group_concat(s.skill_name, ' ')
+                     FROM member_skill s WHERE s.member_id = m.id), '')
+    FROM member m
+"""
+
+
+def is_supported(bind: Session | Connection) -> bool:
+    """FTS5 is only available on SQLite"""
+    dialect = bind.get_bind().dialect if isinstance(bind, Session) else bind.dialect
+    return dialect.name == "sqlite"
+
+
+def split_terms(query: str) -> tuple[list[str], list[str]]:
+    """
+    Split free text into (terms the trigram index can match, shorter terms).
+
+    Terms of fewer than three characters (e.g. a two-syllable given name) have
+    no trigram, so they are looked up in SHORT_TERM_TABLE instead.
+    """
+    terms = [term for term in query.split() if term.strip('"')]
+    return (
+        [term for term in terms if len(term) >= MIN_TRIGRAM_TERM],
+        [term for term in terms if len(term) < MIN_TRIGRAM_TERM],
+    )
+
+
+def build_match_query(terms: list[str]) -> str | None:
+    """
+    Turn terms into a safe FTS5 MATCH expression.
+
+    Each term becomes a quoted phrase so user input can never be parsed as FTS5
+    syntax; with the trigram tokenizer a phrase matches as a substring. Terms
+    are ANDed.
+
+    Returns:
+        MATCH expression, or None if there are no terms
+    """
+    if not terms:
+        return None
+    return " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+def search_ids(
+    db: Session,
+    query: str,
+    status: str | None,
+    limit: int,
+    offset: int,
+) -> list[int]:
+    """
+    Return member ids matching every term of ``query``.
+
+    Results are ranked by bm25 when the query has a term of three or more
+    characters, otherwise ordered by member id. Either way the statement is
+    driven by an index lookup, so its cost follows the number of matches.
+    """
+    long_terms, short_terms = split_terms(query)
+    match = build_match_query(long_terms)
+    if match is None and not short_terms:
+        return []
+
+    params: dict[str, object] = {"status": status, "limit": limit, "offset": offset}
+    params.update({f"gram_{i}": term.lower() for i, term in enumerate(short_terms)})
+    if match is not None:
+        source, id_column, order = f"{SEARCH_TABLE} s", "s.rowid", "s.rank"
+        conditions = [f"s.{SEARCH_TABLE} MATCH :match"]
+        params["match"] = match
+        lookups = range(len(short_terms))
+    else:
+        source, id_column, order = f"{SHORT_TERM_TABLE} g", "g.member_id", "g.member_id"
+        conditions = ["g.gram = :gram_0"]
+        lookups = range(1, len(short_terms))
+    conditions.extend(
+        f"{id_column} IN (SELECT member_id FROM {SHORT_TERM_TABLE} WHERE gram = :gram_{i})"
+        for i in lookups
+    )
+    if status:
+        conditions.append("m.status = :status")
+    rows = db.execute(
+        text(
+            f"SELECT {id_column} FROM {source} "
+            f"JOIN member m ON m.id = {id_column} "
+            f"WHERE {' AND '.join(conditions)} "
+            f"ORDER BY {order} LIMIT :limit OFFSET :offset"
+        ),
+        params,
+    )
+    return [row[0] for row in rows]
+
+
+def short_grams(name: str, skill_names: Iterable[str]) -> set[str]:
+    """Every one- and two-character substring of the name and skill names, lowercased"""
+    grams = set()
+    for value in (name, *skill_names):
+        value = value.lower()
+        for size in (1, 2):
+            grams.update(value[i : i + size] for i in range(len(value) - size + 1))
+    return {gram for gram in grams if not any(char.isspace() for char in gram)}
+
+
+def _insert_short_grams(
+    db: Session | Connection, members: Iterable[tuple[int, str, Iterable[str]]]
+) -> None:
+    """One executemany for the grams of (member_id, name, skill_names) tuples"""
+    rows = [
+        {"gram": gram, "member_id": member_id}
+        for member_id, name, skill_names in members
+        for gram in short_grams(name, skill_names)
+    ]
+    if rows:
+        db.execute(
+            text(f"INSERT INTO {SHORT_TERM_TABLE} (gram, member_id) VALUES (:gram, :member_id)"),
+            rows,
+        )
+
+
+def index_member(
+    db: Session,
+    member_id: int,
+    name: str,
+    email: str,
+    description: str | None,
+    skill_names: Iterable[str],
+) -> None:
+    """Insert or replace the search row for a member (does not commit)"""
+    if not is_supported(db):
+        return
+    skill_names = list(skill_names)
+    db.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :id"), {"id": member_id})
+    db.execute(text(f"DELETE FROM {SHORT_TERM_TABLE} WHERE member_id = :id"), {"id": member_id})
+    db.execute(
+        text(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, name, email, description, skills) "
+            "VALUES (:id, :name, :email, :description, :skills)"
+        ),
+        {
+            "id": member_id,
+            "name": name,
+            "email": email,
+            "description": description or "",
+            "skills": " ".join(skill_names),
+        },
+    )
+    _insert_short_grams(db, [(member_id, name, skill_names)])
+
+
+def index_new_members(
+    db: Session,
+    members: Iterable[tuple[int, str, str, str | None, Iterable[str]]],
+) -> None:
+    """
+    Insert search rows for members that have none yet, as one executemany
+    (does not commit).
+
+    Args:
+        members: (member_id, name, email, description, skill_names) tuples
+    """
+    if not is_supported(db):
+        return
+    members = [
+        (member_id, name, email, description, list(skill_names))
+        for member_id, name, email, description, skill_names in members
+    ]
+    rows = [
+        {
+            "id": member_id,
+            "name": name,
+            "email": email,
+            "description": description or "",
+            "skills": " ".join(skill_names),
+        }
+        for member_id, name, email, description, skill_names in members
+    ]
+    if not rows:
+        return
+    db.execute(
+        text(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, name, email, description, skills) "
+            "VALUES (:id, :name, :email, :description, :skills)"
+        ),
+        rows,
+    )
+    _insert_short_grams(
+        db, [(member_id, name, skill_names) for member_id, name, _, _, skill_names in members]
+    )
+
+
+def remove_member(db: Session, member_id: int) -> None:
+    """Delete the search row for a member (does not commit)"""
+    remove_members(db, [member_id])
+
+
+def remove_members(db: Session, member_ids: list[int]) -> None:
+    """Delete the search rows for many members in one statement (does not commit)"""
+    if not member_ids or not is_supported(db):
+        return
+    for statement in (
+        f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN :ids",
+        f"DELETE FROM {SHORT_TERM_TABLE} WHERE member_id IN :ids",
+    ):
+        db.execute(
+            text(statement).bindparams(bindparam("ids", expanding=True)),
+            {"ids": list(member_ids)},
+        )
+
+
+def _backfill_short_grams(connection: Connection) -> None:
+    skills: dict[int, list[str]] = defaultdict(list)
+    for member_id, skill_name in connection.execute(
+        text("SELECT member_id, skill_name FROM member_skill")
+    ):
+        skills[member_id].append(skill_name)
+    members = connection.execute(text("SELECT id, name FROM member")).all()
+    _insert_short_grams(connection, [(id_, name, skills[id_]) for id_, name in members])
+
+
+def _table_exists(connection: Connection, name: str) -> bool:
+    return (
+        connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": name},
+        ).first()
+        is not None
+    )
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_table(target, connection: Connection, **kw) -> None:
+    """Create (and backfill) the FTS5 and short-term tables whenever create_all runs"""
+    if not is_supported(connection):
+        return
+    if not _table_exists(connection, SEARCH_TABLE):
+        connection.execute(text(CREATE_SEARCH_TABLE))
+        connection.execute(text(BACKFILL_SEARCH_TABLE))
+    if not _table_exists(connection, SHORT_TERM_TABLE):
+        connection.execute(text(CREATE_SHORT_TERM_TABLE))
+        connection.execute(text(CREATE_SHORT_TERM_INDEX))
+        _backfill_short_grams(connection)
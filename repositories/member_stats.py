@@ -0,0 +1,141 @@
+"""Maintained member counters by status, rank and generation.
+
+MemberRepository applies counter deltas in the same transaction as the member
+write that caused them, so ``GET /members/stats`` reads a handful of rows
+instead of scanning the member table. ``rebuild`` recomputes every counter from
+the base tables (``python manage.py reconcile-stats``).
+
+The same table also holds a change version (``version``/``member``) that every
+member write increments; it backs the ETag of ``GET /members``.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+
+from sqlalchemy import delete, event, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from database import Base
+from models.member import Member, MemberStatus
+from models.member_stat import MemberStat
+
+STATUS = "status"
+RANK = "rank"
+GENERATION = "generation"
+DIMENSIONS = (STATUS, RANK, GENERATION)
+
+VERSION = "version"
+MEMBER_VERSION = (VERSION, "member")
+
+
+def version_delta() -> Counter[tuple[str, str]]:
+    """Delta that marks the member table as changed"""
+    return Counter({MEMBER_VERSION: 1})
+
+
+def member_deltas(members: Iterable[Member], sign: int = 1) -> Counter[tuple[str, str]]:
+    """Counter deltas for adding (sign=1) or removing (sign=-1) members"""
+    deltas: Counter[tuple[str, str]] = Counter()
+    for member in members:
+        deltas[(STATUS, member.status.value)] += sign
+        deltas[(RANK, member.rank.value)] += sign
+        deltas[(GENERATION, str(member.generation))] += sign
+    return deltas
+
+
+def status_deltas(
+    old: MemberStatus, new: MemberStatus, count: int = 1
+) -> Counter[tuple[str, str]]:
+    """Counter deltas for moving ``count`` members from one status to another"""
+    if old == new:
+        return Counter()
+    return Counter({(STATUS, old.value): -count, (STATUS, new.value): count})
+
+
+def apply(db: Session | Connection, *deltas: Counter[tuple[str, str]]) -> None:
+    """
+    Add deltas to the counters in a single upsert (does not commit).
+
+    Args:
+        deltas: one or more {(dimension, bucket): delta} counters, summed
+    """
+    # Counter.update keeps negative values (unlike ``+``)
+    merged: Counter[tuple[str, str]] = Counter()
+    for delta in deltas:
+        merged.update(delta)
+    rows = [
+        {"dimension": dimension, "bucket": bucket, "count": delta}
+        for (dimension, bucket), delta in merged.items()
+        if delta
+    ]
+    if not rows:
+        return
+
+    bind = db.get_bind() if isinstance(db, Session) else db
+    dialect = bind.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert_stmt = (sqlite if dialect == "sqlite" else postgresql).insert(MemberStat)
+        stmt = insert_stmt.values(rows).on_conflict_do_update(
+            index_elements=[MemberStat.dimension, MemberStat.bucket],
+            set_={"count": MemberStat.count + insert_stmt.excluded.count},
+        )
+        db.execute(stmt)
+        return
+
+    # Generic fallback: update, then insert the buckets that did not exist yet
+    for row in rows:
+        result = db.execute(
+            update(MemberStat)
+            .where(MemberStat.dimension == row["dimension"], MemberStat.bucket == row["bucket"])
+            .values(count=MemberStat.count + row["count"])
+        )
+        if result.rowcount == 0:
+            db.execute(insert(MemberStat).values(**row))
+
+
+def read(db: Session) -> dict[str, dict[str, int]]:
+    """Return {dimension: {bucket: count}} for all non-empty buckets"""
+    stats: dict[str, dict[str, int]] = {dimension: {} for dimension in DIMENSIONS}
+    rows = db.execute(
+        select(MemberStat.dimension, MemberStat.bucket, MemberStat.count).where(
+            MemberStat.dimension.in_(DIMENSIONS), MemberStat.count != 0
+        )
+    )
+    for dimension, bucket, count in rows:
+        stats[dimension][bucket] = count
+    return stats
+
+
+def read_version(db: Session) -> int:
+    """Current member change version (0 if nothing has been written yet)"""
+    dimension, bucket = MEMBER_VERSION
+    version = db.execute(
+        select(MemberStat.count).where(MemberStat.dimension == dimension, MemberStat.bucket == bucket)
+    ).scalar()
+    return version or 0
+
+
+def rebuild(db: Session | Connection) -> None:
+    """Recompute every counter from the member table (does not commit)"""
+    db.execute(delete(MemberStat).where(MemberStat.dimension.in_(DIMENSIONS)))
+
+    deltas: Counter[tuple[str, str]] = Counter()
+    for column, dimension in (
+        (Member.status, STATUS),
+        (Member.rank, RANK),
+        (Member.generation, GENERATION),
+    ):
+        for value, count in db.execute(select(column, func.count()).group_by(column)):
+            bucket = str(value) if dimension == GENERATION else value.value
+            deltas[(dimension, bucket)] += count
+    # Counters may have changed, so make cached list responses stale as well
+    apply(db, deltas, version_delta())
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _backfill_member_stats(target, connection: Connection, tables=(), **kw) -> None:
+    """Populate counters when create_all adds member_stat to an existing database"""
+    if MemberStat.__table__ in tables:
+        rebuild(connection)
@@ -0,0 +1,153 @@
+"""Skill dictionary: canonical skill names with maintained member counts.
+
+``member_skill.canonical_name`` holds the case-folded key of each free-text
+skill row; ``skill_dictionary`` has one row per key with the number of members
+that list it. MemberRepository applies count deltas in the same transaction
+as the skill change, so ``GET /skills`` reads the dictionary only and never
+scans member_skill. ``rebuild`` recomputes it (``python manage.py
+reconcile-stats``).
+
+A member counts once per skill, however many spellings of it they list.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+
+from sqlalchemy import delete, event, func, insert, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from database import Base
+from models.skill import Skill, canonical_skill_name
+from models.skill_dictionary import SkillEntry
+
+
+def labels(skill_names: Iterable[str]) -> dict[str, str]:
+    """{canonical name: first spelling seen} for display labels"""
+    result: dict[str, str] = {}
+    for name in skill_names:
+        key = canonical_skill_name(name)
+        if key:
+            result.setdefault(key, " ".join(name.split()))
+    return result
+
+
+def member_deltas(before: Iterable[str] = (), after: Iterable[str] = ()) -> Counter[str]:
+    """Count deltas for one member whose skill names went from ``before`` to ``after``"""
+    old = set(labels(before))
+    new = set(labels(after))
+    deltas: Counter[str] = Counter()
+    for key in new - old:
+        deltas[key] += 1
+    for key in old - new:
+        deltas[key] -= 1
+    return deltas
+
+
+def apply(
+    db: Session | Connection, *deltas: Counter[str], labels: dict[str, str] | None = None
+) -> None:
+    """
+    Add member-count deltas to the dictionary in a single upsert (does not commit).
+
+    Args:
+        deltas: {canonical name: delta} counters, summed
+        labels: display labels for names that may not be in the dictionary yet
+    """
+    merged: Counter[str] = Counter()
+    for delta in deltas:
+        merged.update(delta)
+    labels = labels or {}
+    rows = [
+        {"name": name, "label": labels.get(name, name), "member_count": delta}
+        for name, delta in merged.items()
+        if delta
+    ]
+    if not rows:
+        return
+
+    bind = db.get_bind() if isinstance(db, Session) else db
+    dialect = bind.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert_stmt = (sqlite if dialect == "sqlite" else postgresql).insert(SkillEntry)
+        stmt = insert_stmt.values(rows).on_conflict_do_update(
+            index_elements=[SkillEntry.name],
+            set_={"member_count": SkillEntry.member_count + insert_stmt.excluded.member_count},
+        )
+        db.execute(stmt)
+        return
+
+    # Generic fallback: update, then insert the names that did not exist yet
+    for row in rows:
+        result = db.execute(
+            update(SkillEntry)
+            .where(SkillEntry.name == row["name"])
+            .values(member_count=SkillEntry.member_count + row["member_count"])
+        )
+        if result.rowcount == 0:
+            db.execute(insert(SkillEntry).values(**row))
+
+
+def list_entries(db: Session, limit: int, prefix: str | None = None) -> list[SkillEntry]:
+    """Skills listed by at least one member, most common first"""
+    query = select(SkillEntry).where(SkillEntry.member_count > 0)
+    if prefix:
+        key = canonical_skill_name(prefix)
+        query = query.where(SkillEntry.name >= key, SkillEntry.name < key + "\U0010ffff")
+    query = query.order_by(SkillEntry.member_count.desc(), SkillEntry.name).limit(limit)
+    return list(db.execute(query).scalars())
+
+
+def get_entry(db: Session, name: str) -> SkillEntry | None:
+    """Dictionary entry for any spelling of a skill (None if nobody lists it)"""
+    entry = db.get(SkillEntry, canonical_skill_name(name))
+    if entry is None or entry.member_count <= 0:
+        return None
+    return entry
+
+
+def rebuild(db: Session | Connection) -> None:
+    """Recompute every member count from member_skill (does not commit)"""
+    db.execute(delete(SkillEntry))
+    rows = db.execute(
+        select(
+            Skill.canonical_name,
+            func.min(Skill.skill_name),
+            func.count(func.distinct(Skill.member_id)),
+        )
+        .where(Skill.canonical_name != "")
+        .group_by(Skill.canonical_name)
+    ).all()
+    if rows:
+        db.execute(
+            insert(SkillEntry),
+            [
+                {"name": name, "label": " ".join(label.split()), "member_count": count}
+                for name, label, count in rows
+            ],
+        )
+
+
+@event.listens_for(Base.metadata, "before_create")
+def _check_canonical_name(target, connection: Connection, tables=(), **kw) -> None:
+    """Refuse to create anything on a database that still lacks member_skill.canonical_name"""
+    if SkillEntry.__table__ not in tables:
+        return
+    inspector = inspect(connection)
+    if not inspector.has_table(Skill.__tablename__):
+        return  # new database: create_all makes member_skill with the column
+    columns = {column["name"] for column in inspector.get_columns(Skill.__tablename__)}
+    if "canonical_name" not in columns:
+        # create_all cannot add columns to an existing table
+        raise RuntimeError(
+            "member_skill.canonical_name is missing: this database predates the skill "
+            "dictionary. Run `python manage.py migrate` before starting the app."
+        )
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _backfill_skill_dictionary(target, connection: Connection, tables=(), **kw) -> None:
+    """Populate the dictionary when create_all adds it to an existing database"""
+    if SkillEntry.__table__ in tables:
+        rebuild(connection)
@@ -7,11 +7,12 @@ from exceptions import InvalidTokenError, MemberNotFoundError, MemberNotApproved
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_db
+from database import get_async_db
+from dependencies import limit_profile_update_link
 from schemas.member import MagicLinkRequest, MemberResponse
-from services.member_service import MemberService
+from services.async_member_service import AsyncMemberService
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +26,9 @@ class MagicLinkVerifyResponse(BaseModel):
     message: str
 
 
-def get_member_service(db: Session = Depends(get_db)) -> MemberService:
+def get_member_service(db: AsyncSession = Depends(get_async_db)) -> AsyncMemberService:
     """Dependency to get member service"""
-    return MemberService(db)
+    return AsyncMemberService(db)
 
 
 def validate_redirect_url(redirect: str) -> str:
@@ -61,9 +62,9 @@ def validate_redirect_url(redirect: str) -> str:
     return redirect
 
 
-@router.post("/magic-link/profile-update")
-def request_profile_update_link(
-    request: MagicLinkRequest, service: MemberService = Depends(get_member_service)
+@router.post("/magic-link/profile-update", dependencies=[Depends(limit_profile_update_link)])
+async def request_profile_update_link(
+    request: MagicLinkRequest, service: AsyncMemberService = Depends(get_member_service)
 ):
     """Request magic link for profile update
 
@@ -74,21 +75,21 @@ def request_profile_update_link(
     2. Make verify_email() handle both registration and profile_update purposes
     """
     try:
-        service.request_profile_update(request.email)
+        await service.request_profile_update(request.email)
         return {"message": "Magic link sent to your email"}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
 
 @router.get("/verify", response_class=HTMLResponse)
-def verify_magic_link(
+async def verify_magic_link(
     token: str = Query(...),
     redirect: str = Query("http://localhost:8501", description="Frontend URL to redirect to"),
-    service: MemberService = Depends(get_member_service)
+    service: AsyncMemberService = Depends(get_member_service)
 ):
     """Verify magic link token and change status to PENDING"""
     try:
-        member = service.verify_email(token)
+        member = await service.verify_email(token)
 
         # Validate redirect URL (prevents open redirects)
         safe_redirect = validate_redirect_url(redirect)
@@ -137,15 +138,15 @@ def verify_magic_link(
 
 
 @router.get("/verify-profile-update", response_class=HTMLResponse)
-def verify_profile_update(
+async def verify_profile_update(
     token: str = Query(...),
     redirect: str = Query("http://localhost:8501", description="Frontend URL to redirect to"),
-    service: MemberService = Depends(get_member_service)
+    service: AsyncMemberService = Depends(get_member_service)
 ):
     """Verify profile update token and redirect to frontend (for email links)"""
     try:
         # Verify token (member data used only for validation)
-        _ = service.verify_profile_update_token(token)
+        _ = await service.verify_profile_update_token(token)
 
         # Validate redirect URL (prevents open redirects)
         safe_redirect = validate_redirect_url(redirect)
@@ -226,13 +227,13 @@ def verify_profile_update(
 
 
 @router.get("/verify-profile-update-json", response_model=MemberResponse)
-def verify_profile_update_json(
+async def verify_profile_update_json(
     token: str = Query(...),
-    service: MemberService = Depends(get_member_service)
+    service: AsyncMemberService = Depends(get_member_service)
 ):
     """Verify profile update token and return member data (for frontend API calls)"""
     try:
-        member = service.verify_profile_update_token(token)
+        member = await service.verify_profile_update_token(token)
         return member
     except MemberNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
@@ -1,58 +1,241 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_db
-from dependencies import require_internal_admin
+from database import get_async_db
+from dependencies import limit_registration, require_internal_admin
+from exceptions import InvalidCursorError
 from models.member import Member, MemberStatus
-from schemas.member import MemberCreate, MemberResponse, MemberUpdate
-from services.member_service import MemberService
+from schemas.member import (
+    MemberBatchRequest,
+    MemberBatchResult,
+    MemberCreate,
+    MemberDirectory,
+    MemberImportResult,
+    MemberPage,
+    MemberResponse,
+    MemberSearchPage,
+    MemberStats,
+    MemberUpdate,
+    SortOrder,
+    TransferFormat,
+)
+from services import member_transfer
+from services.async_member_service import AsyncMemberService
+from services.idempotency import idempotent
+from utils.encoding import accepts_encoding
+from utils.etag import etag_matches, member_etag
+from utils.responses import PydanticJSONResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/members", tags=["members"])
 
 
-def get_member_service(db: Session = Depends(get_db)) -> MemberService:
+def get_member_service(db: AsyncSession = Depends(get_async_db)) -> AsyncMemberService:
     """Dependency to get member service"""
-    return MemberService(db)
+    return AsyncMemberService(db)
 
 
-@router.post("/register", response_model=MemberResponse, status_code=status.HTTP_201_CREATED)
-def register_member(member_data: MemberCreate, service: MemberService = Depends(get_member_service)):
+@router.post(
+    "/register",
+    response_model=MemberResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(limit_registration), Depends(idempotent)],
+)
+async def register_member(member_data: MemberCreate, service: AsyncMemberService = Depends(get_member_service)):
     """Register a new member"""
     try:
-        member = service.register_member(member_data)
+        member = await service.register_member(member_data)
         return member
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.get("/search", response_model=MemberSearchPage)
+async def search_members(
+    q: str = Query(..., min_length=1, max_length=100, description="Search text"),
+    member_status: MemberStatus | None = Query(None, alias="status"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    offset: int = Query(0, ge=0, description="next_offset from the previous page"),
+    service: AsyncMemberService = Depends(get_member_service),
+    _admin: bool = Depends(require_internal_admin),
+):
+    """Full-text search by name, email, description or skill (admin only)"""
+    return PydanticJSONResponse(await service.search_members(q, member_status, limit, offset))
+
+
+@router.get("/directory", response_model=MemberDirectory)
+async def get_member_directory(
+    if_none_match: str | None = Header(None),
+    accept_encoding: str | None = Header(None),
+    service: AsyncMemberService = Depends(get_member_service),
+):
+    """Every approved member for the public homepage, served from an in-memory snapshot
+
+    The JSON body is prebuilt (raw and gzip) and only rebuilt after member writes,
+    so requests normally touch neither the database nor the serializer.
+    """
+    snapshot = await service.get_public_directory()
+    headers = {"ETag": snapshot.etag, "Vary": "Accept-Encoding"}
+    if etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if accepts_encoding(accept_encoding, "gzip"):
+        headers["Content-Encoding"] = "gzip"
+        return Response(snapshot.gzipped, media_type="application/json", headers=headers)
+    return Response(snapshot.body, media_type="application/json", headers=headers)
+
+
+@router.get("/stats", response_model=MemberStats)
+async def get_member_stats(
+    service: AsyncMemberService = Depends(get_member_service),
+    _admin: bool = Depends(require_internal_admin),
+):
+    """Member counts by status, rank and generation (admin only)"""
+    return await service.get_member_stats()
+
+
+@router.post("/batch/approve", response_model=MemberBatchResult)
+async def approve_members(
+    request: MemberBatchRequest,
+    service: AsyncMemberService = Depends(get_member_service),
+    _admin: bool = Depends(require_internal_admin),
+):
+    """Approve many PENDING members in one transaction (admin only)"""
+    return await service.approve_members(request.ids)
+
+
+@router.post("/batch/reject", response_model=MemberBatchResult)
+async def reject_members(
+    request: MemberBatchRequest,
+    service: AsyncMemberService = Depends(get_member_service),
+    _admin: bool = Depends(require_internal_admin),
+):
+    """Reject (delete) many PENDING members in one transaction (admin only)"""
+    return await service.reject_members(request.ids)
+
+
+@router.post("/batch/delete", response_model=MemberBatchResult)
+async def delete_members(
+    request: MemberBatchRequest,
+    service: AsyncMemberService = Depends(get_member_service),
+    _admin: bool = Depends(require_internal_admin),
+):
+    """Delete many members in one transaction (admin only)"""
+    return await service.delete_members(request.ids)
+
+
+@router.get("/export")
+async def export_members(
+    export_format: TransferFormat = Query(TransferFormat.NDJSON, alias="format"),
+    _admin: bool = Depends(require_internal_admin),
+):
+    """Stream every member as NDJSON or CSV (admin only)"""
+    return StreamingResponse(
+        member_transfer.export_members(export_format),
+        media_type=member_transfer.MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="members.{export_format.value}"'},
+    )
+
+
+@router.post("/import", response_model=MemberImportResult)
+async def import_members(
+    file: UploadFile = File(...),
+    import_format: TransferFormat | None = Query(
+        None, alias="format", description="Defaults to the file extension (.ndjson/.jsonl or .csv)"
+    ),
+    _admin: bool = Depends(require_internal_admin),
+):
+    """Bulk-import members from NDJSON or CSV; invalid rows are reported and skipped (admin only)"""
+    if import_format is None:
+        filename = (file.filename or "").lower()
+        if filename.endswith(".csv"):
+            import_format = TransferFormat.CSV
+        elif filename.endswith((".ndjson", ".jsonl")):
+            import_format = TransferFormat.NDJSON
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot infer the file format; pass ?format=ndjson or ?format=csv",
+            )
+    try:
+        return await run_in_threadpool(member_transfer.import_members, file.file, import_format)
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be UTF-8 encoded (rows before the undecodable part were imported)",
+        )
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
 @router.get("/{member_id}", response_model=MemberResponse)
-def get_member(member_id: int, service: MemberService = Depends(get_member_service)):
-    """Get member by ID"""
-    member = service.get_member_by_id(member_id)
+async def get_member(
+    member_id: int,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    service: AsyncMemberService = Depends(get_member_service),
+):
+    """Get member by ID (ETag from updated_at; If-None-Match → 304)"""
+    if if_none_match:
+        etag = await service.get_member_etag(member_id)
+        if etag and etag_matches(if_none_match, etag):
+            return _not_modified(etag)
+
+    member = await service.get_member_by_id(member_id)
     if not member:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
+    response.headers["ETag"] = member_etag(member.id, member.updated_at)
     return member
 
 
-@router.get("", response_model=list[MemberResponse])
-def get_all_members(
-    status: MemberStatus | None = None, service: MemberService = Depends(get_member_service)
+@router.get("", response_model=MemberPage)
+async def get_all_members(
+    member_status: MemberStatus | None = Query(None, alias="status"),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    order: SortOrder = Query(SortOrder.ASC, description="Sort by created_at (asc or desc)"),
+    if_none_match: str | None = Header(None),
+    service: AsyncMemberService = Depends(get_member_service),
 ):
-    """Get all members, optionally filtered by status"""
-    members = service.get_all_members(status)
-    return members
+    """Get members page by page (keyset pagination), optionally filtered by status
 
+    The ETag follows the table-wide change version, so an unchanged table
+    answers If-None-Match with 304 without loading any member.
+    """
+    # Read the version before the page so the ETag can never be newer than the body
+    etag = await service.get_members_etag(member_status, limit, cursor, order)
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    try:
+        page = await service.get_members_page(member_status, limit, cursor, order)
+        return PydanticJSONResponse(page, headers={"ETag": etag})
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
-@router.put("/{member_id}", response_model=MemberResponse)
-def update_member(
+
+@router.put("/{member_id}", response_model=MemberResponse, dependencies=[Depends(idempotent)])
+async def update_member(
     member_id: int,
     update_data: MemberUpdate,
     token: str = Query(..., description="Magic link token for profile update"),
-    service: MemberService = Depends(get_member_service),
+    service: AsyncMemberService = Depends(get_member_service),
 ):
     """
     Update member profile (requires valid magic link token)
@@ -62,7 +245,7 @@ def update_member(
     """
     try:
         # 토큰 검증 및 본인 확인
-        member = service.verify_profile_update_token(token)
+        member = await service.verify_profile_update_token(token)
 
         # 본인 확인: 토큰의 회원 ID와 수정하려는 회원의 ID 일치 확인
         if member.id != member_id:
@@ -72,7 +255,7 @@ def update_member(
             )
 
         # 수정 처리
-        updated_member = service.update_member(member_id, update_data)
+        updated_member = await service.update_member(member_id, update_data)
         return updated_member
 
     except ValueError as e:
@@ -93,43 +276,49 @@ def update_member(
         ) from e
 
 
-@router.post("/{member_id}/approve", response_model=MemberResponse)
-def approve_member(
+@router.post(
+    "/{member_id}/approve",
+    response_model=MemberResponse,
+    dependencies=[Depends(require_internal_admin), Depends(idempotent)],
+)
+async def approve_member(
     member_id: int,
-    service: MemberService = Depends(get_member_service),
-    _admin: bool = Depends(require_internal_admin),
+    service: AsyncMemberService = Depends(get_member_service),
 ):
     """Approve a member registration (admin only)"""
     try:
-        member = service.approve_member(member_id)
+        member = await service.approve_member(member_id)
         return member
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.post("/{member_id}/reject", status_code=status.HTTP_204_NO_CONTENT)
-def reject_member(
+@router.post(
+    "/{member_id}/reject",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_internal_admin), Depends(idempotent)],
+)
+async def reject_member(
     member_id: int,
-    service: MemberService = Depends(get_member_service),
-    _admin: bool = Depends(require_internal_admin),
+    service: AsyncMemberService = Depends(get_member_service),
 ):
     """Reject a member registration (admin only) - Deletes member from DB"""
     try:
-        service.reject_member(member_id)
+        await service.reject_member(member_id)
         return None
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
 @router.delete("/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_member(
+async def delete_member(
     member_id: int,
-    service: MemberService = Depends(get_member_service),
+    service: AsyncMemberService = Depends(get_member_service),
     _admin: bool = Depends(require_internal_admin),
 ):
     """Delete a member (admin only)"""
     try:
-        service.delete_member(member_id)
+        await service.delete_member(member_id)
         return None
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,52 @@
+import logging
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+
+from exceptions import InvalidCursorError, SkillNotFoundError
+from models.member import MemberStatus
+from routers.members import _not_modified, get_member_service
+from schemas.member import MemberPage, SkillList, SortOrder
+from services.async_member_service import AsyncMemberService
+from utils.etag import etag_matches
+from utils.responses import PydanticJSONResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/skills", tags=["skills"])
+
+
+@router.get("", response_model=SkillList)
+async def list_skills(
+    prefix: str | None = Query(None, max_length=100, description="Only skills starting with this"),
+    limit: int = Query(100, ge=1, le=500, description="Number of skills"),
+    service: AsyncMemberService = Depends(get_member_service),
+):
+    """Skills with the number of members listing each, most common first
+
+    Counts are maintained on every member write, so this never scans member skills.
+    """
+    return PydanticJSONResponse(SkillList(items=await service.list_skills(prefix, limit)))
+
+
+@router.get("/{name}/members", response_model=MemberPage)
+async def get_skill_members(
+    name: str,
+    member_status: MemberStatus | None = Query(None, alias="status"),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    order: SortOrder = Query(SortOrder.ASC, description="Sort by created_at (asc or desc)"),
+    if_none_match: str | None = Header(None),
+    service: AsyncMemberService = Depends(get_member_service),
+):
+    """Members listing a skill (any spelling: "rust" matches "Rust"), same paging as GET /members"""
+    etag = await service.get_members_etag(member_status, limit, cursor, order, name)
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    try:
+        page = await service.get_members_page(member_status, limit, cursor, order, name)
+    except SkillNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    return PydanticJSONResponse(page, headers={"ETag": etag})
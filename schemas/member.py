@@ -1,6 +1,7 @@
 from datetime import datetime
+from enum import Enum
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 from models.member import MemberRank, MemberStatus
 from models.link import LinkType
@@ -67,6 +68,89 @@ class MemberResponse(MemberBase):
     model_config = {"from_attributes": True}
 
 
+class SortOrder(str, Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class MemberPage(BaseModel):
+    items: list[MemberResponse]
+    next_cursor: str | None = None
+
+
+class MemberDirectory(BaseModel):
+    """Every approved member, oldest first (GET /members/directory)"""
+
+    items: list[MemberResponse]
+
+
+class MemberSearchPage(BaseModel):
+    items: list[MemberResponse]
+    next_offset: int | None = None
+
+
+class SkillCount(BaseModel):
+    name: str  # canonical (case-folded) name, used in /skills/{name}/members
+    label: str  # spelling shown to people
+    member_count: int
+
+    model_config = {"from_attributes": True}
+
+
+class SkillList(BaseModel):
+    items: list[SkillCount]
+
+
+class MemberStats(BaseModel):
+    total: int
+    by_status: dict[str, int]
+    by_rank: dict[str, int]
+    by_generation: dict[str, int]
+
+
+class MemberBatchRequest(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=500)
+
+
+class BatchItemStatus(str, Enum):
+    OK = "ok"
+    NOT_FOUND = "not_found"
+    WRONG_STATUS = "wrong_status"
+
+
+class MemberBatchItem(BaseModel):
+    id: int
+    result: BatchItemStatus
+
+
+class MemberBatchResult(BaseModel):
+    results: list[MemberBatchItem]
+    succeeded: int
+
+
+class TransferFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class MemberImportRow(MemberCreate):
+    """One member in an import file (roster members are approved by default)"""
+
+    status: MemberStatus = MemberStatus.APPROVED
+
+
+class MemberImportError(BaseModel):
+    row: int  # 1-based data row (NDJSON line / CSV record after the header)
+    error: str
+
+
+class MemberImportResult(BaseModel):
+    inserted: int
+    failed: int
+    errors: list[MemberImportError]
+    errors_truncated: bool = False
+
+
 class MagicLinkRequest(BaseModel):
     email: EmailStr
 
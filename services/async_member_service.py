@@ -0,0 +1,145 @@
+from collections.abc import Callable
+from typing import TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from models.member import Member, MemberStatus
+from repositories.member_records import MemberRecordPage
+from schemas.member import (
+    MemberBatchResult,
+    MemberCreate,
+    MemberResponse,
+    MemberSearchPage,
+    MemberStats,
+    MemberUpdate,
+    SkillCount,
+    SortOrder,
+)
+from services.member_service import MemberService
+from services.public_directory import DirectorySnapshot
+
+T = TypeVar("T")
+
+
+class AsyncMemberService:
+    """
+    Async counterpart of MemberService for ``async def`` routers.
+
+    Business rules live in MemberService; each call runs it on the AsyncSession's
+    sync facade via ``run_sync``, so database I/O goes through the async driver.
+    Emails go through the outbox, so no call here waits on the email provider.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _run(self, fn: Callable[[MemberService], T]) -> T:
+        def call(session: Session) -> T:
+            return fn(MemberService(session))
+
+        return await self.db.run_sync(call)
+
+    async def register_member(self, member_data: MemberCreate) -> Member:
+        """Register a new member"""
+        return await self._run(lambda service: service.register_member(member_data))
+
+    async def request_profile_update(self, email: str) -> str:
+        """Request to update profile by sending magic link"""
+        return await self._run(lambda service: service.request_profile_update(email))
+
+    async def verify_email(self, token: str) -> Member:
+        """Verify email and change status from UNVERIFIED to PENDING"""
+        return await self._run(lambda service: service.verify_email(token))
+
+    async def verify_profile_update_token(self, token: str) -> MemberResponse:
+        """Verify profile update token and return member data"""
+        return await self._run(lambda service: service.verify_profile_update_token(token))
+
+    async def update_member(self, member_id: int, update_data: MemberUpdate) -> Member:
+        """Update member profile"""
+        return await self._run(lambda service: service.update_member(member_id, update_data))
+
+    async def get_member_by_id(self, member_id: int) -> MemberResponse | None:
+        """Get member by ID"""
+        return await self._run(lambda service: service.get_member_by_id(member_id))
+
+    async def get_member_by_email(self, email: str) -> MemberResponse | None:
+        """Get member by email"""
+        return await self._run(lambda service: service.get_member_by_email(email))
+
+    async def get_member_etag(self, member_id: int) -> str | None:
+        """ETag of a member's current representation without loading it"""
+        return await self._run(lambda service: service.get_member_etag(member_id))
+
+    async def get_members_etag(
+        self,
+        status: MemberStatus | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        order: SortOrder = SortOrder.ASC,
+        skill: str | None = None,
+    ) -> str:
+        """ETag of a members page, derived from the table-wide change version"""
+        return await self._run(
+            lambda service: service.get_members_etag(status, limit, cursor, order, skill)
+        )
+
+    async def get_members_page(
+        self,
+        status: MemberStatus | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        order: SortOrder = SortOrder.ASC,
+        skill: str | None = None,
+    ) -> MemberRecordPage:
+        """Get one page of members, optionally filtered by status and skill"""
+        return await self._run(
+            lambda service: service.get_members_page(status, limit, cursor, order, skill)
+        )
+
+    async def search_members(
+        self,
+        query: str,
+        status: MemberStatus | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> MemberSearchPage:
+        """Full-text search members, best match first"""
+        return await self._run(lambda service: service.search_members(query, status, limit, offset))
+
+    async def list_skills(self, prefix: str | None = None, limit: int = 100) -> list[SkillCount]:
+        """Skills with the number of members listing each, most common first"""
+        return await self._run(lambda service: service.list_skills(prefix, limit))
+
+    async def get_public_directory(self) -> DirectorySnapshot:
+        """Approved-member directory snapshot, rebuilt only when missing or too old"""
+        return await self._run(lambda service: service.get_public_directory())
+
+    async def get_member_stats(self) -> MemberStats:
+        """Get member counts by status, rank and generation"""
+        return await self._run(lambda service: service.get_member_stats())
+
+    async def approve_member(self, member_id: int) -> Member:
+        """Approve a member registration (admin only): PENDING → APPROVED"""
+        return await self._run(lambda service: service.approve_member(member_id))
+
+    async def reject_member(self, member_id: int) -> None:
+        """Reject a member registration (admin only): Delete from DB"""
+        await self._run(lambda service: service.reject_member(member_id))
+
+    async def delete_member(self, member_id: int) -> None:
+        """Delete a member"""
+        await self._run(lambda service: service.delete_member(member_id))
+
+    async def approve_members(self, member_ids: list[int]) -> MemberBatchResult:
+        """Approve many PENDING members in one transaction"""
+        return await self._run(lambda service: service.approve_members(member_ids))
+
+    async def reject_members(self, member_ids: list[int]) -> MemberBatchResult:
+        """Reject (delete) many PENDING members in one transaction"""
+        return await self._run(lambda service: service.reject_members(member_ids))
+
+    async def delete_members(self, member_ids: list[int]) -> MemberBatchResult:
+        """Delete many members in one transaction"""
+        return await self._run(lambda service: service.delete_members(member_ids))
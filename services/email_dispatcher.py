@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import TypeVar
+
+from sqlalchemy.orm import Session
+
+from config import settings
+from database import SessionLocal
+from models.email_outbox import EmailKind, EmailOutbox
+from repositories.email_outbox_repository import EmailOutboxRepository
+from services import metrics
+from services.email_service import EmailMessage, EmailService
+from services.email_service_impl import create_email_service
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _default(value: T | None, fallback: T) -> T:
+    return fallback if value is None else value
+
+
+class EmailDispatcher:
+    """
+    Background worker that drains the email outbox.
+
+    Each pass claims a batch of due emails, sends it with one
+    ``EmailService.send_batch`` call and marks the delivered ones SENT. Claiming
+    coalesces bursts: a partial batch is held back until its oldest email has
+    waited ``coalesce_window_seconds``. A failed send is retried with exponential backoff
+    (``base * 2 ** (attempts - 1)``, capped at ``max_backoff_seconds``); after
+    ``max_attempts`` the email is moved to DEAD and left for an operator
+    (``python manage.py requeue-dead-emails``).
+
+    ``dispatch_once`` is synchronous so it can also be driven from tests or a
+    cron-style script; ``start`` runs it in a thread from an asyncio task.
+    """
+
+    def __init__(
+        self,
+        email_service: EmailService | None = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int | None = None,
+        poll_interval_seconds: float | None = None,
+        max_attempts: int | None = None,
+        base_backoff_seconds: float | None = None,
+        max_backoff_seconds: float | None = None,
+        lease_seconds: float | None = None,
+        coalesce_window_seconds: float | None = None,
+    ):
+        self.email_service = email_service or create_email_service()
+        self.session_factory = session_factory
+        self.batch_size = _default(batch_size, settings.email_outbox_batch_size)
+        self.poll_interval_seconds = _default(poll_interval_seconds, settings.email_outbox_poll_seconds)
+        self.max_attempts = _default(max_attempts, settings.email_outbox_max_attempts)
+        self.base_backoff_seconds = _default(
+            base_backoff_seconds, settings.email_outbox_base_backoff_seconds
+        )
+        self.max_backoff_seconds = _default(max_backoff_seconds, settings.email_outbox_max_backoff_seconds)
+        self.lease_seconds = _default(lease_seconds, settings.email_outbox_lease_seconds)
+        self.coalesce_window_seconds = _default(
+            coalesce_window_seconds, settings.email_outbox_coalesce_seconds
+        )
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    def backoff(self, attempts: int) -> timedelta:
+        """Delay before the next attempt after ``attempts`` failed sends"""
+        delay = self.base_backoff_seconds * 2 ** (attempts - 1)
+        return timedelta(seconds=min(delay, self.max_backoff_seconds))
+
+    def _build_message(self, email: EmailOutbox) -> EmailMessage:
+        payload = email.payload
+        if email.kind == EmailKind.MAGIC_LINK:
+            return self.email_service.magic_link_message(email.recipient, payload["magic_link_url"])
+        if email.kind == EmailKind.APPROVAL:
+            return self.email_service.approval_message(email.recipient, payload["member_name"])
+        if email.kind == EmailKind.REJECTION:
+            return self.email_service.rejection_message(email.recipient, payload["member_name"])
+        raise ValueError(f"Unknown email kind: {email.kind}")
+
+    def _send_all(self, emails: list[EmailOutbox]) -> list[Exception | None]:
+        """Render and batch-send; rendering errors fail only their own email"""
+        results: list[Exception | None] = [None] * len(emails)
+        messages: list[EmailMessage] = []
+        positions: list[int] = []
+        for i, email in enumerate(emails):
+            try:
+                messages.append(self._build_message(email))
+                positions.append(i)
+            except Exception as e:
+                results[i] = e
+        if messages:
+            start = time.perf_counter()
+            try:
+                sent = self.email_service.send_batch(messages)
+            except Exception as e:
+                sent = [e] * len(messages)
+            metrics.observe_email_batch(
+                self.email_service.provider_name, time.perf_counter() - start, sent
+            )
+            for i, error in zip(positions, sent):
+                results[i] = error
+        return results
+
+    def _handle_failure(
+        self, outbox_repo: EmailOutboxRepository, email: EmailOutbox, error: Exception
+    ) -> None:
+        """Schedule a retry with backoff, or move to DEAD once attempts run out"""
+        if email.attempts >= self.max_attempts:
+            logger.error(
+                f"[OUTBOX] Email {email.id} to {email.recipient} moved to DEAD "
+                f"after {email.attempts} attempts: {error}"
+            )
+            outbox_repo.mark_failed(email, str(error), retry_at=None)
+        else:
+            retry_at = datetime.now(timezone.utc) + self.backoff(email.attempts)
+            logger.warning(
+                f"[OUTBOX] Email {email.id} to {email.recipient} failed "
+                f"(attempt {email.attempts}/{self.max_attempts}), retry at {retry_at}: {error}"
+            )
+            outbox_repo.mark_failed(email, str(error), retry_at=retry_at)
+
+    def dispatch_once(self) -> int:
+        """
+        Send one batch of due emails.
+
+        Returns:
+            Number of emails claimed in this pass (sent or failed)
+        """
+        db = self.session_factory()
+        try:
+            outbox_repo = EmailOutboxRepository.create(db)
+            emails = outbox_repo.claim_due(
+                self.batch_size, self.lease_seconds, self.coalesce_window_seconds
+            )
+            if not emails:
+                return 0
+
+            try:
+                results = self._send_all(emails)
+            except Exception as e:
+                results = [e] * len(emails)
+
+            outbox_repo.mark_sent([email for email, error in zip(emails, results) if error is None])
+            for email, error in zip(emails, results):
+                if error is not None:
+                    self._handle_failure(outbox_repo, email, error)
+            return len(emails)
+        finally:
+            db.close()
+
+    async def run(self) -> None:
+        """Poll the outbox until stop() is called"""
+        logger.info("[OUTBOX] Email dispatcher started")
+        while not self._stopping.is_set():
+            try:
+                claimed = await asyncio.to_thread(self.dispatch_once)
+            except Exception:
+                logger.exception("[OUTBOX] Dispatch pass failed")
+                claimed = 0
+            # A full batch means there is probably more waiting: go again right away
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval_seconds)
+                except TimeoutError:
+                    pass
+        logger.info("[OUTBOX] Email dispatcher stopped")
+
+    def start(self) -> None:
+        """Start the polling loop as a task on the running event loop"""
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the loop after the current pass; unsent emails stay in the outbox"""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
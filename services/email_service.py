@@ -1,9 +1,24 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from utils.jinja2 import render_template
+
+
+@dataclass(frozen=True)
+class EmailMessage:
+    """A rendered email ready to hand to a provider"""
+
+    to: str
+    subject: str
+    html: str
 
 
 class EmailService(ABC):
     """Abstract email service for sending magic links and notifications"""
 
+    provider_name = "unknown"  # metrics label
+
     @abstractmethod
     def send_magic_link(self, email: str, magic_link_url: str) -> None:
         """Send magic link email for authentication"""
@@ -18,3 +33,32 @@ class EmailService(ABC):
     def send_rejection_notification(self, email: str, member_name: str) -> None:
         """Send rejection notification email"""
         pass
+
+    @abstractmethod
+    def send_batch(self, messages: Sequence[EmailMessage]) -> list[Exception | None]:
+        """
+        Send many emails with as few provider calls as possible.
+
+        Returns:
+            One entry per message, in order: None if it was sent, otherwise the
+            error that prevented it (a failed provider call fails its whole chunk)
+        """
+        pass
+
+    def close(self) -> None:
+        """Release provider resources (HTTP connections) on shutdown"""
+
+    @staticmethod
+    def magic_link_message(email: str, magic_link_url: str) -> EmailMessage:
+        html = render_template("magic_link.html", magic_link_url=magic_link_url)
+        return EmailMessage(email, "Jaram 이메일 인증", html)
+
+    @staticmethod
+    def approval_message(email: str, member_name: str) -> EmailMessage:
+        html = render_template("approval.html", member_name=member_name)
+        return EmailMessage(email, "Jaram 가입 승인 완료", html)
+
+    @staticmethod
+    def rejection_message(email: str, member_name: str) -> EmailMessage:
+        html = render_template("rejection.html", member_name=member_name)
+        return EmailMessage(email, "Jaram 가입 신청 결과", html)
@@ -1,10 +1,14 @@
 import logging
-from typing import Optional
+from collections.abc import Mapping, Sequence
+from typing import Any
 
+import requests
 import resend
+from requests.adapters import HTTPAdapter
+from resend.http_client import HTTPClient
 
 from config import settings
-from services.email_service import EmailService
+from services.email_service import EmailMessage, EmailService
 from utils.jinja2 import render_template
 
 logger = logging.getLogger(__name__)
@@ -13,6 +17,8 @@ logger = logging.getLogger(__name__)
 class MockEmailService(EmailService):
     """Mock email service for development (logs to console)"""
 
+    provider_name = "mock"
+
     def send_magic_link(self, email: str, magic_link_url: str) -> None:
         """Send magic link email (logs to console in dev)"""
         html_content = render_template("magic_link.html", magic_link_url=magic_link_url)
@@ -40,45 +46,136 @@ class MockEmailService(EmailService):
         logger.info(f"[EMAIL] HTML Content Length: {len(html_content)} chars")
         logger.debug(f"[EMAIL] HTML Preview:\n{html_content[:500]}...")
 
+    def send_batch(self, messages: Sequence[EmailMessage]) -> list[Exception | None]:
+        """Send a batch of emails (logs to console in dev)"""
+        logger.info(f"[EMAIL] Batch of {len(messages)} email(s)")
+        for message in messages:
+            logger.info(f"[EMAIL] To: {message.to} | Subject: {message.subject} | {len(message.html)} chars")
+        return [None] * len(messages)
+
+
+class PooledHTTPClient(HTTPClient):
+    """
+    resend SDK용 HTTP 클라이언트: keep-alive 커넥션 풀을 재사용
+
+    SDK 기본 클라이언트는 ``requests.request``로 매 호출마다 새 TCP/TLS 연결을
+    맺습니다. 이 클라이언트는 하나의 ``requests.Session``을 공유합니다.
+    """
+
+    def __init__(self, pool_size: int, connect_timeout: float, read_timeout: float):
+        self._timeout = (connect_timeout, read_timeout)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: dict[str, object] | list[object] | None = None,
+        files: dict[str, Any] | None = None,
+        data: dict[str, str] | None = None,
+    ) -> tuple[bytes, int, Mapping[str, str]]:
+        try:
+            resp = self._session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json if data is None and files is None else None,
+                files=files,
+                data=data,
+                timeout=self._timeout,
+            )
+            return resp.content, resp.status_code, resp.headers
+        except requests.RequestException as e:
+            # resend.request turns this into a ResendError, like the SDK's own client
+            raise RuntimeError(f"Request failed: {e}") from e
+
+    def close(self) -> None:
+        self._session.close()
+
 
 class ResendEmailService(EmailService):
     """Resend를 사용한 이메일 서비스 구현"""
 
+    provider_name = "resend"
+
     DEFAULT_FROM_EMAIL = "Jaram <team@jaram.net>"
+    BATCH_LIMIT = 100  # Resend batch endpoint accepts at most 100 emails per call
 
     def __init__(
         self,
-        api_key: Optional[str] = None,
-        from_email: Optional[str] = None,
+        api_key: str | None = None,
+        from_email: str | None = None,
+        http_client: PooledHTTPClient | None = None,
     ):
         """
         ResendEmailService 초기화
 
+        resend SDK는 API 키와 HTTP 클라이언트를 모듈 전역으로 사용하므로,
+        프로세스당 하나만 만들어 재사용합니다 (main.lifespan에서 생성).
+
         Args:
             api_key: Resend API 키 (None이면 환경변수 RESEND_API_KEY 사용)
             from_email: 발신자 이메일 주소
+            http_client: keep-alive HTTP 클라이언트 (None이면 설정값으로 생성)
         """
         self.api_key = api_key or settings.resend_api_key
         if not self.api_key:
             raise ValueError("RESEND_API_KEY가 설정되지 않았습니다.")
 
+        self.http_client = http_client or PooledHTTPClient(
+            pool_size=settings.email_http_pool_size,
+            connect_timeout=settings.email_http_connect_timeout_seconds,
+            read_timeout=settings.email_http_read_timeout_seconds,
+        )
         resend.api_key = self.api_key
+        resend.default_http_client = self.http_client
         self.from_email = from_email or settings.email_from or self.DEFAULT_FROM_EMAIL
 
+    def close(self) -> None:
+        """커넥션 풀 정리"""
+        self.http_client.close()
+
     def send_magic_link(self, email: str, magic_link_url: str) -> None:
         """Send magic link email for authentication"""
-        html = render_template("magic_link.html", magic_link_url=magic_link_url)
-        self._send(email, "Jaram 이메일 인증", html)
+        message = self.magic_link_message(email, magic_link_url)
+        self._send(message.to, message.subject, message.html)
 
     def send_approval_notification(self, email: str, member_name: str) -> None:
         """Send approval notification email"""
-        html = render_template("approval.html", member_name=member_name)
-        self._send(email, "Jaram 가입 승인 완료", html)
+        message = self.approval_message(email, member_name)
+        self._send(message.to, message.subject, message.html)
 
     def send_rejection_notification(self, email: str, member_name: str) -> None:
         """Send rejection notification email"""
-        html = render_template("rejection.html", member_name=member_name)
-        self._send(email, "Jaram 가입 신청 결과", html)
+        message = self.rejection_message(email, member_name)
+        self._send(message.to, message.subject, message.html)
+
+    def send_batch(self, messages: Sequence[EmailMessage]) -> list[Exception | None]:
+        """
+        Resend batch API로 여러 이메일을 발송 (BATCH_LIMIT개씩 나눠 호출)
+
+        Returns:
+            메시지별 결과 (None: 발송 성공, Exception: 해당 청크 호출 실패)
+        """
+        results: list[Exception | None] = []
+        for start in range(0, len(messages), self.BATCH_LIMIT):
+            chunk = messages[start : start + self.BATCH_LIMIT]
+            params: list[resend.Emails.SendParams] = [
+                {"from": self.from_email, "to": [m.to], "subject": m.subject, "html": m.html}
+                for m in chunk
+            ]
+            try:
+                resend.Batch.send(params)
+                logger.info(f"[EMAIL] Sent batch of {len(chunk)} via Resend")
+                results.extend([None] * len(chunk))
+            except Exception as e:
+                logger.error(f"[EMAIL] Failed to send batch of {len(chunk)} via Resend: {e}")
+                results.extend([e] * len(chunk))
+        return results
 
     def _send(self, to: str, subject: str, html: str) -> None:
         """
@@ -108,6 +205,8 @@ def create_email_service() -> EmailService:
     """
     환경변수에 따라 이메일 서비스를 생성합니다.
 
+    프로세스당 한 번만 호출하세요 (main.lifespan이 app.state.email_service로 보관).
+
     EMAIL_PROVIDER 환경변수:
         - "mock" 또는 설정되지 않음: MockEmailService (개발용)
         - "resend": ResendEmailService (실제 이메일 발송)
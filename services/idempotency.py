@@ -0,0 +1,207 @@
+"""
+Idempotency-Key support for state-changing endpoints.
+
+A client that times out and retries ``POST /members/register`` (or approve,
+reject, profile update) with the same ``Idempotency-Key`` header gets the
+first attempt's response back instead of "already exists", and the service
+logic, including its emails, runs only once.
+
+Only routes listing the ``idempotent`` dependency take part; requests without
+the header are untouched. The dependency goes last in the route decorator's
+``dependencies``, after the rate limit and admin checks, so a request those
+reject never reserves a key. Together with IdempotencyMiddleware it:
+
+    1. reserves the key in the idempotency_key table (shared by replicas)
+    2. runs the endpoint and stores its status, headers and body for
+       IDEMPOTENCY_TTL_SECONDS
+    3. replays the stored response for later requests with the same key
+       (``Idempotent-Replayed: true``)
+
+Keys are scoped to the route and to the caller's credential (admin key,
+Authorization header or magic link token), so one client cannot collide with,
+or be replayed, another's response. A key reused for a different request
+(method, path, query or body) is answered 422, and a retry while the first
+request still runs gets 409. 5xx, 429, 401 and 403 responses are not stored,
+so the client can retry them (with valid credentials).
+"""
+
+import hashlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from fastapi import HTTPException, Request, status
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from database import AsyncSessionLocal
+from models.idempotency_key import IdempotencyKey
+from repositories.idempotency_repository import IdempotencyRepository
+
+HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+SCOPE_KEY = "idempotency"
+# Answers that depend on the moment or the credential rather than the request
+UNSTORED_STATUSES = frozenset({401, 403, 429})
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Reservation:
+    """Set in the scope by the middleware; ``key`` is filled in once the dependency reserves it"""
+
+    middleware: "IdempotencyMiddleware"
+    key: str | None = None
+
+
+class _Replay(Exception):  # noqa: N818  (control flow, not an error)
+    """Raised by the dependency to have the middleware send a stored response"""
+
+    def __init__(self, stored: IdempotencyKey) -> None:
+        super().__init__(stored.key)
+        self.stored = stored
+
+
+def storage_key(route: str, credential: str, key: str) -> str:
+    """Primary key of the idempotency_key row for a client's key on ``route``"""
+    digest = hashlib.sha256()
+    for part in (route, credential, key):
+        digest.update(part.encode() + b"\0")
+    return digest.hexdigest()
+
+
+def _credential(request: Request) -> str:
+    return "\0".join(
+        (
+            request.headers.get("X-Admin-Key", ""),
+            request.headers.get("Authorization", ""),
+            request.query_params.get("token", ""),  # magic link (profile update)
+        )
+    )
+
+
+def request_fingerprint(scope: Scope, body: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in (scope["method"], scope["path"], scope.get("query_string", b"").decode("latin-1")):
+        digest.update(part.encode() + b"\0")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+async def idempotent(request: Request) -> None:
+    """
+    Dependency making a route honour the Idempotency-Key header.
+
+    Raises:
+        HTTPException: 400 for a malformed key, 422 when the key was used for
+            a different request, 409 while the first request still runs
+    """
+    reservation: _Reservation | None = request.scope.get(SCOPE_KEY)
+    if reservation is None:
+        return  # no Idempotency-Key header
+    key = request.headers[HEADER]
+    if not 0 < len(key) <= MAX_KEY_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{HEADER} must be 1-{MAX_KEY_LENGTH} characters",
+        )
+
+    route = getattr(request.scope.get("route"), "path", request.url.path)
+    key = storage_key(route, _credential(request), key)
+    middleware = reservation.middleware
+    fingerprint = request_fingerprint(request.scope, await request.body())
+    existing = await middleware._run(lambda repo: repo.reserve(key, fingerprint, middleware.lock_seconds))
+    if existing is None:
+        reservation.key = key
+    elif existing.fingerprint != fingerprint:
+        raise HTTPException(
+            status_code=422,  # HTTP_422_UNPROCESSABLE_ENTITY was renamed in Starlette 0.48
+            detail=f"{HEADER} was already used for a different request",
+        )
+    elif existing.status_code is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A request with this Idempotency-Key is still being processed",
+            headers={"Retry-After": "1"},
+        )
+    else:
+        raise _Replay(existing)
+
+
+class IdempotencyMiddleware:
+    """Store the responses the ``idempotent`` dependency reserved a key for, and send replays"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        ttl_seconds: float = 86400.0,
+        lock_seconds: float = 60.0,
+        session_factory=AsyncSessionLocal,
+    ) -> None:
+        self.app = app
+        self.ttl_seconds = ttl_seconds
+        self.lock_seconds = lock_seconds
+        self.session_factory = session_factory
+
+    async def _run(self, fn: Callable[[IdempotencyRepository], T]) -> T:
+        async with self.session_factory() as db:
+            return await db.run_sync(lambda session: fn(IdempotencyRepository.create(session)))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("POST", "PUT", "PATCH", "DELETE")
+            or HEADER not in Headers(scope=scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        reservation = _Reservation(self)
+        scope[SCOPE_KEY] = reservation
+        status_code: int | None = None
+        headers: list[list[str]] = []
+        chunks: list[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal status_code
+            if reservation.key is None:
+                pass  # not an idempotent route, or the request was rejected before reserving
+            elif message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers.extend(
+                    [name.decode("latin-1"), value.decode("latin-1")]
+                    for name, value in message.get("headers", [])
+                )
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, capture)
+        except _Replay as replay:
+            await self._replay(replay.stored, send)
+            return
+        except BaseException:
+            if reservation.key is not None:
+                await self._run(lambda repo: repo.release(reservation.key))
+            raise
+        key = reservation.key
+        if key is None:
+            return
+        if status_code is None or status_code >= 500 or status_code in UNSTORED_STATUSES:
+            await self._run(lambda repo: repo.release(key))
+            return
+        await self._run(
+            lambda repo: repo.complete(
+                key, status_code, headers, b"".join(chunks), self.ttl_seconds
+            )
+        )
+
+    async def _replay(self, stored: IdempotencyKey, send: Send) -> None:
+        headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in stored.headers]
+        headers.append((REPLAYED_HEADER.lower().encode(), b"true"))
+        await send({"type": "http.response.start", "status": stored.status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": stored.body})
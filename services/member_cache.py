@@ -0,0 +1,128 @@
+"""Process-local read-through cache for member profiles.
+
+MemberService caches ``MemberResponse`` snapshots (never ORM instances, which are
+bound to a session), looked up by member id or by email. Entries are evicted
+least-recently-used once ``max_size`` members are cached and expire after
+``ttl_seconds``, which bounds staleness when another process writes to the same
+database. Write paths in MemberService call ``invalidate``
+after committing.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+from config import settings
+from schemas.member import MemberResponse
+
+
+@dataclass
+class MemberCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class MemberCache:
+    """Size-bounded LRU + TTL cache of member snapshots, looked up by id or email"""
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: float = 60.0,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled and max_size > 0
+        self._clock = clock
+        # member_id -> (expires_at, snapshot), least recently used first
+        self._entries: OrderedDict[int, tuple[float, MemberResponse]] = OrderedDict()
+        self._ids_by_email: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats = MemberCacheStats()
+
+    def get_by_id(self, member_id: int) -> MemberResponse | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._get(member_id)
+
+    def get_by_email(self, email: str) -> MemberResponse | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._get(self._ids_by_email.get(email))
+
+    def _get(self, member_id: int | None) -> MemberResponse | None:
+        entry = self._entries.get(member_id) if member_id is not None else None
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        expires_at, member = entry
+        if expires_at <= self._clock():
+            self._remove(member_id)
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(member_id)
+        self._stats.hits += 1
+        return member
+
+    def _remove(self, member_id: int) -> bool:
+        entry = self._entries.pop(member_id, None)
+        if entry is None:
+            return False
+        self._ids_by_email.pop(entry[1].email, None)
+        return True
+
+    def put(self, member: MemberResponse) -> None:
+        """Store a snapshot, evicting the least recently used members if full"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._remove(member.id)
+            self._entries[member.id] = (self._clock() + self.ttl_seconds, member)
+            self._ids_by_email[member.email] = member.id
+            while len(self._entries) > self.max_size:
+                member_id = next(iter(self._entries))
+                self._remove(member_id)
+                self._stats.evictions += 1
+
+    def invalidate(self, member_id: int | None = None, email: str | None = None) -> None:
+        """Drop the cached snapshot for a member (by id, email or both)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            removed = member_id is not None and self._remove(member_id)
+            if email is not None and email in self._ids_by_email:
+                removed = self._remove(self._ids_by_email[email]) or removed
+            if removed:
+                self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._ids_by_email.clear()
+            self._stats = MemberCacheStats()
+
+    def stats(self) -> dict[str, int | bool]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                **asdict(self._stats),
+            }
+
+
+member_cache = MemberCache(
+    max_size=settings.member_cache_max_size,
+    ttl_seconds=settings.member_cache_ttl_seconds,
+    enabled=settings.member_cache_enabled,
+)
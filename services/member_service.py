@@ -2,22 +2,54 @@ import logging
 from urllib.parse import quote
 
 from config import settings
-from exceptions import InvalidTokenError, MemberNotFoundError, MemberNotApprovedError
+from exceptions import InvalidTokenError, MemberNotFoundError, MemberNotApprovedError, SkillNotFoundError
+from models.email_outbox import EmailKind
 from models.member import Member, MemberStatus
+from models.skill import canonical_skill_name
+from repositories import skill_dictionary
+from repositories.email_outbox_repository import EmailOutboxRepository
+from repositories.member_records import MemberRecordPage
 from repositories.member_repository import MemberRepository
-from schemas.member import MemberCreate, MemberUpdate
-from services.email_service import EmailService
-from services.email_service_impl import create_email_service
+from schemas.member import (
+    BatchItemStatus,
+    MemberBatchItem,
+    MemberBatchResult,
+    MemberCreate,
+    MemberResponse,
+    MemberSearchPage,
+    MemberStats,
+    MemberUpdate,
+    SkillCount,
+    SortOrder,
+)
+from services.member_cache import MemberCache, member_cache
+from services.public_directory import DirectorySnapshot, PublicDirectory, public_directory
 from sqlalchemy.orm import Session
+from utils.cursor import decode_cursor, encode_cursor
+from utils.etag import make_etag, member_etag
 from utils.token import create_magic_link_token, verify_magic_link_token
 
 logger = logging.getLogger(__name__)
 
 
 class MemberService:
-    def __init__(self, db: Session, email_service: EmailService | None = None):
+    """
+    Member business rules.
+
+    Emails are not sent here: they are written to the email outbox in the same
+    transaction as the member change and delivered by EmailDispatcher.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        cache: MemberCache | None = None,
+        directory: PublicDirectory | None = None,
+    ):
         self.db = db
-        self.email_service = email_service or create_email_service()
+        self.outbox = EmailOutboxRepository.create(db)
+        self.cache = cache or member_cache
+        self.directory = directory or public_directory
 
     @staticmethod
     def _build_magic_link_url(token: str, endpoint: str = "verify") -> str:
@@ -40,15 +72,15 @@ class MemberService:
         if existing_member:
             raise ValueError(f"Member with email {member_data.email} already exists")
 
+        # Queue magic link for verification (committed together with the member)
+        token = create_magic_link_token(member_data.email, purpose="registration")
+        magic_link_url = self._build_magic_link_url(token)
+        self.outbox.enqueue(EmailKind.MAGIC_LINK, member_data.email, magic_link_url=magic_link_url)
+
         # Create member with UNVERIFIED status
         member = member_repo.add_member(member_data)
         logger.info(f"Member registered: {member.email}, status: UNVERIFIED")
 
-        # Send magic link for verification
-        token = create_magic_link_token(member_data.email, purpose="registration")
-        magic_link_url = self._build_magic_link_url(token)
-        self.email_service.send_magic_link(member_data.email, magic_link_url)
-
         return member
 
     def request_profile_update(self, email: str) -> str:
@@ -59,10 +91,11 @@ class MemberService:
         if not member:
             raise ValueError(f"Member with email {email} not found")
 
-        # Send magic link for profile update
+        # Queue magic link for profile update
         token = create_magic_link_token(email, purpose="profile_update")
         magic_link_url = self._build_magic_link_url(token, endpoint="verify-profile-update")
-        self.email_service.send_magic_link(email, magic_link_url)
+        self.outbox.enqueue(EmailKind.MAGIC_LINK, email, magic_link_url=magic_link_url)
+        self.db.commit()
 
         logger.info(f"Profile update requested for: {email}")
         return magic_link_url
@@ -91,20 +124,20 @@ class MemberService:
 
         # Change status to PENDING
         member = member_repo.update_member_status(member, MemberStatus.PENDING)
+        self.cache.invalidate(member.id, member.email)
         logger.info(f"Email verified, status changed to PENDING: {email}")
 
         return member
 
-    def verify_profile_update_token(self, token: str) -> Member:
+    def verify_profile_update_token(self, token: str) -> MemberResponse:
         """Verify profile update token and return member data"""
         # 토큰 검증 (purpose="profile_update")
         email = verify_magic_link_token(token, purpose="profile_update")
         if not email:
             raise InvalidTokenError("Invalid or expired token")
 
-        # 회원 조회
-        member_repo = MemberRepository.create(self.db)
-        member = member_repo.get_member_by_email(email)
+        # 회원 조회 (캐시 우선)
+        member = self.get_member_by_email(email)
 
         if not member:
             raise MemberNotFoundError(f"Member with email {email} not found")
@@ -126,24 +159,139 @@ class MemberService:
         if not member:
             raise ValueError(f"Member with ID {member_id} not found")
 
+        updated_at = member.updated_at
         updated_member = member_repo.update_member(member, update_data)
+        if updated_member.updated_at == updated_at:
+            return updated_member  # nothing changed, nothing written
+        self.cache.invalidate(updated_member.id, updated_member.email)
+        if updated_member.status == MemberStatus.APPROVED:
+            self.directory.invalidate()
         logger.info(f"Member profile updated: {member.email}")
         return updated_member
 
-    def get_member_by_id(self, member_id: int) -> Member | None:
-        """Get member by ID"""
+    def get_member_by_id(self, member_id: int) -> MemberResponse | None:
+        """Get member by ID (read-through cache)"""
+        cached = self.cache.get_by_id(member_id)
+        if cached is not None:
+            return cached
+
         member_repo = MemberRepository.create(self.db)
-        return member_repo.get_member_by_id(member_id)
+        return self._cache_member(member_repo.get_member_by_id(member_id))
+
+    def get_member_by_email(self, email: str) -> MemberResponse | None:
+        """Get member by email (read-through cache)"""
+        cached = self.cache.get_by_email(email)
+        if cached is not None:
+            return cached
 
-    def get_member_by_email(self, email: str) -> Member | None:
-        """Get member by email"""
         member_repo = MemberRepository.create(self.db)
-        return member_repo.get_member_by_email(email)
+        return self._cache_member(member_repo.get_member_by_email(email))
+
+    def get_member_etag(self, member_id: int) -> str | None:
+        """ETag of a member's current representation without loading it (None if missing)"""
+        cached = self.cache.get_by_id(member_id)
+        if cached is not None:
+            return member_etag(cached.id, cached.updated_at)
+
+        member_repo = MemberRepository.create(self.db)
+        updated_at = member_repo.get_member_updated_at(member_id)
+        return member_etag(member_id, updated_at) if updated_at else None
+
+    def get_members_etag(
+        self,
+        status: MemberStatus | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        order: SortOrder = SortOrder.ASC,
+        skill: str | None = None,
+    ) -> str:
+        """ETag of a members page, derived from the table-wide change version"""
+        member_repo = MemberRepository.create(self.db)
+        version = member_repo.get_change_version()
+        return make_etag(
+            "members",
+            version,
+            status.value if status else "",
+            limit,
+            cursor or "",
+            order.value,
+            canonical_skill_name(skill) if skill is not None else "",
+        )
+
+    def _cache_member(self, member: Member | None) -> MemberResponse | None:
+        """Snapshot a loaded member into the cache (misses are not cached)"""
+        if member is None:
+            return None
+        snapshot = MemberResponse.model_validate(member)
+        self.cache.put(snapshot)
+        return snapshot
+
+    def get_members_page(
+        self,
+        status: MemberStatus | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        order: SortOrder = SortOrder.ASC,
+        skill: str | None = None,
+    ) -> MemberRecordPage:
+        """Get one page of members, optionally filtered by status and skill
+
+        Returns read-only records (serialize with PydanticJSONResponse), not MemberPage.
+
+        Raises:
+            InvalidCursorError: cursor가 잘못된 경우
+            SkillNotFoundError: skill을 가진 회원이 없는 경우
+        """
+        after = decode_cursor(cursor) if cursor else None
+
+        if skill is not None and skill_dictionary.get_entry(self.db, skill) is None:
+            raise SkillNotFoundError(f"No member lists skill {skill!r}")
+
+        member_repo = MemberRepository.create(self.db)
+        members, next_key = member_repo.get_members_page(status, limit, after, order, skill)
+
+        return MemberRecordPage(
+            items=members,
+            next_cursor=encode_cursor(*next_key) if next_key else None,
+        )
+
+    def search_members(
+        self,
+        query: str,
+        status: MemberStatus | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> MemberSearchPage:
+        """Full-text search members, best match first"""
+        member_repo = MemberRepository.create(self.db)
+        members, has_more = member_repo.search_members(query, status, limit, offset)
 
-    def get_all_members(self, status: MemberStatus | None = None) -> list[Member]:
-        """Get all members, optionally filtered by status"""
+        return MemberSearchPage(
+            items=[MemberResponse.model_validate(member) for member in members],
+            next_offset=offset + limit if has_more else None,
+        )
+
+    def list_skills(self, prefix: str | None = None, limit: int = 100) -> list[SkillCount]:
+        """Skills with the number of members listing each, most common first"""
+        entries = skill_dictionary.list_entries(self.db, limit, prefix)
+        return [SkillCount.model_validate(entry) for entry in entries]
+
+    def get_public_directory(self) -> DirectorySnapshot:
+        """Approved-member directory snapshot, rebuilt only when missing or too old"""
+        return self.directory.get() or self.directory.refresh(self.db)
+
+    def get_member_stats(self) -> MemberStats:
+        """Get member counts by status, rank and generation (maintained counters)"""
         member_repo = MemberRepository.create(self.db)
-        return member_repo.get_all_members(status)
+        stats = member_repo.get_stats()
+
+        by_status = {status.value: stats["status"].get(status.value, 0) for status in MemberStatus}
+        return MemberStats(
+            total=sum(by_status.values()),
+            by_status=by_status,
+            by_rank=stats["rank"],
+            by_generation=dict(sorted(stats["generation"].items(), key=lambda item: int(item[0]))),
+        )
 
     def approve_member(self, member_id: int) -> Member:
         """Approve a member registration (admin only): PENDING → APPROVED"""
@@ -159,15 +307,80 @@ class MemberService:
                 "Only PENDING members can be approved."
             )
 
-        # Update status to APPROVED
+        # Queue approval notification, then update status to APPROVED (one commit)
+        self.outbox.enqueue(EmailKind.APPROVAL, member.email, member_name=member.name)
         member = member_repo.update_member_status(member, MemberStatus.APPROVED)
-
-        # Send approval notification
-        self.email_service.send_approval_notification(member.email, member.name)
+        self.cache.invalidate(member.id, member.email)
+        self.directory.invalidate()
         logger.info(f"Member approved: {member.email}")
 
         return member
 
+    def _classify(
+        self, member_ids: list[int], required_status: MemberStatus | None
+    ) -> tuple[list, list[MemberBatchItem]]:
+        """Split requested ids into members to act on and per-id results (duplicates dropped)"""
+        member_ids = list(dict.fromkeys(member_ids))
+        member_repo = MemberRepository.create(self.db)
+        summaries = member_repo.get_member_summaries(member_ids)
+
+        targets = []
+        results = []
+        for member_id in member_ids:
+            member = summaries.get(member_id)
+            if member is None:
+                result = BatchItemStatus.NOT_FOUND
+            elif required_status is not None and member.status != required_status:
+                result = BatchItemStatus.WRONG_STATUS
+            else:
+                result = BatchItemStatus.OK
+                targets.append(member)
+            results.append(MemberBatchItem(id=member_id, result=result))
+        return targets, results
+
+    def _invalidate_all(self, members: list, listed: bool) -> None:
+        """Drop cached members; ``listed``: the public directory changed too"""
+        for member in members:
+            self.cache.invalidate(member.id, member.email)
+        if listed:
+            self.directory.invalidate()
+
+    @staticmethod
+    def _any_listed(members: list) -> bool:
+        return any(member.status == MemberStatus.APPROVED for member in members)
+
+    def approve_members(self, member_ids: list[int]) -> MemberBatchResult:
+        """Approve many PENDING members in one transaction and queue their notifications"""
+        targets, results = self._classify(member_ids, MemberStatus.PENDING)
+
+        for member in targets:
+            self.outbox.enqueue(EmailKind.APPROVAL, member.email, member_name=member.name)
+        MemberRepository.create(self.db).bulk_update_status(targets, MemberStatus.APPROVED)
+        self._invalidate_all(targets, listed=bool(targets))
+
+        logger.info(f"Members approved in batch: {len(targets)}/{len(results)}")
+        return MemberBatchResult(results=results, succeeded=len(targets))
+
+    def reject_members(self, member_ids: list[int]) -> MemberBatchResult:
+        """Reject (delete) many PENDING members in one transaction"""
+        targets, results = self._classify(member_ids, MemberStatus.PENDING)
+
+        MemberRepository.create(self.db).bulk_delete(targets)
+        self._invalidate_all(targets, listed=self._any_listed(targets))
+
+        logger.info(f"Members rejected in batch: {len(targets)}/{len(results)}")
+        return MemberBatchResult(results=results, succeeded=len(targets))
+
+    def delete_members(self, member_ids: list[int]) -> MemberBatchResult:
+        """Delete many members (any status) in one transaction"""
+        targets, results = self._classify(member_ids, None)
+
+        MemberRepository.create(self.db).bulk_delete(targets)
+        self._invalidate_all(targets, listed=self._any_listed(targets))
+
+        logger.info(f"Members deleted in batch: {len(targets)}/{len(results)}")
+        return MemberBatchResult(results=results, succeeded=len(targets))
+
     def reject_member(self, member_id: int) -> None:
         """Reject a member registration (admin only): Delete from DB"""
         member_repo = MemberRepository.create(self.db)
@@ -178,9 +391,13 @@ class MemberService:
 
         # Store email for logging before deletion
         email = member.email
+        was_listed = member.status == MemberStatus.APPROVED
 
         # Delete member from DB
         member_repo.delete_member(member)
+        self.cache.invalidate(member_id, email)
+        if was_listed:
+            self.directory.invalidate()
         logger.info(f"Member rejected and deleted: {email}")
 
     def delete_member(self, member_id: int) -> None:
@@ -191,5 +408,10 @@ class MemberService:
         if not member:
             raise ValueError(f"Member with ID {member_id} not found")
 
+        email = member.email
+        was_listed = member.status == MemberStatus.APPROVED
         member_repo.delete_member(member)
-        logger.info(f"Member deleted: {member.email}")
+        self.cache.invalidate(member_id, email)
+        if was_listed:
+            self.directory.invalidate()
+        logger.info(f"Member deleted: {email}")
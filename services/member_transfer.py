@@ -0,0 +1,301 @@
+"""Bulk member export (streaming NDJSON/CSV) and import (chunked bulk insert).
+
+Export reads the member table through a server-side cursor
+(``AsyncSession.stream`` + ``yield_per``) and yields one text chunk per
+partition, so memory stays constant however large the table is.
+
+Import reads the upload incrementally and writes it in chunks of
+``IMPORT_CHUNK_SIZE`` rows: every chunk is validated, checked for duplicate
+emails with one query, bulk-inserted with executemany and committed on its
+own. Invalid rows are reported and skipped; valid rows in the same chunk are
+still imported.
+
+CSV layout (one member per record): the member columns plus ``skills``
+(names separated by ``|``) and ``links`` (``type=url`` pairs separated by
+``|``). Export output can be fed back to import unchanged; ``id``,
+``created_at`` and ``updated_at`` are ignored on import.
+"""
+
+import csv
+import io
+import json
+import logging
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import Any, BinaryIO
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from database import AsyncSessionLocal, SessionLocal
+from models.link import LinkType
+from models.member import Member
+from repositories.member_repository import MemberRepository
+from schemas.member import MemberImportError, MemberImportResult, MemberImportRow, TransferFormat
+from services.public_directory import public_directory
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CHUNK_SIZE = 500
+IMPORT_CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+
+MEDIA_TYPES = {
+    TransferFormat.NDJSON: "application/x-ndjson",
+    TransferFormat.CSV: "text/csv; charset=utf-8",
+}
+
+CSV_COLUMNS = (
+    "id",
+    "email",
+    "name",
+    "generation",
+    "rank",
+    "status",
+    "description",
+    "image_url",
+    "created_at",
+    "updated_at",
+    "skills",
+    "links",
+)
+_LIST_SEPARATOR = "|"
+
+_EXPORT_QUERY = select(
+    Member.id,
+    Member.email,
+    Member.name,
+    Member.generation,
+    Member.rank,
+    Member.status,
+    Member.description,
+    Member.image_url,
+    Member.created_at,
+    Member.updated_at,
+).order_by(Member.id)
+
+
+def _export_record(
+    row, skills: list[str], links: list[tuple[LinkType, str]]
+) -> dict[str, Any]:
+    return {
+        "id": row.id,
+        "email": row.email,
+        "name": row.name,
+        "generation": row.generation,
+        "rank": row.rank.value,
+        "status": row.status.value,
+        "description": row.description,
+        "image_url": row.image_url,
+        "created_at": row.created_at.isoformat(),
+        "updated_at": row.updated_at.isoformat(),
+        "skills": skills,
+        "links": [{"link_type": link_type.value, "url": url} for link_type, url in links],
+    }
+
+
+def _encode_ndjson(records: list[dict[str, Any]]) -> str:
+    return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+
+
+def _encode_csv(records: list[dict[str, Any]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for record in records:
+        writer.writerow(
+            [
+                *(record[column] for column in CSV_COLUMNS[:-2]),
+                _LIST_SEPARATOR.join(record["skills"]),
+                _LIST_SEPARATOR.join(f"{link['link_type']}={link['url']}" for link in record["links"]),
+            ]
+        )
+    return buffer.getvalue()
+
+
+def _csv_header() -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(CSV_COLUMNS)
+    return buffer.getvalue()
+
+
+async def export_members(
+    fmt: TransferFormat,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+) -> AsyncIterator[str]:
+    """
+    Stream every member (ordered by id) as NDJSON lines or CSV records.
+
+    Opens its own session: the response body is produced after the route has
+    returned, so it must not depend on the request-scoped session.
+    """
+    encode = _encode_ndjson if fmt == TransferFormat.NDJSON else _encode_csv
+    if fmt == TransferFormat.CSV:
+        yield _csv_header()
+
+    async with session_factory() as db:
+        result = await db.stream(_EXPORT_QUERY.execution_options(yield_per=chunk_size))
+        async for rows in result.partitions():
+            ids = [row.id for row in rows]
+            skills, links = await db.run_sync(
+                lambda session: MemberRepository.create(session).get_skills_and_links(ids)
+            )
+            yield encode([_export_record(row, skills[row.id], links[row.id]) for row in rows])
+
+
+def _split_list(value: str | None) -> list[str]:
+    if not value:
+        return []
+    return [item.strip() for item in value.split(_LIST_SEPARATOR) if item.strip()]
+
+
+def _csv_record(row: dict[str, str | None]) -> dict[str, Any]:
+    """Turn a csv.DictReader row into the shape MemberImportRow validates"""
+    record: dict[str, Any] = {key: value for key, value in row.items() if key and value != ""}
+    record["skills"] = [{"skill_name": skill} for skill in _split_list(row.get("skills"))]
+    links = []
+    for item in _split_list(row.get("links")):
+        link_type, _, url = item.partition("=")
+        links.append({"link_type": link_type.strip(), "url": url.strip()})
+    record["links"] = links
+    return record
+
+
+def _ndjson_record(line: str) -> dict[str, Any]:
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError("each line must be a JSON object")
+    # Export writes skills as plain names; the create schema takes objects
+    record["skills"] = [
+        {"skill_name": skill} if isinstance(skill, str) else skill
+        for skill in record.get("skills") or []
+    ]
+    return record
+
+
+def _read_records(text: io.TextIOBase, fmt: TransferFormat) -> Iterator[tuple[int, Any]]:
+    """
+    Yield (row number, raw record or exception) without reading the whole file.
+
+    Row numbers count data rows from 1 (the CSV header is not a row); blank
+    NDJSON lines are skipped but still counted.
+    """
+    if fmt == TransferFormat.CSV:
+        for number, row in enumerate(csv.DictReader(text), start=1):
+            try:
+                yield number, _csv_record(row)
+            except Exception as e:
+                yield number, e
+        return
+
+    for number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield number, _ndjson_record(line)
+        except Exception as e:
+            yield number, e
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+            for detail in error.errors()
+        )
+    if isinstance(error, json.JSONDecodeError):
+        return f"invalid JSON: {error.msg}"
+    return str(error)
+
+
+class MemberImporter:
+    """Validate and bulk-insert members chunk by chunk (one commit per chunk)"""
+
+    def __init__(self, db: Session, chunk_size: int = IMPORT_CHUNK_SIZE):
+        self.db = db
+        self.repository = MemberRepository.create(db)
+        self.chunk_size = chunk_size
+        self.inserted = 0
+        self.failed = 0
+        self.errors: list[MemberImportError] = []
+
+    def _fail(self, row: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(MemberImportError(row=row, error=error))
+
+    def _flush(self, chunk: list[tuple[int, Any]]) -> None:
+        valid: list[tuple[int, MemberImportRow]] = []
+        for number, record in chunk:
+            if isinstance(record, Exception):
+                self._fail(number, _describe(record))
+                continue
+            try:
+                valid.append((number, MemberImportRow.model_validate(record)))
+            except ValidationError as e:
+                self._fail(number, _describe(e))
+
+        existing = self.repository.get_existing_emails([member.email for _, member in valid])
+        members: list[MemberImportRow] = []
+        numbers: list[int] = []
+        for number, member in valid:
+            if member.email in existing:
+                self._fail(number, f"email already exists: {member.email}")
+                continue
+            existing.add(member.email)
+            members.append(member)
+            numbers.append(number)
+
+        try:
+            self.repository.bulk_add_members(members)
+        except IntegrityError as e:
+            # Lost a race with a concurrent write: the whole chunk is rolled back
+            self.db.rollback()
+            logger.warning(f"[IMPORT] Chunk rolled back: {e.orig}")
+            for number in numbers:
+                self._fail(number, f"chunk rolled back: {e.orig}")
+            return
+        self.inserted += len(members)
+
+    def run(self, records: Iterable[tuple[int, Any]]) -> MemberImportResult:
+        chunk: list[tuple[int, Any]] = []
+        for item in records:
+            chunk.append(item)
+            if len(chunk) >= self.chunk_size:
+                self._flush(chunk)
+                chunk = []
+        if chunk:
+            self._flush(chunk)
+
+        logger.info(f"[IMPORT] Imported {self.inserted} members, {self.failed} rows failed")
+        return MemberImportResult(
+            inserted=self.inserted,
+            failed=self.failed,
+            errors=self.errors,
+            errors_truncated=self.failed > len(self.errors),
+        )
+
+
+def import_members(
+    file: BinaryIO,
+    fmt: TransferFormat,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> MemberImportResult:
+    """
+    Import members from an uploaded NDJSON/CSV file (UTF-8, BOM allowed).
+
+    Synchronous and blocking: routers run it in the threadpool.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    db = session_factory()
+    try:
+        result = MemberImporter(db, chunk_size).run(_read_records(text, fmt))
+        if result.inserted:
+            public_directory.invalidate()
+        return result
+    finally:
+        text.detach()
+        db.close()
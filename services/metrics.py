@@ -0,0 +1,145 @@
+"""
+Application metrics exposed at ``GET /metrics`` (Prometheus text format).
+
+    http_requests_total / http_request_duration_seconds
+        per method, route template (``/members/{member_id}``, never the raw
+        path) and status code, recorded by MetricsMiddleware
+    http_requests_in_progress
+        requests currently being handled
+    db_connection_held_seconds
+        how long a pooled connection stays checked out (one session's
+        database time), per engine
+    email_send_duration_seconds / emails_sent_total
+        EmailService.send_batch latency and outcome per provider
+    member_cache_* / cache hit ratio
+        read from MemberCache.stats() at scrape time
+    rate_limited_requests_total
+        requests answered 429, per route and limit key (ip or email)
+"""
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from services.member_cache import member_cache
+from utils.metrics import CallbackCounter, CallbackGauge, Counter, Gauge, Histogram, Registry
+
+registry = Registry()
+
+http_requests_total = registry.register(
+    Counter("http_requests_total", "HTTP requests handled", ("method", "route", "status"))
+)
+http_request_duration_seconds = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency in seconds",
+        ("method", "route", "status"),
+    )
+)
+http_requests_in_progress = registry.register(
+    Gauge("http_requests_in_progress", "HTTP requests currently being handled")
+)
+db_connection_held_seconds = registry.register(
+    Histogram(
+        "db_connection_held_seconds",
+        "Time a pooled database connection stays checked out",
+        ("engine",),
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    )
+)
+email_send_duration_seconds = registry.register(
+    Histogram(
+        "email_send_duration_seconds",
+        "EmailService.send_batch latency in seconds",
+        ("provider", "outcome"),
+    )
+)
+emails_sent_total = registry.register(
+    Counter("emails_sent_total", "Emails handed to the provider", ("provider", "outcome"))
+)
+rate_limited_requests_total = registry.register(
+    Counter("rate_limited_requests_total", "Requests rejected with 429", ("route", "key"))
+)
+
+
+def _cache_counts() -> dict[tuple[str, ...], float]:
+    stats = member_cache.stats()
+    return {("hit",): stats["hits"], ("miss",): stats["misses"]}
+
+
+def _cache_hit_ratio() -> dict[tuple[str, ...], float]:
+    stats = member_cache.stats()
+    lookups = stats["hits"] + stats["misses"]
+    return {(): stats["hits"] / lookups if lookups else 0.0}
+
+
+registry.register(
+    CallbackCounter(
+        "member_cache_lookups_total", "Member cache lookups by result", _cache_counts, ("result",)
+    )
+)
+registry.register(
+    CallbackGauge(
+        "member_cache_hit_ratio", "Member cache hits / lookups since start", _cache_hit_ratio
+    )
+)
+
+
+class MetricsMiddleware:
+    """Count and time every HTTP request by route template and status code"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500  # an exception before the response started
+        start = time.perf_counter()
+        http_requests_in_progress.inc()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_progress.dec()
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            labels = (scope["method"], template, str(status_code))
+            http_requests_total.inc(*labels)
+            http_request_duration_seconds.observe(time.perf_counter() - start, *labels)
+
+
+def install_db_metrics(engine: Engine, name: str) -> None:
+    """Time pool checkout -> checkin for ``engine`` (sync engine, or async_engine.sync_engine)"""
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["metrics_checkout_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record) -> None:
+        started = connection_record.info.pop("metrics_checkout_at", None)
+        if started is not None:
+            db_connection_held_seconds.observe(time.perf_counter() - started, name)
+
+
+def observe_email_batch(provider: str, seconds: float, results: list[Exception | None]) -> None:
+    """Record one send_batch call (outcome "error" if any email in it failed)"""
+    failed = sum(1 for error in results if error is not None)
+    outcome = "error" if failed else "ok"
+    email_send_duration_seconds.observe(seconds, provider, outcome)
+    if failed:
+        emails_sent_total.inc(provider, "error", amount=failed)
+    if len(results) > failed:
+        emails_sent_total.inc(provider, "ok", amount=len(results) - failed)
@@ -0,0 +1,100 @@
+"""Materialized public directory of approved members.
+
+``GET /members/directory`` serves this snapshot straight from memory: the JSON
+body is serialized once and kept both raw and gzip-compressed, so a page view
+costs no query and no serialization. Writes that can change the approved set
+(approve, profile update, delete, import) only mark it stale, which is O(1); the
+next directory read rebuilds it once, so a burst of writes costs one rebuild and
+no write request waits for one.
+
+Like MemberCache, the snapshot is process-local: a snapshot older than
+``max_age_seconds`` is rebuilt on the next request, which bounds staleness when
+another process wrote to the database.
+"""
+
+import gzip
+import hashlib
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from pydantic_core import to_json
+from sqlalchemy.orm import Session
+
+from config import settings
+from models.member import MemberStatus
+from repositories.member_repository import MemberRepository
+from utils.etag import make_etag
+
+
+@dataclass(frozen=True)
+class DirectorySnapshot:
+    body: bytes
+    gzipped: bytes
+    etag: str
+    version: int  # member change version the snapshot was read at
+    built_at: float
+    generation: int  # PublicDirectory invalidation count when the rebuild started
+
+
+class PublicDirectory:
+    """Holds the latest directory snapshot (replaced whole, never mutated)"""
+
+    def __init__(
+        self,
+        max_age_seconds: float = 300.0,
+        compress_level: int = 9,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_age_seconds = max_age_seconds
+        self.compress_level = compress_level
+        self._clock = clock
+        self._snapshot: DirectorySnapshot | None = None
+        self._generation = 0
+
+    def get(self) -> DirectorySnapshot | None:
+        """Current snapshot, or None if there is none yet, it is stale or too old"""
+        snapshot = self._snapshot
+        if (
+            snapshot is None
+            or snapshot.generation != self._generation
+            or snapshot.built_at + self.max_age_seconds <= self._clock()
+        ):
+            return None
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale (call after committing a write); the next read rebuilds it"""
+        self._generation += 1
+
+    def refresh(self, db: Session) -> DirectorySnapshot:
+        """Rebuild the snapshot from the database"""
+        # A write invalidating during the rebuild leaves the result stale
+        generation = self._generation
+        member_repo = MemberRepository.create(db)
+        # Read before the members: a write committed in between has a higher
+        # version, so its own refresh is never discarded as older than this one
+        version = member_repo.get_change_version()
+        members = member_repo.get_members_by_status(MemberStatus.APPROVED)
+        body = to_json({"items": members})  # MemberDirectory shape
+
+        snapshot = DirectorySnapshot(
+            body=body,
+            gzipped=gzip.compress(body, compresslevel=self.compress_level, mtime=0),
+            etag=make_etag("directory", hashlib.sha256(body).hexdigest()),
+            version=version,
+            built_at=self._clock(),
+            generation=generation,
+        )
+        current = self._snapshot
+        # Two concurrent rebuilds: never replace a snapshot with an older one
+        if current is None or version >= current.version:
+            self._snapshot = snapshot
+        return snapshot
+
+    def clear(self) -> None:
+        self._snapshot = None
+        self._generation = 0
+
+
+public_directory = PublicDirectory(max_age_seconds=settings.public_directory_max_age_seconds)
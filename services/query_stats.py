@@ -0,0 +1,116 @@
+"""
+Per-request SQL statistics.
+
+Engine hooks (before/after_cursor_execute) count and time every statement and
+add it to the QueryStats of the request being handled. QueryStatsMiddleware
+starts one per HTTP request in a context variable; sync endpoints (threadpool)
+and AsyncSession calls (greenlets) inherit the context, so both engines record
+into the same object.
+
+    slow queries      any statement slower than SLOW_QUERY_MS is logged
+    repeated queries  the same SQL text QUERY_REPEAT_THRESHOLD+ times in one
+                      request is logged as a possible N+1
+    debug header      X-Query-Stats: count=4; time_ms=1.73; repeated=0
+                      (QUERY_STATS_HEADER, on outside production)
+"""
+
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+HEADER = "X-Query-Stats"
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Statements run at least ``threshold`` times (N+1 candidates)"""
+        return {sql: n for sql, n in self.statements.items() if n >= threshold}
+
+    def header_value(self, threshold: int) -> str:
+        return (
+            f"count={self.count}; time_ms={self.seconds * 1000:.2f}; "
+            f"repeated={len(self.repeated(threshold))}"
+        )
+
+
+current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def _shorten(statement: str, limit: int = 200) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + "..."
+
+
+def install_query_stats(engine: Engine, slow_query_ms: float) -> None:
+    """Count and time statements on ``engine`` (sync engine, or async_engine.sync_engine)"""
+
+    # The start time lives on the statement's execution context, so a statement
+    # that fails (no after_cursor_execute) leaves nothing behind on the connection
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany) -> None:
+        if context is not None:
+            context._query_stats_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany) -> None:
+        started = getattr(context, "_query_stats_start", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        stats = current_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+        if elapsed * 1000 >= slow_query_ms:
+            logger.warning(f"[SQL] Slow query ({elapsed * 1000:.1f} ms): {_shorten(statement)}")
+
+
+class QueryStatsMiddleware:
+    """Collect QueryStats for each HTTP request, log N+1 candidates, add the debug header"""
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 3, header: bool = False) -> None:
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+        self.header = header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_stats.set(stats)
+
+        async def send_with_header(message: Message) -> None:
+            if self.header and message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(HEADER, stats.header_value(self.repeat_threshold))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_header)
+        finally:
+            current_stats.reset(token)
+            for statement, count in stats.repeated(self.repeat_threshold).items():
+                logger.warning(
+                    f"[SQL] {scope['method']} {scope['path']} ran the same statement "
+                    f"{count} times (possible N+1): {_shorten(statement)}"
+                )
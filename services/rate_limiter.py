@@ -0,0 +1,110 @@
+"""Process-local rate limiting for endpoints that send email.
+
+Each (route, client IP) and (route, email) pair gets a token bucket holding
+up to ``requests`` tokens that refills at ``requests / seconds`` per second,
+so a client may burst to the limit and then continues at the average rate.
+Buckets live in lock-sharded dicts: concurrent requests for different keys
+rarely share a lock. A bucket that has refilled completely is equivalent to
+no bucket, so each shard periodically sweeps those out and memory stays
+bounded by the number of recently active keys.
+
+Limits are per process; with several API replicas each allows the full rate.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from config import settings
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """``requests`` per ``seconds`` (written as "5/3600" in settings)"""
+
+    requests: int
+    seconds: float
+
+    @classmethod
+    def parse(cls, text: str) -> "RateLimit":
+        try:
+            requests, seconds = text.split("/")
+            limit = cls(int(requests), float(seconds))
+        except ValueError:
+            raise ValueError(f"Rate limit must look like '<requests>/<seconds>', got {text!r}")
+        if limit.requests < 1 or limit.seconds <= 0:
+            raise ValueError(f"Rate limit must allow at least one request, got {text!r}")
+        return limit
+
+    @property
+    def per_second(self) -> float:
+        return self.requests / self.seconds
+
+
+class _Shard:
+    def __init__(self, now: float) -> None:
+        self.lock = threading.Lock()
+        # key -> [tokens, updated_at, full_at]
+        self.buckets: dict[tuple[str, str], list[float]] = {}
+        self.swept_at = now
+
+
+class RateLimiter:
+    """Token buckets keyed by (scope, key), e.g. ("register:ip", "203.0.113.7")"""
+
+    def __init__(
+        self,
+        shards: int = 16,
+        sweep_interval_seconds: float = 60.0,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.enabled = enabled
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._clock = clock
+        self._shards = [_Shard(clock()) for _ in range(shards)]
+
+    def hit(self, scope: str, key: str, limit: RateLimit) -> float:
+        """
+        Take one token for ``key``.
+
+        Returns 0.0 when the request is allowed, otherwise the seconds until a
+        token is available (rejected requests take nothing).
+        """
+        if not self.enabled:
+            return 0.0
+        bucket_key = (scope, key)
+        shard = self._shards[hash(bucket_key) % len(self._shards)]
+        now = self._clock()
+        with shard.lock:
+            if now - shard.swept_at >= self.sweep_interval_seconds:
+                self._sweep(shard, now)
+            bucket = shard.buckets.get(bucket_key)
+            if bucket is None:
+                tokens = float(limit.requests)
+            else:
+                tokens = min(limit.requests, bucket[0] + (now - bucket[1]) * limit.per_second)
+            if tokens < 1:
+                return (1 - tokens) / limit.per_second
+            tokens -= 1
+            full_at = now + (limit.requests - tokens) / limit.per_second
+            shard.buckets[bucket_key] = [tokens, now, full_at]
+            return 0.0
+
+    @staticmethod
+    def _sweep(shard: _Shard, now: float) -> None:
+        """Drop buckets that have refilled completely (caller holds the shard lock)"""
+        shard.buckets = {key: b for key, b in shard.buckets.items() if b[2] > now}
+        shard.swept_at = now
+
+    def __len__(self) -> int:
+        return sum(len(shard.buckets) for shard in self._shards)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.buckets.clear()
+
+
+rate_limiter = RateLimiter(enabled=settings.rate_limit_enabled)
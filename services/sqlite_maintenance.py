@@ -0,0 +1,58 @@
+import asyncio
+import logging
+
+from sqlalchemy.engine import Engine
+
+from config import settings
+from database import engine, run_sqlite_maintenance
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteMaintenance:
+    """
+    Background task that periodically runs ``run_sqlite_maintenance``
+    (WAL checkpoint + PRAGMA optimize) on the sync engine.
+
+    Does nothing on non-SQLite databases or when the interval is 0.
+    """
+
+    def __init__(self, target: Engine = engine, interval_seconds: float | None = None):
+        self.target = target
+        self.interval_seconds = (
+            settings.sqlite_maintenance_interval_seconds if interval_seconds is None else interval_seconds
+        )
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return self.target.dialect.name == "sqlite" and self.interval_seconds > 0
+
+    async def run(self) -> None:
+        """Run maintenance every interval until stop() is called"""
+        while True:
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval_seconds)
+                return
+            except TimeoutError:
+                pass
+            try:
+                await asyncio.to_thread(run_sqlite_maintenance, self.target)
+            except Exception:
+                logger.exception("[SQLITE] Maintenance pass failed")
+
+    def start(self) -> None:
+        """Start the loop as a task on the running event loop (no-op when disabled)"""
+        if not self.enabled:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the loop; a running pass finishes first"""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
@@ -1,10 +1,145 @@
-import pytest
-from fastapi.testclient import TestClient
+import asyncio
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
 
-from main import app
+# Point the app at a throwaway SQLite file before anything imports config
+_test_dir = tempfile.mkdtemp(prefix="member-service-test-")
+_test_db_path = Path(_test_dir) / "test.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{_test_db_path}"
+os.environ["APP_ENV"] = "testing"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from config import settings  # noqa: E402
+from database import Base, SessionLocal, async_engine, engine  # noqa: E402
+from main import app  # noqa: E402
+from services.member_cache import member_cache  # noqa: E402
+from services.metrics import registry  # noqa: E402
+from services.public_directory import public_directory  # noqa: E402
+from services.query_stats import QueryStats  # noqa: E402
+from services.rate_limiter import rate_limiter  # noqa: E402
+
+ADMIN_HEADERS = {"X-Admin-Key": "dev-admin-key-change-in-production"}
+
+
+@pytest.fixture(autouse=True)
+def _database():
+    """Give every test a fresh, empty database"""
+    _dispose_engines()
+    _test_db_path.unlink(missing_ok=True)
+    Base.metadata.create_all(bind=engine)
+    member_cache.clear()
+    public_directory.clear()
+    registry.clear()
+    rate_limiter.clear()
+    yield
+    _dispose_engines()
+
+
+def _dispose_engines() -> None:
+    engine.dispose()
+    asyncio.run(async_engine.dispose())
+
+
+@pytest.fixture
+def db():
+    """SQLAlchemy session bound to the test database"""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
 
 
 @pytest.fixture
 def client():
     """Create a test client"""
     return TestClient(app)
+
+
+@pytest.fixture
+def admin_headers():
+    """Headers accepted by require_internal_admin"""
+    return dict(ADMIN_HEADERS)
+
+
+@pytest.fixture
+def make_member(db):
+    """Insert a member directly through the repository"""
+    from models.member import MemberStatus
+    from repositories.member_repository import MemberRepository
+    from schemas.member import MemberCreate
+
+    counter = iter(range(1, 1_000_000))
+
+    def _make(status: MemberStatus = MemberStatus.APPROVED, **overrides):
+        n = next(counter)
+        data = {
+            "email": f"member{n}@example.com",
+            "name": f"회원{n}",
+            "generation": 40,
+            "rank": "정회원",
+            "skills": [{"skill_name": "Python"}],
+            "links": [{"link_type": "github", "url": f"https://github.com/member{n}"}],
+        }
+        data.update(overrides)
+        repo = MemberRepository.create(db)
+        member = repo.add_member(MemberCreate(**data))
+        if status != MemberStatus.UNVERIFIED:
+            member = repo.update_member_status(member, status)
+        return member
+
+    return _make
+
+
+@contextmanager
+def count_statements():
+    """Collect every statement sent to the database (executemany counts once)"""
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split(None, 1)[0].upper())
+
+    engines = (engine, async_engine.sync_engine)
+    for target in engines:
+        event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Context manager asserting that a block (usually one request) runs at most
+    ``max_queries`` statements and repeats none of them (no N+1)
+    """
+
+    @contextmanager
+    def _budget(max_queries: int, repeat_threshold: int = settings.query_repeat_threshold):
+        stats = QueryStats()
+
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            stats.record(statement, 0.0)
+
+        engines = (engine, async_engine.sync_engine)
+        for target in engines:
+            event.listen(target, "after_cursor_execute", after_cursor_execute)
+        try:
+            yield stats
+        finally:
+            for target in engines:
+                event.remove(target, "after_cursor_execute", after_cursor_execute)
+
+        listing = "\n".join(f"{n}x {sql}" for sql, n in stats.statements.items())
+        assert stats.count <= max_queries, f"{stats.count} > {max_queries} queries:\n{listing}"
+        repeated = stats.repeated(repeat_threshold)
+        assert not repeated, f"repeated statements (N+1?):\n{listing}"
+
+    return _budget
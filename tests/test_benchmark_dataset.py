@@ -0,0 +1,31 @@
+from benchmarks.dataset import generate_members, seed_members
+from benchmarks.results import compare, summarize
+from models.member import Member, MemberStatus
+
+
+def test_generated_members_are_deterministic():
+    first = list(generate_members(200, seed=7))
+
+    assert first == list(generate_members(200, seed=7))
+    assert list(generate_members(10, seed=7, start=50)) == first[50:60]
+    assert first != list(generate_members(200, seed=8))
+    assert len({row.email for row in first}) == 200
+    assert {row.status for row in first} == set(MemberStatus)
+
+
+def test_seed_members_uses_the_import_path(db, client, admin_headers):
+    assert seed_members(db, 120, seed=3, chunk_size=50) == 120
+
+    assert db.query(Member).count() == 120
+    approved = db.query(Member).filter(Member.status == MemberStatus.APPROVED).count()
+    assert client.get("/members/stats", headers=admin_headers).json()["total"] == 120
+    assert len(client.get("/members/directory").json()["items"]) == approved
+
+
+def test_summaries_and_comparison():
+    summary = summarize([i / 1000 for i in range(1, 101)])  # 1..100 ms
+
+    assert summary["count"] == 100
+    assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"]) == (50, 95, 99)
+    rows = compare({"results": {"rps": 100, "steps": {"list": 4}}}, {"results": {"rps": 120}})
+    assert rows == [("rps", 100, 120, 20.0)]
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from schemas.member import MemberPage, MemberResponse
+from utils.compression import CompressionMiddleware
+from utils.responses import PydanticJSONResponse
+
+
+def _get(client, path: str, accept_encoding: str):
+    return client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+def test_large_lists_are_gzipped(client, make_member):
+    for _ in range(20):
+        make_member(description="자기소개 " * 20)
+
+    compressed = _get(client, "/members", "gzip")
+    plain = _get(client, "/members", "identity")
+
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert int(compressed.headers["Content-Length"]) < len(plain.content) / 3
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.json() == plain.json()
+
+
+def test_small_responses_are_not_compressed(client):
+    response = _get(client, "/health", "gzip")
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_large_lists_are_brotli_encoded(client, make_member):
+    pytest.importorskip("brotli")  # the "brotli" extra; httpx decodes br with it too
+    for _ in range(20):
+        make_member(description="자기소개 " * 20)
+
+    compressed = client.get("/members", headers={"Accept-Encoding": "gzip, br"})
+    plain = _get(client, "/members", "identity")
+
+    assert compressed.headers["Content-Encoding"] == "br"
+    assert int(compressed.headers["Content-Length"]) < len(plain.content) / 3
+    assert compressed.json() == plain.json()
+
+
+def test_brotli_is_preferred_when_available():
+    pytest.importorskip("brotli")
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=10)
+
+    @app.get("/data")
+    def data():
+        return {"items": ["x" * 100]}
+
+    response = _get(TestClient(app), "/data", "gzip, br")
+
+    assert response.headers["Content-Encoding"] == "br"
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_streaming_responses_are_compressed_chunk_by_chunk(encoding):
+    if encoding == "br":
+        pytest.importorskip("brotli")
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=10)
+    lines = [json.dumps({"n": n, "text": "x" * 50}) + "\n" for n in range(100)]
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter(lines), media_type="application/x-ndjson")
+
+    response = _get(TestClient(app), "/stream", encoding)
+
+    assert response.headers["Content-Encoding"] == encoding
+    assert "Content-Length" not in response.headers
+    assert response.text == "".join(lines)  # decoded by the client
+
+
+def test_pydantic_response_matches_the_response_model(make_member):
+    member = MemberResponse.model_validate(make_member(description="설명"))
+    page = MemberPage(items=[member], next_cursor="abc")
+
+    body = PydanticJSONResponse(page).body
+
+    assert json.loads(body) == page.model_dump(mode="json")
+    assert "설명".encode() in body  # not \\u-escaped
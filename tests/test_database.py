@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from config import Settings
+from database import (
+    async_engine,
+    create_missing_indexes,
+    engine,
+    engine_options,
+    run_sqlite_maintenance,
+    sqlite_pragmas,
+    to_async_url,
+)
+
+EXPECTED = {
+    "journal_mode": "wal",
+    "synchronous": 1,  # NORMAL
+    "cache_size": -16384,
+    "busy_timeout": 5000,
+    "temp_store": 2,  # MEMORY
+    "foreign_keys": 1,
+}
+
+
+def _read_pragmas(connection) -> dict:
+    return {name: connection.execute(text(f"PRAGMA {name}")).scalar() for name in EXPECTED}
+
+
+def test_sync_connections_are_tuned():
+    with engine.connect() as connection:
+        assert _read_pragmas(connection) == EXPECTED
+
+
+def test_async_connections_are_tuned():
+    async def read() -> dict:
+        async with async_engine.connect() as connection:
+            return await connection.run_sync(_read_pragmas)
+
+    assert asyncio.run(read()) == EXPECTED
+
+
+def test_tuning_can_be_disabled():
+    assert sqlite_pragmas(Settings(sqlite_tuning_enabled=False)) == []
+    pragmas = sqlite_pragmas(Settings(sqlite_synchronous="FULL", sqlite_foreign_keys=False))
+    assert "PRAGMA synchronous = FULL" in pragmas
+    assert "PRAGMA foreign_keys = OFF" in pragmas
+
+
+def test_foreign_keys_are_enforced(db):
+    with pytest.raises(IntegrityError):
+        db.execute(text("INSERT INTO member_skill (member_id, skill_name) VALUES (999, 'x')"))
+    db.rollback()
+
+
+def test_maintenance_checkpoints_the_wal(make_member):
+    make_member()
+    run_sqlite_maintenance(engine)
+
+    with engine.connect() as connection:
+        busy, wal_pages, checkpointed = connection.execute(
+            text("PRAGMA wal_checkpoint(PASSIVE)")
+        ).one()
+    assert (busy, wal_pages) == (0, 0)
+
+
+def test_pool_options_come_from_settings():
+    config = Settings(db_pool_size=20, db_max_overflow=0, db_pool_pre_ping=False)
+
+    options = engine_options("postgresql://user:pw@db/jaram", config)
+
+    assert options["pool_size"] == 20
+    assert options["max_overflow"] == 0
+    assert options["pool_pre_ping"] is False
+    assert options["pool_recycle"] == config.db_pool_recycle_seconds
+    assert "connect_args" not in options
+    assert to_async_url("postgresql://user:pw@db/jaram") == "postgresql+asyncpg://user:pw@db/jaram"
+
+
+def test_in_memory_sqlite_gets_no_pool_options():
+    assert engine_options("sqlite://") == {"connect_args": {"check_same_thread": False}}
+    assert engine_options("sqlite:///data/jaram.db")["pool_size"] == 5
+
+
+def test_missing_indexes_are_added_to_existing_tables():
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_member_skill_member_id"))
+
+    assert create_missing_indexes(engine) == ["ix_member_skill_member_id"]
+    assert create_missing_indexes(engine) == []
@@ -0,0 +1,195 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.email_outbox import EmailKind, EmailOutbox, EmailStatus
+from models.member import MemberStatus
+from services.email_dispatcher import EmailDispatcher
+from services.email_service import EmailMessage, EmailService
+from tests.conftest import count_statements
+
+
+class FakeEmailService(EmailService):
+    """Records sends in memory; the first ``fail_times`` sends (or batches) raise"""
+
+    def __init__(self, fail_times: int = 0):
+        self.fail_times = fail_times
+        self.sent: list[tuple[str, str, str]] = []
+        self.batches: list[int] = []
+
+    def _record(self, kind: str, email: str, value: str) -> None:
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise RuntimeError("provider unavailable")
+        self.sent.append((kind, email, value))
+
+    def send_magic_link(self, email: str, magic_link_url: str) -> None:
+        self._record("magic_link", email, magic_link_url)
+
+    def send_approval_notification(self, email: str, member_name: str) -> None:
+        self._record("approval", email, member_name)
+
+    def send_rejection_notification(self, email: str, member_name: str) -> None:
+        self._record("rejection", email, member_name)
+
+    def send_batch(self, messages: list[EmailMessage]) -> list[Exception | None]:
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            error = RuntimeError("provider unavailable")
+            return [error] * len(messages)
+        self.batches.append(len(messages))
+        self.sent.extend(("batch", m.to, m.subject) for m in messages)
+        return [None] * len(messages)
+
+
+def _dispatcher(email_service, **overrides) -> EmailDispatcher:
+    """Dispatcher without the coalescing window, so due emails go out at once"""
+    return EmailDispatcher(email_service, **{"coalesce_window_seconds": 0, **overrides})
+
+
+def _register(client, email="outbox@example.com"):
+    response = client.post(
+        "/members/register",
+        json={"email": email, "name": "아웃박스", "generation": 41, "rank": "정회원"},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_register_queues_email_and_dispatcher_sends_it(client, db):
+    _register(client)
+
+    emails = db.query(EmailOutbox).all()
+    assert [(e.kind, e.recipient, e.status) for e in emails] == [
+        (EmailKind.MAGIC_LINK, "outbox@example.com", EmailStatus.PENDING)
+    ]
+
+    fake = FakeEmailService()
+    assert _dispatcher(fake).dispatch_once() == 1
+    assert fake.sent == [("batch", "outbox@example.com", "Jaram 이메일 인증")]
+
+    db.expire_all()
+    email = db.query(EmailOutbox).one()
+    assert email.status == EmailStatus.SENT
+    assert email.sent_at is not None
+    assert _dispatcher(fake).dispatch_once() == 0
+
+
+def test_approve_queues_notification_in_same_commit(client, make_member, admin_headers, db):
+    member = make_member(status=MemberStatus.PENDING, name="승인대상")
+
+    response = client.post(f"/members/{member.id}/approve", headers=admin_headers)
+    assert response.status_code == 200
+
+    email = db.query(EmailOutbox).one()
+    assert email.kind == EmailKind.APPROVAL
+    assert email.payload == {"member_name": "승인대상"}
+
+
+def test_failed_sends_back_off_then_go_dead(client, db):
+    _register(client)
+    fake = FakeEmailService(fail_times=100)
+    dispatcher = _dispatcher(fake, max_attempts=3, base_backoff_seconds=60)
+
+    assert dispatcher.dispatch_once() == 1
+    db.expire_all()
+    email = db.query(EmailOutbox).one()
+    assert (email.status, email.attempts) == (EmailStatus.PENDING, 1)
+    assert email.last_error == "provider unavailable"
+    # Not due yet: the retry waits for the backoff
+    assert dispatcher.dispatch_once() == 0
+
+    for _ in range(2):
+        email.next_attempt_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        db.commit()
+        assert dispatcher.dispatch_once() == 1
+        db.expire_all()
+        email = db.query(EmailOutbox).one()
+
+    assert (email.status, email.attempts) == (EmailStatus.DEAD, 3)
+    assert fake.sent == []
+
+
+def test_transient_failure_is_retried(client, db):
+    _register(client)
+    fake = FakeEmailService(fail_times=1)
+    dispatcher = _dispatcher(fake, base_backoff_seconds=0)
+
+    assert dispatcher.dispatch_once() == 1
+    assert dispatcher.dispatch_once() == 1
+    assert len(fake.sent) == 1
+    db.expire_all()
+    assert db.query(EmailOutbox).one().status == EmailStatus.SENT
+
+
+def test_claimed_emails_are_leased(client, db):
+    from repositories.email_outbox_repository import EmailOutboxRepository
+
+    _register(client)
+    repo = EmailOutboxRepository.create(db)
+    assert len(repo.claim_due(limit=10, lease_seconds=60)) == 1
+    # A second dispatcher (or a restart) does not pick it up until the lease expires
+    assert _dispatcher(FakeEmailService()).dispatch_once() == 0
+
+
+@pytest.mark.parametrize("returning", [True, False])
+def test_claim_is_one_update_per_batch(client, db, monkeypatch, returning):
+    from repositories.email_outbox_repository import EmailOutboxRepository
+
+    monkeypatch.setattr(db.get_bind().dialect, "update_returning", returning)
+    for n in range(5):
+        _register(client, email=f"claim{n}@example.com")
+    taken = db.query(EmailOutbox).order_by(EmailOutbox.id).first()
+    taken.next_attempt_at = datetime.now(timezone.utc) + timedelta(minutes=5)  # leased elsewhere
+    db.commit()
+
+    with count_statements() as statements:
+        claimed = EmailOutboxRepository.create(db).claim_due(limit=10, lease_seconds=60)
+
+    assert [email.recipient for email in claimed] == [f"claim{n}@example.com" for n in range(1, 5)]
+    assert all(email.attempts == 1 for email in claimed)
+    assert statements.count("UPDATE") == 1
+
+
+def test_backoff_is_exponential_and_capped():
+    dispatcher = EmailDispatcher(FakeEmailService(), base_backoff_seconds=5, max_backoff_seconds=30)
+    assert [dispatcher.backoff(n).total_seconds() for n in (1, 2, 3, 4, 5)] == [5, 10, 20, 30, 30]
+
+
+def test_partial_batches_wait_for_the_coalescing_window(client, db):
+    for n in range(3):
+        _register(client, email=f"cohort{n}@example.com")
+    fake = FakeEmailService()
+
+    # Fewer than batch_size emails, all just queued: hold them back
+    assert _dispatcher(fake, coalesce_window_seconds=60).dispatch_once() == 0
+    # A full batch does not wait
+    assert _dispatcher(fake, coalesce_window_seconds=60, batch_size=2).dispatch_once() == 2
+    # Once the window has passed the rest goes out together
+    assert _dispatcher(fake).dispatch_once() == 1
+    assert fake.batches == [2, 1]
+
+
+def test_resend_send_batch_chunks_and_reports_failures(monkeypatch):
+    import resend
+
+    from services.email_service_impl import ResendEmailService
+
+    calls = []
+
+    def fake_batch_send(params):
+        calls.append(len(params))
+        if len(calls) == 2:
+            raise RuntimeError("rate limited")
+        return {"data": [{"id": str(i)} for i in range(len(params))]}
+
+    monkeypatch.setattr(resend.Batch, "send", fake_batch_send)
+    service = ResendEmailService(api_key="re_test")
+    messages = [EmailMessage(f"m{i}@example.com", "제목", "<p>본문</p>") for i in range(250)]
+
+    results = service.send_batch(messages)
+
+    assert calls == [100, 100, 50]
+    assert results[:100] == [None] * 100
+    assert all(isinstance(r, RuntimeError) for r in results[100:200])
+    assert results[200:] == [None] * 50
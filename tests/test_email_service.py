@@ -0,0 +1,66 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import resend
+
+from services.email_service_impl import PooledHTTPClient, ResendEmailService
+
+
+class _ResendStandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    client_ports: list[int] = []
+
+    def do_POST(self) -> None:  # noqa: N802 (http.server API)
+        self.rfile.read(int(self.headers["Content-Length"]))
+        type(self).client_ports.append(self.client_address[1])
+        body = json.dumps({"id": "stand-in"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def resend_stand_in(monkeypatch):
+    _ResendStandIn.client_ports = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ResendStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    # ResendEmailService configures the SDK globals; restore them afterwards
+    monkeypatch.setattr(resend, "api_url", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(resend, "api_key", resend.api_key)
+    monkeypatch.setattr(resend, "default_http_client", resend.default_http_client)
+    yield _ResendStandIn
+    server.shutdown()
+    server.server_close()
+
+
+def test_resend_service_reuses_one_connection(resend_stand_in):
+    service = ResendEmailService(
+        api_key="re_test",
+        http_client=PooledHTTPClient(pool_size=2, connect_timeout=1, read_timeout=1),
+    )
+    for n in range(3):
+        service.send_approval_notification(f"member{n}@example.com", f"회원{n}")
+    service.close()
+
+    assert len(resend_stand_in.client_ports) == 3
+    assert len(set(resend_stand_in.client_ports)) == 1
+
+
+def test_lifespan_creates_one_email_service_for_the_app(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from config import settings
+    from main import app
+
+    monkeypatch.setattr(settings, "email_dispatcher_enabled", False)
+    with TestClient(app):
+        service = app.state.email_service
+        assert service is not None
+        assert app.state.email_dispatcher is None
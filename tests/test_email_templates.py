@@ -0,0 +1,40 @@
+import pytest
+
+import utils.jinja2 as jinja2_utils
+from utils.jinja2 import PrecompiledTemplates, TemplateRenderError, render_template
+
+CASES = {
+    "magic_link.html": {"magic_link_url": "https://api.jaram.net/auth/verify?token=a&b=<c>"},
+    "approval.html": {"member_name": "<홍길동> & 친구"},
+    "rejection.html": {"member_name": "김자람"},
+    "base.html": {},
+}
+
+
+@pytest.fixture
+def precompiled():
+    templates = PrecompiledTemplates()
+    templates.compile_all()
+    return templates
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_precompiled_output_is_byte_identical(precompiled, name):
+    expected = jinja2_utils._template_env.get_template(name).render(**CASES[name])
+    assert precompiled.render(name, **CASES[name]).encode() == expected.encode()
+
+
+def test_child_templates_use_prerendered_layout(precompiled):
+    assert precompiled._uses_layout == {
+        "approval.html": True,
+        "base.html": False,
+        "magic_link.html": True,
+        "rejection.html": True,
+    }
+
+
+def test_precompiled_mode_wraps_errors(monkeypatch, precompiled):
+    monkeypatch.setattr(jinja2_utils, "_precompiled", precompiled)
+    assert "홍길동" in render_template("approval.html", member_name="홍길동")
+    with pytest.raises(TemplateRenderError):
+        render_template("missing.html")
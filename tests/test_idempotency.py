@@ -0,0 +1,172 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from main import app
+from models.email_outbox import EmailKind, EmailOutbox
+from models.idempotency_key import IdempotencyKey
+from models.member import Member, MemberStatus
+from repositories.idempotency_repository import IdempotencyRepository
+from services.async_member_service import AsyncMemberService
+from services.idempotency import request_fingerprint, storage_key
+from tests.conftest import count_statements
+from utils.token import create_magic_link_token
+
+REGISTRATION = {"email": "retry@example.com", "name": "재시도", "generation": 41, "rank": "정회원"}
+
+
+def _register(client, key: str | None = "register-1", **overrides):
+    headers = {"Idempotency-Key": key} if key else {}
+    return client.post("/members/register", json={**REGISTRATION, **overrides}, headers=headers)
+
+
+def test_register_retry_replays_the_first_response(client, db):
+    first = _register(client)
+    retry = _register(client)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert db.query(Member).count() == 1
+    assert db.query(EmailOutbox).count() == 1  # the magic link is queued once
+    assert _register(client, key=None).status_code == 400  # without a key: already exists
+
+
+def test_key_reused_for_another_request_is_rejected(client):
+    _register(client)
+
+    response = _register(client, name="다른 이름")
+
+    assert response.status_code == 422
+
+
+def test_rate_limited_requests_never_reserve_a_key(client):
+    body = {**REGISTRATION, "email": "flood@example.com"}
+    for n in range(3):  # 3/3600 per email
+        _register(client, key=f"flood-{n}", **body)
+
+    with count_statements() as statements:
+        limited = [_register(client, key=f"flood-{n}", **body) for n in range(3, 6)]
+
+    assert [r.status_code for r in limited] == [429] * 3
+    assert statements == []  # no reservation written and released per rejected request
+
+
+def test_admin_state_changes_are_replayed(client, db, make_member, admin_headers):
+    pending = make_member(status=MemberStatus.PENDING)
+    rejected = make_member(status=MemberStatus.PENDING)
+    pending_id, rejected_id = pending.id, rejected.id
+    headers = {**admin_headers, "Idempotency-Key": "approve-1"}
+
+    approved = [client.post(f"/members/{pending_id}/approve", headers=headers) for _ in range(2)]
+    headers["Idempotency-Key"] = "reject-1"
+    removed = [client.post(f"/members/{rejected_id}/reject", headers=headers) for _ in range(2)]
+
+    assert [r.status_code for r in approved] == [200, 200]
+    assert approved[1].json() == approved[0].json()
+    assert [r.status_code for r in removed] == [204, 204]  # not 404 the second time
+    db.expire_all()
+    assert db.get(Member, rejected_id) is None
+    kinds = [email.kind for email in db.query(EmailOutbox)]
+    assert kinds.count(EmailKind.APPROVAL) == 1
+
+
+def test_keys_are_scoped_to_the_route_and_the_credential(client, db, make_member, admin_headers):
+    pending = make_member(status=MemberStatus.PENDING)
+    owner = make_member()
+    pending_id, owner_id, owner_email = pending.id, owner.id, owner.email
+    headers = {**admin_headers, "Idempotency-Key": "shared"}
+
+    approved = client.post(f"/members/{pending_id}/approve", headers=headers)
+    updated = client.put(
+        f"/members/{owner_id}",
+        params={"token": create_magic_link_token(owner_email, "profile_update")},
+        json={"name": "본인"},
+        headers={"Idempotency-Key": "shared"},
+    )
+    # Someone else's token with the owner's key: not the owner's stored response
+    other = client.put(
+        f"/members/{owner_id}",
+        params={"token": create_magic_link_token(pending.email, "profile_update")},
+        json={"name": "본인"},
+        headers={"Idempotency-Key": "shared"},
+    )
+
+    assert (approved.status_code, updated.status_code) == (200, 200)  # not 422
+    assert other.status_code == 403
+    assert "Idempotent-Replayed" not in other.headers
+    assert db.query(IdempotencyKey).count() == 2
+
+
+def test_auth_failures_are_not_stored(client, db, make_member):
+    member_id, someone_else = make_member().id, make_member().email
+    attempts = [
+        client.put(
+            f"/members/{member_id}",
+            params={"token": create_magic_link_token(someone_else, "profile_update")},
+            json={"name": "재시도"},
+            headers={"Idempotency-Key": "update-1"},
+        )
+        for _ in range(2)
+    ]
+
+    assert [r.status_code for r in attempts] == [403, 403]
+    assert "Idempotent-Replayed" not in attempts[1].headers
+    assert db.query(IdempotencyKey).count() == 0
+
+
+def test_server_errors_are_not_stored(db, monkeypatch):
+    original = AsyncMemberService.register_member
+    calls = []
+
+    async def flaky(self, member_data):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("database went away")
+        return await original(self, member_data)
+
+    monkeypatch.setattr(AsyncMemberService, "register_member", flaky)
+    client = TestClient(app, raise_server_exceptions=False)
+
+    assert _register(client).status_code == 500
+    assert _register(client).status_code == 201
+    assert len(calls) == 2
+
+
+def test_retry_during_the_first_request_gets_409(client, db):
+    body = json.dumps(REGISTRATION).encode()
+    scope = {"method": "POST", "path": "/members/register", "query_string": b""}
+    fingerprint = request_fingerprint(scope, body)
+    key = storage_key("/members/register", "\0\0", "in-flight")
+    IdempotencyRepository.create(db).reserve(key, fingerprint, lock_seconds=60)
+
+    response = client.post(
+        "/members/register",
+        content=body,
+        headers={"Content-Type": "application/json", "Idempotency-Key": "in-flight"},
+    )
+
+    assert response.status_code == 409
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_expired_responses_are_evicted(client, db):
+    _register(client)
+    repo = IdempotencyRepository.create(db)
+    stored = db.query(IdempotencyKey).one()
+    repo.complete(stored.key, stored.status_code, stored.headers, stored.body, ttl_seconds=-1)
+
+    response = _register(client)
+
+    assert response.status_code == 400  # ran again: the member already exists
+    assert "Idempotent-Replayed" not in response.headers
+
+
+def test_endpoints_without_idempotency_ignore_the_header(client, db):
+    response = client.get("/members", headers={"Idempotency-Key": "whatever"})
+    bad = _register(client, key="x" * 256)
+
+    assert response.status_code == 200
+    assert bad.status_code == 400
+    assert db.query(IdempotencyKey).count() == 0
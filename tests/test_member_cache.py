@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+
+from models.member import MemberStatus
+from schemas.member import MemberResponse
+from services.member_cache import MemberCache
+from utils.token import create_magic_link_token
+
+
+def _snapshot(member_id: int) -> MemberResponse:
+    now = datetime.now(timezone.utc)
+    return MemberResponse(
+        id=member_id,
+        email=f"member{member_id}@example.com",
+        name=f"회원{member_id}",
+        generation=40,
+        rank="정회원",
+        status=MemberStatus.APPROVED,
+        image_url=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_cache_evicts_least_recently_used():
+    cache = MemberCache(max_size=2)
+    cache.put(_snapshot(1))
+    cache.put(_snapshot(2))
+    assert cache.get_by_id(1) is not None  # 1 is now more recent than 2
+
+    cache.put(_snapshot(3))
+
+    assert cache.get_by_id(2) is None
+    assert cache.get_by_email("member2@example.com") is None
+    assert cache.get_by_email("member1@example.com").id == 1
+    assert cache.get_by_id(3).id == 3
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+
+
+def test_cache_entries_expire_after_ttl():
+    now = [0.0]
+    cache = MemberCache(ttl_seconds=10, clock=lambda: now[0])
+    cache.put(_snapshot(1))
+
+    now[0] = 9.9
+    assert cache.get_by_id(1) is not None
+    now[0] = 10.0
+    assert cache.get_by_id(1) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_invalidate_by_id_drops_email_key_too():
+    cache = MemberCache()
+    cache.put(_snapshot(1))
+
+    cache.invalidate(member_id=1)
+
+    assert cache.get_by_email("member1@example.com") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_disabled_cache_stores_nothing():
+    cache = MemberCache(enabled=False)
+    cache.put(_snapshot(1))
+    assert cache.get_by_id(1) is None
+    assert cache.stats()["misses"] == 0
+
+
+def test_reads_are_served_from_cache_and_writes_invalidate(client, make_member, admin_headers):
+    member = make_member(status=MemberStatus.PENDING)
+
+    assert client.get(f"/members/{member.id}").json()["status"] == "PENDING"
+    assert client.get(f"/members/{member.id}").json()["status"] == "PENDING"
+    stats = client.get("/health/cache").json()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    client.post(f"/members/{member.id}/approve", headers=admin_headers)
+    assert client.get(f"/members/{member.id}").json()["status"] == "APPROVED"
+
+    token = create_magic_link_token(member.email, purpose="profile_update")
+    assert client.get("/auth/verify-profile-update-json", params={"token": token}).status_code == 200
+    response = client.put(f"/members/{member.id}", params={"token": token}, json={"name": "새이름"})
+    assert response.status_code == 200
+    assert client.get(f"/members/{member.id}").json()["name"] == "새이름"
+    assert client.get("/auth/verify-profile-update-json", params={"token": token}).json()["name"] == "새이름"
+
+    client.delete(f"/members/{member.id}", headers=admin_headers)
+    assert client.get(f"/members/{member.id}").status_code == 404
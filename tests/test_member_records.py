@@ -0,0 +1,40 @@
+from pydantic_core import to_json
+
+from models.member import Member, MemberStatus
+from repositories.member_repository import MemberRepository
+from schemas.member import MemberResponse
+
+
+def test_records_serialize_like_member_response(db, make_member):
+    make_member(
+        description="소개",
+        skills=[{"skill_name": "Go"}, {"skill_name": "SQL"}],
+        links=[
+            {"link_type": "github", "url": "https://github.com/a"},
+            {"link_type": "blog", "url": "https://blog.example.com"},
+        ],
+    )
+    make_member(skills=[], links=[])
+    repo = MemberRepository.create(db)
+
+    records, _ = repo.get_members_page(limit=10)
+    db.expire_all()
+    expected = [MemberResponse.model_validate(m) for m in db.query(Member).order_by(Member.id)]
+
+    assert to_json(records) == to_json(expected)
+
+
+def test_record_pages_load_no_orm_objects(db, make_member):
+    for _ in range(3):
+        make_member()
+    db.expunge_all()
+    repo = MemberRepository.create(db)
+
+    first, next_key = repo.get_members_page(MemberStatus.APPROVED, limit=2)
+    second, last_key = repo.get_members_page(MemberStatus.APPROVED, limit=2, after=next_key)
+
+    assert len(db.identity_map) == 0
+    assert not hasattr(first[0], "__dict__")  # __slots__ record
+    assert [m.id for m in first + second] == [1, 2, 3]
+    assert last_key is None
+    assert [s.skill_name for s in first[0].skills] == ["Python"]
@@ -0,0 +1,66 @@
+import pytest
+
+from repositories.member_repository import MemberRepository
+from schemas.member import MemberUpdate
+from tests.conftest import count_statements
+
+
+@pytest.fixture
+def member(make_member):
+    return make_member(
+        skills=[{"skill_name": "Python"}, {"skill_name": "Go"}],
+        links=[{"link_type": "github", "url": "https://github.com/a"}],
+    )
+
+
+def _skills(member):
+    return sorted(skill.skill_name for skill in member.skills)
+
+
+def test_noop_update_writes_nothing(db, member):
+    repo = MemberRepository.create(db)
+    updated_at = member.updated_at
+
+    with count_statements() as statements:
+        repo.update_member(
+            member,
+            MemberUpdate(
+                name=member.name,
+                skills=[{"skill_name": "Go"}, {"skill_name": "Python"}],
+                links=[{"link_type": "github", "url": "https://github.com/a"}],
+            ),
+        )
+
+    assert statements == []
+    assert member.updated_at == updated_at
+
+
+def test_adding_one_skill_inserts_one_row(db, member):
+    repo = MemberRepository.create(db)
+    kept_ids = {skill.id for skill in member.skills}
+
+    with count_statements() as statements:
+        repo.update_member(
+            member,
+            MemberUpdate(skills=[{"skill_name": "Python"}, {"skill_name": "Go"}, {"skill_name": "Rust"}]),
+        )
+
+    writes = [s for s in statements if s in ("INSERT", "UPDATE", "DELETE")]
+    # skill executemany, skill dictionary upsert, FTS and short-term index delete + insert,
+    # member updated_at, version counter upsert
+    assert sorted(writes) == ["DELETE", "DELETE", "INSERT", "INSERT", "INSERT", "INSERT", "INSERT", "UPDATE"]
+    assert _skills(member) == ["Go", "Python", "Rust"]
+    assert kept_ids < {skill.id for skill in member.skills}
+
+
+def test_removing_one_link_deletes_one_row(db, member):
+    repo = MemberRepository.create(db)
+
+    with count_statements() as statements:
+        repo.update_member(member, MemberUpdate(links=[]))
+
+    writes = [s for s in statements if s in ("INSERT", "UPDATE", "DELETE")]
+    # link delete, member updated_at, version counter upsert (no re-index: search fields unchanged)
+    assert sorted(writes) == ["DELETE", "INSERT", "UPDATE"]
+    assert member.links == []
+    assert _skills(member) == ["Go", "Python"]
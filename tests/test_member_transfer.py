@@ -0,0 +1,139 @@
+import io
+import json
+
+from repositories.member_repository import MemberRepository
+from schemas.member import TransferFormat
+from services.member_transfer import import_members
+from tests.conftest import count_statements
+
+
+def _ndjson(records) -> bytes:
+    return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records).encode()
+
+
+def _export(client, admin_headers, fmt: str) -> str:
+    response = client.get("/members/export", params={"format": fmt}, headers=admin_headers)
+    assert response.status_code == 200
+    return response.text
+
+
+def test_export_ndjson_streams_every_member(client, make_member, admin_headers):
+    """One JSON object per member, ordered by id, with skills and links"""
+    ids = [make_member().id for _ in range(3)]
+
+    lines = _export(client, admin_headers, "ndjson").splitlines()
+
+    records = [json.loads(line) for line in lines]
+    assert [record["id"] for record in records] == ids
+    assert records[0]["skills"] == ["Python"]
+    assert records[0]["links"][0]["link_type"] == "github"
+    assert records[0]["rank"] == "정회원"
+
+
+def test_export_requires_admin(client):
+    headers = {"X-Admin-Key": "wrong"}
+    assert client.get("/members/export", headers=headers).status_code == 403
+    response = client.post("/members/import", files={"file": ("m.csv", b"")}, headers=headers)
+    assert response.status_code == 403
+
+
+def test_csv_export_round_trips_through_import(client, db, make_member, admin_headers):
+    """An export can be imported into an empty database unchanged"""
+    make_member(description="첫 줄, 쉼표 포함", skills=[{"skill_name": "Machine Learning"}])
+    make_member(
+        links=[
+            {"link_type": "github", "url": "https://github.com/a"},
+            {"link_type": "blog", "url": "https://blog.example.com/?a=1"},
+        ]
+    )
+    exported = _export(client, admin_headers, "csv")
+    before = json.loads(_export(client, admin_headers, "ndjson").splitlines()[0])
+    client.post(
+        "/members/batch/delete",
+        json={"ids": [1, 2]},
+        headers=admin_headers,
+    )
+
+    response = client.post(
+        "/members/import",
+        files={"file": ("members.csv", exported.encode(), "text/csv")},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 2, "failed": 0, "errors": [], "errors_truncated": False}
+    after = [json.loads(line) for line in _export(client, admin_headers, "ndjson").splitlines()]
+    assert after[0]["description"] == before["description"]
+    assert after[0]["skills"] == ["Machine Learning"]
+    assert [link["url"] for link in after[1]["links"]] == [
+        "https://github.com/a",
+        "https://blog.example.com/?a=1",
+    ]
+    assert client.get("/members/stats", headers=admin_headers).json()["total"] == 2
+    search = client.get("/members/search", params={"q": "Machine"}, headers=admin_headers)
+    assert [m["email"] for m in search.json()["items"]] == [after[0]["email"]]
+
+
+def test_import_reports_row_errors_and_keeps_valid_rows(client, make_member, admin_headers):
+    existing = make_member()
+    records = [
+        {"email": "new1@example.com", "name": "신규1", "generation": 41, "rank": "OB"},
+        {"email": existing.email, "name": "중복", "generation": 41, "rank": "OB"},
+        {"email": "new2@example.com", "name": "신규2", "generation": 41, "rank": "없는등급"},
+        {"email": "new1@example.com", "name": "파일내중복", "generation": 41, "rank": "OB"},
+    ]
+    body = _ndjson(records) + b"{not json\n"
+
+    response = client.post(
+        "/members/import",
+        files={"file": ("members.ndjson", body)},
+        headers=admin_headers,
+    )
+
+    result = response.json()
+    assert response.status_code == 200
+    assert result["inserted"] == 1
+    assert result["failed"] == 4
+    errors = {error["row"]: error["error"] for error in result["errors"]}
+    assert set(errors) == {2, 3, 4, 5}
+    assert "already exists" in errors[2]
+    assert errors[3].startswith("rank:")
+    assert "invalid JSON" in errors[5]
+
+    imported = client.get("/members", params={"status": "APPROVED"}).json()["items"]
+    assert {m["email"] for m in imported} == {existing.email, "new1@example.com"}
+
+
+def test_import_needs_a_known_format(client, admin_headers):
+    response = client.post(
+        "/members/import", files={"file": ("members.txt", b"")}, headers=admin_headers
+    )
+    assert response.status_code == 400
+
+
+def test_import_writes_each_chunk_with_executemany(db):
+    """Statements per chunk are constant, not per row"""
+    records = [
+        {
+            "email": f"bulk{i}@example.com",
+            "name": f"회원{i}",
+            "generation": 40,
+            "rank": "정회원",
+            "skills": ["Python", "SQL"],
+            "links": [{"link_type": "github", "url": f"https://github.com/bulk{i}"}],
+        }
+        for i in range(250)
+    ]
+
+    with count_statements() as statements:
+        result = import_members(io.BytesIO(_ndjson(records)), TransferFormat.NDJSON, chunk_size=100)
+
+    assert result.inserted == 250
+    # 3 chunks x (email check, members, skills, links, search rows, short-term grams,
+    # counters, skill counts)
+    assert statements.count("INSERT") <= 3 * 7
+    # plus one public directory rebuild at the end (version, members, skills, links)
+    assert len(statements) <= 3 * 9 + 4
+    skills, links = MemberRepository.create(db).get_skills_and_links([1, 250])
+    assert skills[250] == ["Python", "SQL"]
+    assert links[1][0][1] == "https://github.com/bulk0"
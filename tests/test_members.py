@@ -0,0 +1,292 @@
+from models.member import MemberStatus
+
+
+def test_list_members_pages_through_everything(client, make_member):
+    """Walking next_cursor visits every member exactly once, in order"""
+    created = [make_member().id for _ in range(7)]
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/members", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        seen.extend(m["id"] for m in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == created
+
+
+def test_list_members_desc_with_status_filter(client, make_member):
+    """order=desc returns newest first and status filters the page"""
+    approved = [make_member().id for _ in range(3)]
+    make_member(status=MemberStatus.PENDING)
+
+    response = client.get("/members", params={"status": "APPROVED", "order": "desc", "limit": 2})
+    page = response.json()
+    assert [m["id"] for m in page["items"]] == approved[::-1][:2]
+
+    response = client.get(
+        "/members",
+        params={"status": "APPROVED", "order": "desc", "limit": 2, "cursor": page["next_cursor"]},
+    )
+    page = response.json()
+    assert [m["id"] for m in page["items"]] == [approved[0]]
+    assert page["next_cursor"] is None
+
+
+def test_list_members_rejects_bad_cursor(client):
+    """A malformed cursor is a client error"""
+    response = client.get("/members", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_search_members_matches_name_email_and_skills(client, make_member, admin_headers):
+    """Search is substring-based over the indexed columns and respects status"""
+    rust = make_member(name="김러스트", skills=[{"skill_name": "Rust"}]).id
+    make_member(name="박파이썬", email="python.park@example.com")
+    make_member(name="최대기", skills=[{"skill_name": "Rust"}], status=MemberStatus.PENDING)
+
+    response = client.get(
+        "/members/search", params={"q": "rus", "status": "APPROVED"}, headers=admin_headers
+    )
+    assert response.status_code == 200
+    assert [m["id"] for m in response.json()["items"]] == [rust]
+
+    response = client.get("/members/search", params={"q": "python.park"}, headers=admin_headers)
+    assert [m["name"] for m in response.json()["items"]] == ["박파이썬"]
+
+
+def test_search_members_matches_part_of_a_korean_name(client, make_member, admin_headers):
+    """A given name finds the full name, including two-syllable terms below the trigram length"""
+    kim = make_member(name="김러스트").id
+    lee = make_member(name="이민수", email="lee@example.com").id
+    make_member(name="박파이썬")
+
+    for query, expected in (("러스트", [kim]), ("민수", [lee]), ("이민수", [lee]), ("수", [lee])):
+        response = client.get("/members/search", params={"q": query}, headers=admin_headers)
+        assert [m["id"] for m in response.json()["items"]] == expected, query
+
+    response = client.get("/members/search", params={"q": "김 러스트"}, headers=admin_headers)
+    assert [m["id"] for m in response.json()["items"]] == [kim]
+
+    response = client.get("/members/search", params={"q": "%"}, headers=admin_headers)
+    assert response.json()["items"] == []
+
+
+def test_short_terms_match_names_and_skills_only(client, make_member, admin_headers):
+    """One- and two-character terms use the short-term table: names and skills, not email or text"""
+    park = make_member(name="박지성", skills=[{"skill_name": "Go"}]).id
+    make_member(name="최대기", email="go@example.com", description="Go 개발자")
+
+    for query, expected in (("go", [park]), ("지성", [park]), ("GO 박", [park]), ("박지성 go", [park])):
+        response = client.get("/members/search", params={"q": query}, headers=admin_headers)
+        assert [m["id"] for m in response.json()["items"]] == expected, query
+
+
+def test_search_index_follows_updates_and_deletes(client, db, make_member, admin_headers):
+    """Profile updates re-index the member and deletes drop it"""
+    from repositories.member_repository import MemberRepository
+    from schemas.member import MemberUpdate
+
+    member = make_member()
+    repo = MemberRepository.create(db)
+    repo.update_member(member, MemberUpdate(skills=[{"skill_name": "Kubernetes"}]))
+
+    for query in ("kube", "ku"):
+        response = client.get("/members/search", params={"q": query}, headers=admin_headers)
+        assert [m["id"] for m in response.json()["items"]] == [member.id], query
+
+    repo.delete_member(member)
+    for query in ("kube", "ku"):
+        response = client.get("/members/search", params={"q": query}, headers=admin_headers)
+        assert response.json()["items"] == [], query
+
+
+def test_search_requires_admin(client):
+    response = client.get("/members/search", params={"q": "x"}, headers={"X-Admin-Key": "wrong"})
+    assert response.status_code == 403
+
+
+def test_member_stats_follow_writes(client, db, make_member, admin_headers):
+    """Counters track register, status changes and deletes without a scan"""
+    from repositories.member_repository import MemberRepository
+
+    make_member(generation=40)
+    make_member(generation=41, rank="OB", status=MemberStatus.PENDING)
+    doomed = make_member(generation=41, status=MemberStatus.UNVERIFIED)
+    MemberRepository.create(db).delete_member(doomed)
+
+    response = client.get("/members/stats", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json() == {
+        "total": 2,
+        "by_status": {"UNVERIFIED": 0, "PENDING": 1, "APPROVED": 1},
+        "by_rank": {"정회원": 1, "OB": 1},
+        "by_generation": {"40": 1, "41": 1},
+    }
+
+
+def test_reconcile_stats_repairs_drift(db, make_member):
+    """reconcile_stats rebuilds counters from the member table"""
+    from models.member_stat import MemberStat
+    from repositories.member_repository import MemberRepository
+
+    make_member()
+    make_member(status=MemberStatus.PENDING)
+    db.query(MemberStat).delete()
+    db.commit()
+
+    repo = MemberRepository.create(db)
+    repo.reconcile_stats()
+    stats = repo.get_stats()
+    assert stats["status"] == {"APPROVED": 1, "PENDING": 1}
+    assert stats["generation"] == {"40": 2}
+
+
+def test_register_verify_approve_update_flow(client, admin_headers):
+    """The whole member lifecycle through the async routers"""
+    from utils.token import create_magic_link_token
+
+    response = client.post(
+        "/members/register",
+        json={
+            "email": "flow@example.com",
+            "name": "플로우",
+            "generation": 41,
+            "rank": "정회원",
+            "skills": [{"skill_name": "Docker"}],
+            "links": [{"link_type": "github", "url": "https://github.com/flow"}],
+        },
+    )
+    assert response.status_code == 201
+    member = response.json()
+    assert member["status"] == "UNVERIFIED"
+    assert [s["skill_name"] for s in member["skills"]] == ["Docker"]
+
+    duplicate = client.post("/members/register", json={**member, "skills": [], "links": []})
+    assert duplicate.status_code == 400
+
+    token = create_magic_link_token("flow@example.com", purpose="registration")
+    response = client.get("/auth/verify", params={"token": token})
+    assert response.status_code == 200
+
+    response = client.post(f"/members/{member['id']}/approve", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "APPROVED"
+
+    token = create_magic_link_token("flow@example.com", purpose="profile_update")
+    response = client.put(
+        f"/members/{member['id']}",
+        params={"token": token},
+        json={"description": "수정됨", "skills": [{"skill_name": "Go"}]},
+    )
+    assert response.status_code == 200
+    assert response.json()["description"] == "수정됨"
+    assert [s["skill_name"] for s in response.json()["skills"]] == ["Go"]
+
+    response = client.post(f"/members/{member['id']}/reject", headers=admin_headers)
+    assert response.status_code == 204
+    assert client.get(f"/members/{member['id']}").status_code == 404
+
+
+def test_member_etag_returns_304_until_the_member_changes(client, db, make_member):
+    from repositories.member_repository import MemberRepository
+    from schemas.member import MemberUpdate
+    from services.member_cache import member_cache
+
+    member = make_member()
+    response = client.get(f"/members/{member.id}")
+    etag = response.headers["etag"]
+
+    response = client.get(f"/members/{member.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    assert client.get(f"/members/{member.id}", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+
+    # Changing only skills must still produce a new ETag (the repository bypasses
+    # MemberService, so drop the cached snapshot by hand)
+    MemberRepository.create(db).update_member(member, MemberUpdate(skills=[{"skill_name": "Rust"}]))
+    member_cache.invalidate(member.id)
+    response = client.get(f"/members/{member.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert [s["skill_name"] for s in response.json()["skills"]] == ["Rust"]
+
+
+def test_members_list_etag_follows_table_version(client, make_member, admin_headers):
+    member = make_member()
+    response = client.get("/members", params={"limit": 10})
+    etag = response.headers["etag"]
+
+    response = client.get("/members", params={"limit": 10}, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Different query parameters are a different representation
+    response = client.get("/members", params={"limit": 5}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+    client.post(f"/members/{member.id}/reject", headers=admin_headers)
+    response = client.get("/members", params={"limit": 10}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+
+def test_batch_approve_reports_per_id_results(client, db, make_member, admin_headers):
+    from models.email_outbox import EmailKind, EmailOutbox
+    from tests.conftest import count_statements
+
+    cohort = [make_member(status=MemberStatus.PENDING) for _ in range(3)]
+    approved = make_member(status=MemberStatus.APPROVED)
+    ids = [m.id for m in cohort] + [approved.id, 9999, cohort[0].id]
+
+    with count_statements() as statements:
+        response = client.post("/members/batch/approve", json={"ids": ids}, headers=admin_headers)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "results": [{"id": m.id, "result": "ok"} for m in cohort]
+        + [{"id": approved.id, "result": "wrong_status"}, {"id": 9999, "result": "not_found"}],
+        "succeeded": 3,
+    }
+    assert statements.count("UPDATE") == 1
+
+    stats = client.get("/members/stats", headers=admin_headers).json()
+    assert stats["by_status"] == {"UNVERIFIED": 0, "PENDING": 0, "APPROVED": 4}
+    emails = db.query(EmailOutbox).all()
+    assert sorted(e.recipient for e in emails) == sorted(m.email for m in cohort)
+    assert {e.kind for e in emails} == {EmailKind.APPROVAL}
+    assert client.get(f"/members/{cohort[1].id}").json()["status"] == "APPROVED"
+
+
+def test_batch_reject_and_delete_remove_rows(client, make_member, admin_headers):
+    pending = make_member(status=MemberStatus.PENDING, skills=[{"skill_name": "Haskell"}])
+    approved = make_member(status=MemberStatus.APPROVED)
+    # Cached before the batch: must not survive it
+    assert client.get(f"/members/{approved.id}").status_code == 200
+
+    response = client.post(
+        "/members/batch/reject", json={"ids": [pending.id, approved.id]}, headers=admin_headers
+    )
+    assert [r["result"] for r in response.json()["results"]] == ["ok", "wrong_status"]
+    search = client.get("/members/search", params={"q": "haskell"}, headers=admin_headers)
+    assert search.json()["items"] == []
+
+    response = client.post("/members/batch/delete", json={"ids": [approved.id]}, headers=admin_headers)
+    assert response.json()["succeeded"] == 1
+    assert client.get(f"/members/{approved.id}").status_code == 404
+    assert client.get("/members/stats", headers=admin_headers).json()["total"] == 0
+
+
+def test_batch_endpoints_require_admin_and_bounded_ids(client, admin_headers):
+    assert client.post("/members/batch/approve", json={"ids": [1]}).status_code == 422
+    wrong_key = {"X-Admin-Key": "wrong"}
+    assert client.post("/members/batch/approve", json={"ids": [1]}, headers=wrong_key).status_code == 403
+    too_many = {"ids": list(range(501))}
+    assert client.post("/members/batch/delete", json=too_many, headers=admin_headers).status_code == 422
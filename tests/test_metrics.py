@@ -0,0 +1,123 @@
+import threading
+
+from services.email_dispatcher import EmailDispatcher
+from services.email_service_impl import MockEmailService
+from services.metrics import registry
+from utils.metrics import Counter, Histogram
+
+
+def _sample(text: str, name: str, **labels: str) -> float:
+    """Value of the sample ``name{labels}`` in Prometheus text output"""
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        series, value = line.rsplit(" ", 1)
+        metric, _, label_text = series.partition("{")
+        pairs = dict(
+            pair.split("=", 1) for pair in label_text.rstrip("}").split(",") if pair
+        )
+        if metric == name and {k: v.strip('"') for k, v in pairs.items()} == labels:
+            return float(value)
+    raise AssertionError(f"no sample {name}{labels}")
+
+
+def test_requests_are_labelled_by_route_template(client, make_member):
+    member = make_member()
+    client.get(f"/members/{member.id}")
+    client.get("/members/999999")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    route = "/members/{member_id}"
+    assert _sample(text, "http_requests_total", method="GET", route=route, status="200") == 1
+    assert _sample(text, "http_requests_total", method="GET", route=route, status="404") == 1
+    assert (
+        _sample(
+            text, "http_request_duration_seconds_count", method="GET", route=route, status="200"
+        )
+        == 1
+    )
+    assert f'route="/members/{member.id}"' not in text
+
+
+def test_unmatched_paths_share_one_label(client):
+    client.get("/no-such-page")
+    client.get("/another-missing-page")
+
+    text = client.get("/metrics").text
+
+    assert _sample(text, "http_requests_total", method="GET", route="unmatched", status="404") == 2
+
+
+def test_db_connection_time_and_cache_ratio_are_exported(client, make_member):
+    member = make_member()
+    client.get(f"/members/{member.id}")
+    client.get(f"/members/{member.id}")  # served from the member cache
+
+    text = client.get("/metrics").text
+
+    assert _sample(text, "db_connection_held_seconds_count", engine="sync") > 0
+    assert _sample(text, "member_cache_lookups_total", result="hit") >= 1
+    assert 0 < _sample(text, "member_cache_hit_ratio") <= 1
+
+
+def test_email_batches_are_timed_per_provider(client):
+    client.post(
+        "/members/register",
+        json={"email": "metrics@example.com", "name": "메트릭", "generation": 41, "rank": "정회원"},
+    )
+
+    EmailDispatcher(MockEmailService(), coalesce_window_seconds=0).dispatch_once()
+    text = registry.render()
+
+    assert _sample(text, "emails_sent_total", provider="mock", outcome="ok") == 1
+    assert _sample(text, "email_send_duration_seconds_count", provider="mock", outcome="ok") == 1
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency_seconds", "test", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value, "/a")
+
+    text = histogram.render()
+
+    assert _sample(text, "latency_seconds_bucket", route="/a", le="0.1") == 2
+    assert _sample(text, "latency_seconds_bucket", route="/a", le="1") == 3
+    assert _sample(text, "latency_seconds_bucket", route="/a", le="+Inf") == 4
+    assert _sample(text, "latency_seconds_count", route="/a") == 4
+    assert _sample(text, "latency_seconds_sum", route="/a") == 5.65
+
+
+def test_counts_from_many_threads_are_merged():
+    counter = Counter("work_total", "test", ("kind",))
+
+    def work():
+        for _ in range(1000):
+            counter.inc("job")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert _sample(counter.render(), "work_total", kind="job") == 8000
+
+
+def test_shards_of_exited_threads_are_folded():
+    counter = Counter("churn_total", "test")
+
+    for _ in range(10):  # a threadpool retiring and respawning its workers
+        threads = [threading.Thread(target=counter.inc) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert _sample(counter.render(), "churn_total") == 200
+    assert len(counter._shards) <= 21  # the base shard and at most one batch still exiting
+    counter.inc()  # a new thread folds whatever has exited since
+    assert len(counter._shards) <= 2
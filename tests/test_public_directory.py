@@ -0,0 +1,141 @@
+import gzip
+import json
+
+from models.member import MemberStatus
+from services.public_directory import PublicDirectory
+from tests.conftest import count_statements
+from utils.encoding import accepts_encoding
+
+
+def _directory(client, **headers):
+    response = client.get("/members/directory", headers=headers)
+    assert response.status_code == 200
+    return response
+
+
+def _names(response) -> list[str]:
+    return [member["name"] for member in response.json()["items"]]
+
+
+def test_directory_lists_only_approved_members(client, make_member):
+    approved = make_member()
+    make_member(status=MemberStatus.PENDING)
+
+    response = _directory(client)
+
+    assert _names(response) == [approved.name]
+    assert response.json()["items"][0]["skills"][0]["skill_name"] == "Python"
+
+
+def test_directory_is_served_from_memory(client, make_member):
+    make_member()
+    first = _directory(client)
+
+    with count_statements() as statements:
+        second = _directory(client)
+        not_modified = client.get(
+            "/members/directory", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+    assert statements == []
+    assert second.content == first.content
+    assert not_modified.status_code == 304
+
+
+def test_gzip_only_when_accepted(client, make_member):
+    make_member()
+
+    compressed = client.get("/members/directory", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/members/directory", headers={"Accept-Encoding": "identity"})
+
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in plain.headers
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert compressed.json() == plain.json()  # decoded by the client
+
+
+def test_writes_regenerate_the_snapshot(client, make_member, admin_headers):
+    pending = make_member(status=MemberStatus.PENDING)
+    approved = make_member()
+    etag = _directory(client).headers["ETag"]
+
+    client.post(f"/members/{pending.id}/approve", headers=admin_headers)
+    after_approve = _directory(client)
+    assert _names(after_approve) == [pending.name, approved.name]
+    assert after_approve.headers["ETag"] != etag
+
+    client.delete(f"/members/{approved.id}", headers=admin_headers)
+    assert _names(_directory(client)) == [pending.name]
+
+
+def test_writes_only_mark_the_snapshot_stale(client, make_member, admin_headers, monkeypatch):
+    pending = [make_member(status=MemberStatus.PENDING) for _ in range(2)]
+    _directory(client)
+    rebuilds = []
+    original = PublicDirectory.refresh
+
+    def counting_refresh(self, db):
+        rebuilds.append(1)
+        return original(self, db)
+
+    monkeypatch.setattr(PublicDirectory, "refresh", counting_refresh)
+    for member in pending:
+        client.post(f"/members/{member.id}/approve", headers=admin_headers)
+    assert rebuilds == []  # the write requests did not rebuild it
+
+    assert len(_names(_directory(client))) == 2
+    assert len(_names(_directory(client))) == 2
+    assert rebuilds == [1]  # one rebuild for both writes
+
+
+def test_noop_profile_update_keeps_the_snapshot(db, make_member):
+    from schemas.member import MemberUpdate
+    from services.member_service import MemberService
+
+    member = make_member()
+    directory = PublicDirectory()
+    service = MemberService(db, directory=directory)
+    snapshot = directory.refresh(db)
+
+    service.update_member(member.id, MemberUpdate(name=member.name, skills=[{"skill_name": "Python"}]))
+    assert directory.get() is snapshot
+
+    service.update_member(member.id, MemberUpdate(name="새이름"))
+    assert directory.get() is None
+
+
+def test_invalidation_during_a_rebuild_keeps_it_stale(db, make_member, monkeypatch):
+    from repositories.member_repository import MemberRepository
+
+    directory = PublicDirectory()
+    original = MemberRepository.get_members_by_status
+
+    def write_meanwhile(self, status):
+        directory.invalidate()  # a write commits while the rebuild reads
+        return original(self, status)
+
+    monkeypatch.setattr(MemberRepository, "get_members_by_status", write_meanwhile)
+    directory.refresh(db)
+
+    assert directory.get() is None
+
+
+def test_stale_snapshot_is_rebuilt(db, make_member):
+    now = [0.0]
+    directory = PublicDirectory(max_age_seconds=60, clock=lambda: now[0])
+    directory.refresh(db)
+    make_member()
+
+    assert json.loads(directory.get().body)["items"] == []
+    now[0] = 61.0
+    assert directory.get() is None
+    assert len(json.loads(gzip.decompress(directory.refresh(db).gzipped))["items"]) == 1
+
+
+def test_accepts_encoding():
+    assert accepts_encoding("gzip, deflate, br", "gzip")
+    assert accepts_encoding("br;q=1.0, GZIP;q=0.5", "gzip")
+    assert not accepts_encoding("gzip;q=0, br", "gzip")
+    assert accepts_encoding("*", "gzip")
+    assert not accepts_encoding("*;q=0", "gzip")
+    assert not accepts_encoding(None, "gzip")
@@ -0,0 +1,173 @@
+"""Query-plan regression tests.
+
+Every SELECT/UPDATE/DELETE the repositories send is re-run under
+``EXPLAIN QUERY PLAN`` (including the foreign-key lookups SQLite adds to deletes);
+a statement with a WHERE clause must not full-scan a table. Statements without
+a predicate (export, first page of the member list, counter rebuilds) read the
+whole table by design and are exempt.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from database import engine
+from models.email_outbox import EmailKind
+from models.member import MemberStatus
+from repositories import skill_dictionary
+from repositories.email_outbox_repository import EmailOutboxRepository
+from repositories.idempotency_repository import IdempotencyRepository
+from repositories.member_repository import MemberRepository
+from schemas.member import MemberImportRow, MemberUpdate, SortOrder
+
+_SCAN = re.compile(r"^SCAN (\w+)")
+# FTS5 answers MATCH (M) and rowid (=) constraints from its index; anything else reads every row
+_VIRTUAL_INDEX = re.compile(r"VIRTUAL TABLE INDEX \d+:\S*[M=]")
+
+
+def _plan(connection, statement: str, parameters) -> list[str]:
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [detail for _, _, _, detail in rows]
+
+
+def _full_scans(connection, statement: str, parameters) -> list[str]:
+    """Tables the plan reads with a full (index or table) scan"""
+    scans = []
+    for detail in _plan(connection, statement, parameters):
+        match = _SCAN.match(detail)
+        if not match or _VIRTUAL_INDEX.search(detail) or detail.startswith("SCAN CONSTANT ROW"):
+            continue
+        scans.append(match.group(1))
+    return scans
+
+
+@pytest.fixture
+def statements():
+    """Collect (statement, first parameter set) for everything sent to the database"""
+    captured: list[tuple[str, tuple]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if executemany and parameters and isinstance(parameters[0], (list, tuple)):
+            parameters = parameters[0]
+        captured.append((statement, tuple(parameters or ())))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _exercise_member_repository(db, make_member) -> None:
+    members = [make_member(status=MemberStatus.PENDING) for _ in range(3)]
+    repo = MemberRepository.create(db)
+    db.expire_all()  # load skills/links from the database again
+
+    repo.get_member_by_id(members[0].id)
+    repo.get_member_by_email(members[0].email)
+    repo.get_member_updated_at(members[0].id)
+    repo.get_change_version()
+    for status in (None, MemberStatus.PENDING):
+        for order in SortOrder:
+            _, next_key = repo.get_members_page(status, limit=1, order=order)
+            repo.get_members_page(status, limit=1, after=next_key, order=order)
+            _, next_key = repo.get_members_page(status, limit=1, order=order, skill="PYTHON")
+            repo.get_members_page(status, limit=1, after=next_key, order=order, skill="python")
+    repo.get_members_by_status(MemberStatus.APPROVED)  # public directory snapshot
+    skill_dictionary.get_entry(db, "Python")
+    skill_dictionary.list_entries(db, limit=10, prefix="py")
+    for status in (None, MemberStatus.PENDING):
+        repo.search_members("회원", status)  # short-term table
+        repo.search_members("회원 python 3", status)  # FTS5 MATCH + short terms
+    repo.update_member(
+        members[0],
+        MemberUpdate(
+            name="새 이름",
+            skills=[{"skill_name": "Rust"}],
+            links=[{"link_type": "blog", "url": "https://blog.example.com"}],
+        ),
+    )
+    summaries = repo.get_member_summaries([m.id for m in members])
+    repo.bulk_update_status([summaries[members[1].id]], MemberStatus.APPROVED)
+    repo.bulk_delete([summaries[members[2].id]])
+    repo.update_member_status(members[0], MemberStatus.APPROVED)
+    repo.get_existing_emails([members[0].email, "nobody@example.com"])
+    repo.get_skills_and_links([members[0].id])
+    repo.bulk_add_members(
+        [MemberImportRow(email="bulk@example.com", name="일괄", generation=41, rank="OB")]
+    )
+    repo.get_stats()
+    repo.reconcile_stats()
+    repo.delete_member(repo.get_member_by_id(members[0].id))
+
+
+def _exercise_outbox_repository(db) -> None:
+    outbox = EmailOutboxRepository.create(db)
+    for i in range(3):
+        outbox.enqueue(EmailKind.APPROVAL, f"member{i}@example.com", member_name="회원")
+    db.commit()
+
+    claimed = outbox.claim_due(limit=10, lease_seconds=60)
+    outbox.mark_sent(claimed[:1])
+    outbox.mark_failed(claimed[1], "boom", datetime.now(timezone.utc) + timedelta(seconds=5))
+    outbox.mark_failed(claimed[2], "boom", retry_at=None)
+    outbox.count_by_status()
+    outbox.requeue_dead()
+
+
+def _exercise_idempotency_repository(db) -> None:
+    repo = IdempotencyRepository.create(db)
+    repo.reserve("key-1", "f" * 64, lock_seconds=60)
+    repo.reserve("key-1", "f" * 64, lock_seconds=60)
+    repo.complete("key-1", 201, [["content-type", "application/json"]], b"{}", ttl_seconds=60)
+    repo.reserve("key-2", "f" * 64, lock_seconds=60)
+    repo.release("key-2")
+
+
+def _assert_no_unexpected_scans(statements) -> None:
+    assert statements
+    regressions = []
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            keyword = statement.split(None, 1)[0].upper()
+            if keyword not in ("SELECT", "UPDATE", "DELETE"):
+                continue
+            if " WHERE " not in f" {statement} ":
+                continue  # no predicate: reading everything is the point
+            for table in _full_scans(connection, statement, parameters):
+                regressions.append(f"SCAN {table}: {' '.join(statement.split())}")
+    assert not regressions, "\n".join(regressions)
+
+
+def test_member_repository_queries_use_indexes(db, make_member, statements):
+    _exercise_member_repository(db, make_member)
+    _assert_no_unexpected_scans(statements)
+
+
+def test_outbox_repository_queries_use_indexes(db, statements):
+    _exercise_outbox_repository(db)
+    _assert_no_unexpected_scans(statements)
+
+
+def test_idempotency_repository_queries_use_indexes(db, statements):
+    _exercise_idempotency_repository(db)
+    _assert_no_unexpected_scans(statements)
+
+
+def test_status_filtered_pages_seek_the_status_index(db, make_member, statements):
+    """GET /members?status=... reads only that status, already in (created_at, id) order"""
+    make_member()
+    repo = MemberRepository.create(db)
+    for order in SortOrder:
+        _, next_key = repo.get_members_page(MemberStatus.APPROVED, limit=1, order=order)
+        repo.get_members_page(MemberStatus.APPROVED, limit=1, after=next_key, order=order)
+
+    pages = [(st, params) for st, params in statements if "ORDER BY member.created_at" in st]
+    assert len(pages) == 4
+    with engine.connect() as connection:
+        for statement, parameters in pages:
+            plan = _plan(connection, statement, parameters)
+            assert plan[0].startswith("SEARCH member USING INDEX ix_member_status_created_at"), plan
+            assert not any("TEMP B-TREE" in detail for detail in plan), plan
@@ -0,0 +1,129 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from database import SessionLocal
+from models.member import MemberStatus
+from services.query_stats import HEADER, QueryStatsMiddleware, install_query_stats
+from utils.token import create_magic_link_token
+
+
+def _stats(response) -> dict[str, float]:
+    return {
+        key.strip(): float(value)
+        for key, value in (part.split("=") for part in response.headers[HEADER].split(";"))
+    }
+
+
+def test_debug_header_counts_each_request(client, make_member):
+    member = make_member()
+
+    cold = client.get(f"/members/{member.id}")
+    cached = client.get(f"/members/{member.id}")
+
+    assert _stats(cold)["count"] == 3  # member + selectin skills + selectin links
+    assert _stats(cold)["time_ms"] > 0
+    assert _stats(cached)["count"] == 0
+
+
+def test_repeated_statements_are_logged_as_n_plus_one(caplog):
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, repeat_threshold=3, header=True)
+
+    @app.get("/loop")
+    def loop():
+        with SessionLocal() as db:
+            for member_id in range(3):
+                db.execute(text("SELECT :id"), {"id": member_id})
+        return {}
+
+    with caplog.at_level(logging.WARNING, logger="services.query_stats"):
+        response = TestClient(app).get("/loop")
+
+    assert _stats(response) == {"count": 3, "time_ms": pytest.approx(0, abs=50), "repeated": 1}
+    assert "GET /loop ran the same statement 3 times" in caplog.text
+
+
+def test_slow_queries_are_logged(caplog):
+    slow_engine = create_engine("sqlite://")
+    install_query_stats(slow_engine, slow_query_ms=0)
+
+    with caplog.at_level(logging.WARNING, logger="services.query_stats"):
+        with slow_engine.connect() as connection:
+            connection.execute(text("SELECT 42"))
+
+    assert "Slow query" in caplog.text
+    assert "SELECT 42" in caplog.text
+
+
+def test_failed_statements_leave_no_timing_state(caplog):
+    engine = create_engine("sqlite://")
+    install_query_stats(engine, slow_query_ms=0)
+
+    with caplog.at_level(logging.WARNING, logger="services.query_stats"):
+        with engine.connect() as connection:
+            for _ in range(3):
+                with pytest.raises(Exception, match="no such table"):
+                    connection.execute(text("SELECT * FROM missing"))
+            connection.execute(text("SELECT 42"))
+            assert not any(key.startswith("query_stats") for key in connection.info)
+
+    assert "SELECT 42" in caplog.text
+    assert "missing" not in caplog.text
+
+
+def test_read_endpoint_query_budgets(client, make_member, admin_headers, query_budget):
+    ids = [make_member(skills=[{"skill_name": "Go"}, {"skill_name": "SQL"}]).id for _ in range(5)]
+    responses = []
+
+    with query_budget(3):
+        responses.append(client.get(f"/members/{ids[0]}"))
+    with query_budget(4):  # version, page, skills, links - not one query per member
+        responses.append(client.get("/members", params={"limit": 50}))
+    with query_budget(4):
+        responses.append(client.get("/members/search", params={"q": "회원"}, headers=admin_headers))
+    with query_budget(1):
+        responses.append(client.get("/members/stats", headers=admin_headers))
+    with query_budget(4):
+        responses.append(client.get("/members/directory"))
+    with query_budget(0):  # served from the snapshot
+        responses.append(client.get("/members/directory"))
+    with query_budget(1):
+        responses.append(client.get("/skills"))
+    with query_budget(5):
+        responses.append(client.get("/skills/go/members"))
+
+    # An early 4xx/5xx would pass any budget
+    assert [r.status_code for r in responses] == [200] * 8
+
+
+def test_write_endpoint_query_budgets(client, make_member, admin_headers, query_budget):
+    approved = make_member()
+    approved_id, token = approved.id, create_magic_link_token(approved.email, "profile_update")
+    pending_id = make_member(status=MemberStatus.PENDING).id
+
+    with query_budget(11):
+        registered = client.post(
+            "/members/register",
+            json={"email": "budget@example.com", "name": "예산", "generation": 41, "rank": "정회원"},
+        )
+    # token check (member, skills, links), reload, diffed skills, search rows,
+    # counters, UPDATE, response reload: nothing scales with the member's rows
+    with query_budget(18):
+        updated = client.put(
+            f"/members/{approved_id}",
+            params={"token": token},
+            json={"description": "새 소개", "skills": [{"skill_name": "Rust"}]},
+        )
+    with query_budget(9):
+        approved_response = client.post(f"/members/{pending_id}/approve", headers=admin_headers)
+    with query_budget(10):
+        deleted = client.delete(f"/members/{approved_id}", headers=admin_headers)
+
+    assert registered.status_code == 201
+    assert updated.status_code == 200
+    assert approved_response.status_code == 200
+    assert deleted.status_code == 204
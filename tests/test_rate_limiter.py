@@ -0,0 +1,86 @@
+import pytest
+
+from database import get_async_db
+from main import app
+from services.metrics import registry
+from services.rate_limiter import RateLimit, RateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_allows_a_burst_then_refills():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    limit = RateLimit.parse("3/60")  # one token every 20 s
+
+    assert [limiter.hit("register:ip", "1.2.3.4", limit) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.hit("register:ip", "1.2.3.4", limit) == pytest.approx(20)
+    assert limiter.hit("register:ip", "5.6.7.8", limit) == 0.0  # other keys are unaffected
+
+    clock.now += 15
+    assert limiter.hit("register:ip", "1.2.3.4", limit) == pytest.approx(5)
+    clock.now += 5
+    assert limiter.hit("register:ip", "1.2.3.4", limit) == 0.0
+
+
+def test_refilled_buckets_are_swept():
+    clock = FakeClock()
+    limiter = RateLimiter(shards=4, sweep_interval_seconds=10, clock=clock)
+    limit = RateLimit.parse("2/10")
+    for n in range(50):
+        limiter.hit("register:email", f"user{n}@example.com", limit)
+    assert len(limiter) == 50
+
+    clock.now += 11  # every bucket is full again
+    for n in range(4 * 50):  # touch every shard
+        limiter.hit("register:email", f"late{n}@example.com", limit)
+
+    assert len(limiter) == 4 * 50
+
+
+@pytest.mark.parametrize("text", ["5", "five/60", "0/60", "5/0"])
+def test_invalid_limits_are_rejected(text):
+    with pytest.raises(ValueError):
+        RateLimit.parse(text)
+
+
+def test_register_is_limited_per_email_before_opening_a_session(client):
+    sessions = []
+
+    async def counting_db():
+        sessions.append(1)
+        async for db in get_async_db():
+            yield db
+
+    body = {"email": "Flood@Example.com", "name": "도배", "generation": 41, "rank": "정회원"}
+    app.dependency_overrides[get_async_db] = counting_db
+    try:
+        statuses = [client.post("/members/register", json=body).status_code for _ in range(3)]
+        limited = client.post(
+            "/members/register", json={**body, "email": "flood@example.com"}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert statuses == [201, 400, 400]  # 3/3600 per email; duplicates still count
+    assert limited.status_code == 429
+    assert int(limited.headers["Retry-After"]) > 0
+    assert len(sessions) == 3
+    assert 'rate_limited_requests_total{route="register",key="email"} 1' in registry.render()
+
+
+def test_profile_update_link_is_limited_per_ip(client):
+    responses = [
+        client.post("/auth/magic-link/profile-update", json={"email": f"user{n}@example.com"})
+        for n in range(21)
+    ]
+
+    assert [r.status_code for r in responses[:20]] == [400] * 20  # unknown members
+    assert responses[20].status_code == 429
+    assert "Retry-After" in responses[20].headers
@@ -0,0 +1,75 @@
+from repositories import skill_dictionary
+from repositories.member_repository import MemberRepository
+from schemas.member import MemberUpdate
+from tests.conftest import count_statements
+
+
+def _counts(client) -> dict[str, int]:
+    return {item["name"]: item["member_count"] for item in client.get("/skills").json()["items"]}
+
+
+def test_skills_are_counted_once_per_member_across_spellings(client, make_member):
+    make_member(skills=[{"skill_name": "Rust"}, {"skill_name": "  rust "}])
+    make_member(skills=[{"skill_name": "RUST"}, {"skill_name": "Machine  Learning"}])
+    make_member(skills=[{"skill_name": "Python"}])
+
+    items = client.get("/skills").json()["items"]
+
+    assert items[0] == {"name": "rust", "label": "Rust", "member_count": 2}
+    assert _counts(client) == {"rust": 2, "machine learning": 1, "python": 1}
+    prefixed = client.get("/skills", params={"prefix": "MA"}).json()["items"]
+    assert [item["label"] for item in prefixed] == ["Machine Learning"]
+
+
+def test_counts_follow_updates_and_deletes(client, db, make_member, admin_headers):
+    first = make_member(skills=[{"skill_name": "Go"}, {"skill_name": "SQL"}])
+    second = make_member(skills=[{"skill_name": "go"}])
+    third = make_member(skills=[{"skill_name": "SQL"}, {"skill_name": "Rust"}])
+    repo = MemberRepository.create(db)
+
+    repo.update_member(first, MemberUpdate(skills=[{"skill_name": "GO"}, {"skill_name": "Rust"}]))
+    assert _counts(client) == {"go": 2, "rust": 2, "sql": 1}
+
+    client.delete(f"/members/{second.id}", headers=admin_headers)
+    client.post("/members/batch/delete", json={"ids": [third.id]}, headers=admin_headers)
+    assert _counts(client) == {"go": 1, "rust": 1}
+
+    before = _counts(client)
+    repo.reconcile_stats()
+    assert _counts(client) == before
+
+
+def test_skill_members_lookup_ignores_case(client, make_member):
+    rustaceans = [make_member(skills=[{"skill_name": name}]).id for name in ("Rust", "rust", "RUST ")]
+    make_member(skills=[{"skill_name": "Python"}])
+
+    first = client.get("/skills/rust/members", params={"limit": 2})
+    second = client.get(
+        "/skills/Rust/members", params={"limit": 2, "cursor": first.json()["next_cursor"]}
+    )
+
+    assert first.status_code == 200
+    ids = [m["id"] for m in first.json()["items"] + second.json()["items"]]
+    assert ids == rustaceans
+    assert second.json()["next_cursor"] is None
+    cached = client.get(
+        "/skills/rust/members", params={"limit": 2}, headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert cached.status_code == 304
+
+
+def test_unknown_skill_is_404(client, make_member):
+    make_member(skills=[{"skill_name": "Python"}])
+
+    assert client.get("/skills/cobol/members").status_code == 404
+
+
+def test_listing_skills_reads_only_the_dictionary(client, db, make_member):
+    for _ in range(3):
+        make_member(skills=[{"skill_name": "Python"}, {"skill_name": "SQL"}])
+
+    with count_statements() as statements:
+        client.get("/skills")
+
+    assert statements == ["SELECT"]
+    assert [entry.name for entry in skill_dictionary.list_entries(db, limit=1)] == ["python"]
@@ -0,0 +1,161 @@
+"""
+Negotiated response compression (brotli or gzip).
+
+Like Starlette's GZipMiddleware with brotli added, written against the plain
+ASGI send interface only: ``br`` is preferred when the client accepts it and
+the ``brotli`` package is installed (the ``brotli`` extra, which the Docker
+image includes), then ``gzip``. Bodies smaller than ``minimum_size`` bytes,
+partial (206) and streaming event responses, and responses that already carry
+a Content-Encoding (e.g. the precompressed public directory) are sent
+unchanged.
+"""
+
+import zlib
+from collections.abc import Callable
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from utils.encoding import accepts_encoding
+
+try:
+    import brotli
+except ImportError:  # optional (pip install .[brotli]): gzip only
+    brotli = None
+
+UNCOMPRESSED_MEDIA_TYPES = ("text/event-stream",)
+
+
+class Encoder(Protocol):
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        """Compress a chunk; ``final`` ends the stream, otherwise the output is flushed"""
+        ...
+
+
+class GzipEncoder:
+    def __init__(self, level: int = 6) -> None:
+        # wbits 31: gzip container (header with mtime 0, CRC trailer)
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        compressed = self._compressor.compress(data)
+        return compressed + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int = 4) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        compressed = self._compressor.process(data)
+        return compressed + (self._compressor.finish() if final else self._compressor.flush())
+
+
+class CompressionResponder:
+    """
+    Wraps ``send`` for one request: holds back ``http.response.start`` until the
+    first body chunk shows whether the response is worth compressing.
+
+    ``encoding``/``make_encoder`` of None: the client accepts neither, the body
+    is sent as-is (with ``Vary: Accept-Encoding`` when it could have been).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        encoding: str | None = None,
+        make_encoder: Callable[[], Encoder] | None = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoding = encoding
+        self.make_encoder = make_encoder
+        self.send: Send | None = None
+        self.start_message: Message | None = None
+        self.passthrough = False
+        self.encoder: Encoder | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] == 206
+                or media_type in UNCOMPRESSED_MEDIA_TYPES
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start_message = message
+            return
+        if message_type != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start_message is None:
+            # Later chunk of a compressed stream
+            if self.encoder is not None:
+                message["body"] = self.encoder.compress(body, final=not more_body)
+            await self.send(message)
+            return
+
+        start, self.start_message = self.start_message, None
+        if not more_body and len(body) < self.minimum_size:
+            await self.send(start)
+            await self.send(message)
+            return
+
+        headers = MutableHeaders(raw=start["headers"])
+        headers.add_vary_header("Accept-Encoding")
+        if self.make_encoder is not None:
+            self.encoder = self.make_encoder()
+            message["body"] = self.encoder.compress(body, final=not more_body)
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(message["body"]))
+        await self.send(start)
+        await self.send(message)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("Accept-Encoding")
+        if brotli is not None and accepts_encoding(accept_encoding, "br"):
+            responder = CompressionResponder(
+                self.app, self.minimum_size, "br", lambda: BrotliEncoder(self.brotli_quality)
+            )
+        elif accepts_encoding(accept_encoding, "gzip"):
+            responder = CompressionResponder(
+                self.app, self.minimum_size, "gzip", lambda: GzipEncoder(self.gzip_level)
+            )
+        else:
+            responder = CompressionResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
@@ -0,0 +1,26 @@
+import base64
+import json
+from datetime import datetime
+
+from exceptions import InvalidCursorError
+
+
+def encode_cursor(created_at: datetime, member_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque URL-safe cursor"""
+    payload = json.dumps({"c": created_at.isoformat(), "i": member_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor created by encode_cursor.
+
+    Raises:
+        InvalidCursorError: 형식이 잘못되었거나 변조된 커서인 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
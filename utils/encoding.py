@@ -0,0 +1,25 @@
+def accepts_encoding(accept_encoding: str | None, coding: str) -> bool:
+    """
+    Check whether an Accept-Encoding header allows ``coding`` (e.g. "gzip").
+
+    ``q=0`` refuses a coding; ``*`` covers codings that are not listed.
+    """
+    if not accept_encoding:
+        return False
+    wildcard = False
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name == coding:
+            return quality > 0
+        if name == "*":
+            wildcard = quality > 0
+    return wildcard
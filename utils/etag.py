@@ -0,0 +1,28 @@
+import hashlib
+from datetime import datetime
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong ETag (quoted) from the values that identify a representation"""
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def member_etag(member_id: int, updated_at: datetime) -> str:
+    """ETag for a single member representation"""
+    return make_etag("member", member_id, updated_at.isoformat())
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    If-None-Match uses weak comparison (RFC 9110 13.1.2), so a ``W/`` prefix
+    sent by a client or proxy is ignored.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
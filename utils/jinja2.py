@@ -4,12 +4,16 @@ from pathlib import Path
 from jinja2 import (
     Environment,
     FileSystemLoader,
+    Template,
     TemplateError,
     TemplateNotFound,
     UndefinedError,
+    nodes,
     select_autoescape,
 )
 
+from config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +28,98 @@ _template_env = Environment(
     autoescape=select_autoescape(["html", "xml"]),
 )
 
+BASE_TEMPLATE = "base.html"
+_CONTENT_BLOCK = "content"
+_SPLIT_MARKER = "\x00content\x00"
+
+
+class PrecompiledTemplates:
+    """
+    운영용 렌더러: 템플릿을 한 번만 컴파일하고 파일 변경 확인을 하지 않음
+
+    - auto_reload=False, 시작 시 compile_all()로 모든 템플릿을 한 번 컴파일
+    - base.html의 정적인 앞/뒤 부분은 미리 렌더링해 두고, base.html을 상속하고
+      content 블록만 정의한 템플릿은 content 블록만 렌더링해서 이어 붙임
+
+    출력은 _template_env로 렌더링한 결과와 바이트 단위로 같습니다.
+    """
+
+    def __init__(self, template_dir: Path = _template_dir):
+        self.env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=select_autoescape(["html", "xml"]),
+            auto_reload=False,
+        )
+        self._templates: dict[str, Template] = {}
+        # name -> True if it can use the pre-rendered base layout
+        self._uses_layout: dict[str, bool] = {}
+        self._layout: tuple[str, str] | None = None
+
+    def compile_all(self) -> int:
+        """Compile every template up front (startup). Returns the number compiled."""
+        names = self.env.list_templates(extensions=["html"])
+        for name in names:
+            self._load(name)
+        return len(names)
+
+    def _load(self, name: str) -> Template:
+        template = self._templates.get(name)
+        if template is not None:
+            return template
+
+        template = self.env.get_template(name)
+        self._templates[name] = template
+        self._uses_layout[name] = name != BASE_TEMPLATE and self._extends_base_with_content_only(name)
+        if self._uses_layout[name] and self._layout is None:
+            self._layout = self._render_layout()
+        return template
+
+    def _extends_base_with_content_only(self, name: str) -> bool:
+        source, _, _ = self.env.loader.get_source(self.env, name)
+        ast = self.env.parse(source)
+        extends = list(ast.find_all(nodes.Extends))
+        return (
+            len(extends) == 1
+            and isinstance(extends[0].template, nodes.Const)
+            and extends[0].template.value == BASE_TEMPLATE
+            and set(self._templates[name].blocks) == {_CONTENT_BLOCK}
+        )
+
+    def _render_layout(self) -> tuple[str, str]:
+        """Render base.html once around a marker and split it into (before, after)"""
+        marker_template = self.env.from_string(
+            f'{{% extends "{BASE_TEMPLATE}" %}}{{% block {_CONTENT_BLOCK} %}}{_SPLIT_MARKER}{{% endblock %}}'
+        )
+        before, after = marker_template.render().split(_SPLIT_MARKER)
+        return before, after
+
+    def render(self, name: str, **context) -> str:
+        template = self._load(name)
+        if not self._uses_layout[name]:
+            return template.render(**context)
+
+        before, after = self._layout
+        block = template.blocks[_CONTENT_BLOCK]
+        return before + "".join(block(template.new_context(context))) + after
+
+
+def _precompiled_enabled() -> bool:
+    if settings.email_templates_precompiled is not None:
+        return settings.email_templates_precompiled
+    return settings.app_env.lower() == "production"
+
+
+_precompiled: PrecompiledTemplates | None = PrecompiledTemplates() if _precompiled_enabled() else None
+
+
+def precompile_templates() -> int:
+    """운영 모드일 때 모든 이메일 템플릿을 미리 컴파일 (main.lifespan에서 호출)"""
+    if _precompiled is None:
+        return 0
+    count = _precompiled.compile_all()
+    logger.info(f"Precompiled {count} email templates")
+    return count
+
 
 def render_template(template_name: str, **context) -> str:
     """
@@ -41,6 +137,8 @@ def render_template(template_name: str, **context) -> str:
             (TemplateNotFound, UndefinedError, TemplateError 등을 감싸서 재발생)
     """
     try:
+        if _precompiled is not None:
+            return _precompiled.render(template_name, **context)
         template = _template_env.get_template(template_name)
         return template.render(**context)
     except TemplateNotFound as e:
@@ -51,4 +149,4 @@ def render_template(template_name: str, **context) -> str:
         raise TemplateRenderError(f"Missing variable in template '{template_name}': {e}") from e
     except TemplateError as e:
         logger.error(f"Template rendering error in '{template_name}': {e}")
-        raise TemplateRenderError(f"Failed to render template '{template_name}': {e}") from e
\ No newline at end of file
+        raise TemplateRenderError(f"Failed to render template '{template_name}': {e}") from e
@@ -0,0 +1,221 @@
+"""
+Minimal Prometheus metrics (text exposition format 0.0.4).
+
+Recording is lock-free on the hot path: every thread writes to its own shard
+(a dict of label values -> cells, found through ``threading.local``), so
+request handlers, threadpool workers and the email dispatcher never contend.
+A lock is taken only the first time a thread touches a metric and when
+``/metrics`` is scraped, which merges the shards. When a thread exits (AnyIO
+retires idle threadpool workers) its shard is folded into a base shard, so
+the number of shards follows the number of live threads.
+"""
+
+import bisect
+import math
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Sequence
+from typing import TypeVar
+
+LabelValues = tuple[str, ...]
+
+M = TypeVar("M", bound="_Metric")
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _add_into(total: dict[LabelValues, list[float]], shard: dict[LabelValues, list[float]]) -> None:
+    for labels, cell in list(shard.items()):
+        into = total.setdefault(labels, [0.0] * len(cell))
+        for i, value in enumerate(cell):
+            into[i] += value
+
+
+class _ShardOwner:
+    """Kept in the thread-local next to the shard; collected when the thread exits"""
+
+    __slots__ = ("__weakref__",)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._base: dict[LabelValues, list[float]] = {}  # exited threads, folded together
+        self._shards: list[dict[LabelValues, list[float]]] = [self._base]
+        # Shards of exited threads, appended by finalizers (which must not take the lock)
+        self._retired: list[dict[LabelValues, list[float]]] = []
+        self._lock = threading.Lock()
+
+    def _new_cell(self) -> list[float]:
+        return [0.0]
+
+    def _cell(self, labels: LabelValues) -> list[float]:
+        """This thread's cell for ``labels`` (created on first use)"""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            owner = self._local.owner = _ShardOwner()
+            weakref.finalize(owner, self._retired.append, shard).atexit = False
+            with self._lock:
+                self._fold_retired()
+                self._shards.append(shard)
+        cell = shard.get(labels)
+        if cell is None:
+            cell = shard[labels] = self._new_cell()
+        return cell
+
+    def _fold_retired(self) -> None:
+        """Move the shards of exited threads into the base shard (the lock is held)"""
+        if not self._retired:
+            return
+        retired = {}
+        while self._retired:
+            shard = self._retired.pop()
+            retired[id(shard)] = shard
+        for shard in retired.values():
+            _add_into(self._base, shard)
+        self._shards = [shard for shard in self._shards if id(shard) not in retired]
+
+    def _merged(self) -> dict[LabelValues, list[float]]:
+        merged: dict[LabelValues, list[float]] = {}
+        with self._lock:
+            self._fold_retired()
+            for shard in self._shards:
+                _add_into(merged, shard)
+        return merged
+
+    def _samples(self) -> Iterable[str]:
+        for labels, cell in sorted(self._merged().items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(cell[0])}"
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fold_retired()
+            for shard in self._shards:
+                shard.clear()
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._cell(labels)[0] += amount
+
+
+class Gauge(_Metric):
+    """Gauge changed with inc/dec (the value is the sum over threads)"""
+
+    type_name = "gauge"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._cell(labels)[0] += amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self._cell(labels)[0] -= amount
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_cell(self) -> list[float]:
+        # one slot per bucket (non-cumulative), then +Inf, sum
+        return [0.0] * (len(self.buckets) + 2)
+
+    def observe(self, value: float, *labels: str) -> None:
+        cell = self._cell(labels)
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+    def _samples(self) -> Iterable[str]:
+        names = (*self.labelnames, "le")
+        for labels, cell in sorted(self._merged().items()):
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, math.inf), cell):
+                cumulative += count
+                bucket_labels = _format_labels(names, (*labels, _format_value(bound)))
+                yield f"{self.name}_bucket{bucket_labels} {_format_value(cumulative)}"
+            label_text = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_text} {_format_value(cell[-1])}"
+            yield f"{self.name}_count{label_text} {_format_value(cumulative)}"
+
+
+class CallbackGauge(_Metric):
+    """Gauge read from ``callback`` at scrape time ({label values: value})"""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], dict[LabelValues, float]],
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def _merged(self) -> dict[LabelValues, list[float]]:
+        return {labels: [value] for labels, value in self.callback().items()}
+
+
+class CallbackCounter(CallbackGauge):
+    """Monotonic total read from ``callback`` at scrape time"""
+
+    type_name = "counter"
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric: M) -> M:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """All metrics in Prometheus text format"""
+        return "\n".join(metric.render() for metric in self._metrics) + "\n"
+
+    def clear(self) -> None:
+        for metric in self._metrics:
+            metric.clear()
@@ -0,0 +1,19 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response serialized by pydantic-core in one pass.
+
+    Return it from a route (``return PydanticJSONResponse(page)``) to skip
+    FastAPI's response_model re-validation, ``jsonable_encoder`` and
+    ``json.dumps``: models, lists of models and plain data are written
+    straight to UTF-8 bytes. Keep ``response_model`` on the route for the
+    OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)